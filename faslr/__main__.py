@@ -6,8 +6,6 @@ import os
 import platform
 import sys
 
-from faslr.analysis import AnalysisTab
-
 from faslr.connection import (
     populate_project_tree
 )
@@ -15,7 +13,8 @@ from faslr.connection import (
 from faslr.constants import (
     CONFIG_PATH,
     ROOT_PATH,
-    CONFIG_TEMPLATES_PATH
+    CONFIG_TEMPLATES_PATH,
+    SAMPLE_TRIANGLES
 )
 
 import faslr.core as core
@@ -59,9 +58,9 @@ from PyQt6.QtWidgets import (
     QWidget
 )
 
-from shutil import copyfile
+from faslr.utilities.gui import open_item_tab
 
-from faslr.utilities.sample import load_sample
+from shutil import copyfile
 
 
 class MainWindow(QMainWindow):
@@ -115,25 +114,13 @@ class MainWindow(QMainWindow):
         splitter = QSplitter(orientation=Qt.Orientation.Horizontal)
         splitter.addWidget(self.project_pane)
 
-        # Triangle placeholder
-
-        self.auto_triangle = load_sample('us_industry_auto')
-        self.xyz_triangle = load_sample('uspp_incr_case')
-
         QGuiApplication.styleHints().colorSchemeChanged.connect(self.set_background_color)
-        self.auto_tab = AnalysisTab(
-            triangle=self.auto_triangle
-        )
-        self.xyz_tab = AnalysisTab(
-            triangle=self.xyz_triangle
-        )
 
+        # The analysis pane starts empty. Sample triangles are opened from the Help menu, see open_sample_triangles.
         self.analysis_pane = QTabWidget()
 
         self.analysis_pane.setTabsClosable(True)
         self.analysis_pane.setMovable(True)
-        self.analysis_pane.addTab(self.auto_tab, "Auto")
-        self.analysis_pane.addTab(self.xyz_tab, "XYZ")
 
         # noinspection PyUnresolvedReferences
         self.analysis_pane.tabCloseRequested.connect(self.remove_tab)
@@ -165,8 +152,6 @@ class MainWindow(QMainWindow):
                 main_window=self
             )
 
-
-
     def set_background_color(self, scheme: Qt.ColorScheme) -> None:
         QApplication.setPalette(QApplication.style().standardPalette())
 
@@ -178,6 +163,22 @@ class MainWindow(QMainWindow):
         palette.setColor(self.backgroundRole(), color)
         self.setPalette(palette)
 
+    def open_sample_triangles(self) -> None:
+        """
+        Opens each of the sample triangles in a new analysis tab.
+        """
+
+        # Imported when first needed rather than at startup, as they import chainladder.
+        from faslr.analysis import AnalysisTab
+        from faslr.utilities.sample import load_sample
+
+        for title, sample in SAMPLE_TRIANGLES.items():
+            open_item_tab(
+                title=title,
+                tab_widget=self.analysis_pane,
+                item_widget=AnalysisTab(triangle=load_sample(sample))
+            )
+
     def remove_tab(
             self,
             index: int
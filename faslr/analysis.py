@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from chainladder import Triangle
 
 from faslr.base_table import (
@@ -17,6 +19,8 @@ from faslr.style.analysis import (
     qss_column_tab
 )
 
+from faslr.common.worker import FWorker
+
 from faslr.utilities.accessors import get_column
 
 from PyQt6.QtCore import (
@@ -46,6 +50,11 @@ from faslr.triangle_model import (
     TriangleView
 )
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pandas import DataFrame
+
 pass_alias = {
     True: "Fail",
     False: "Pass"
@@ -57,16 +66,98 @@ starting_value_lookup = {
 }
 
 
+class MackTestResults:
+    """
+    Results of the Mack tests of a triangle column, calculated once per test and critical value, so that returning
+    to a critical value, or rebuilding the diagnostics, does not repeat the test.
+
+    The test types are "valuation correlation" and "development correlation", whose results are the pass/fail flags
+    of all years combined, and "individual valuation correlation", whose result is a DataFrame of the flags of each
+    year.
+
+    Parameters
+    ----------
+    triangle: Triangle
+        A single column of a triangle.
+    """
+    def __init__(
+            self,
+            triangle: Triangle
+    ):
+
+        self.triangle = triangle
+        self.results = {}
+
+    def calculate(
+            self,
+            test_type: str,
+            critical: float
+    ) -> bool | DataFrame:
+        """
+        Returns the result of a test at a critical value, running the test if it has not been run before.
+        """
+
+        key = (test_type, critical)
+
+        if key in self.results:
+            return self.results[key]
+
+        if test_type == "valuation correlation":
+            result = self.triangle.valuation_correlation(
+                p_critical=critical,
+                total=True
+            ).z_critical.values[0][0]
+
+        elif test_type == "development correlation":
+            result = self.triangle.development_correlation(
+                p_critical=critical
+            ).t_critical.values[0][0]
+
+        elif test_type == "individual valuation correlation":
+            result = self.triangle.valuation_correlation(
+                p_critical=critical,
+                total=False
+            ).z_critical.to_frame(
+                origin_as_datetime=False
+            )
+
+            result = result.rename(index={min(result.index): 'Status'})
+
+        else:
+            raise ValueError("Invalid test-type indicated.")
+
+        self.results[key] = result
+
+        return result
+
+    def calculate_defaults(self) -> None:
+        """
+        Runs each test at its starting critical value, i.e., the results shown when the diagnostics are first built.
+        """
+
+        for test_type, critical in [
+            ("valuation correlation", MACK_VALUATION_CRITICAL),
+            ("individual valuation correlation", MACK_VALUATION_CRITICAL),
+            ("development correlation", MACK_DEVELOPMENT_CRITICAL)
+        ]:
+            self.calculate(
+                test_type=test_type,
+                critical=critical
+            )
+
+
 class AnalysisTab(QWidget):
     # should eventually contain the TriangleColumnTab
     def __init__(
             self, triangle: Triangle,
-            lob: str = None
+            lob: str = None,
+            view: int = None
     ):
         super().__init__()
 
         self.triangle = triangle
         self.lob = lob
+        self.view = view
         self.theme = QGuiApplication.styleHints().colorScheme()
 
         self.layout = QVBoxLayout()
@@ -89,11 +180,37 @@ class AnalysisTab(QWidget):
         self.diagnostic_containers = {}
         self.diagnostic_widgets = {}
 
+        # The Mack test results of each column, and the workers calculating them.
+        self.mack_results = {}
+        self.diagnostic_workers = {}
+
         # 1 set of groupboxes for each of the Mack tests
         self.mack_valuation_groupboxes = {}
         self.mack_development_groupboxes = {}
         self.mack_valuation_individual_groupboxes = {}
 
+        self.set_tab_borders()
+
+        # For each chainladder column, we create a horizontal tab to the left.
+        for i in self.column_list:
+            self.add_column(column=i)
+
+        self.layout.addWidget(
+            self.value_box,
+            alignment=Qt.AlignmentFlag.AlignRight
+        )
+        self.layout.addWidget(self.column_tab)
+
+        self.setLayout(self.layout)
+
+        self.setAutoFillBackground(True)
+        self.apply_theme(scheme=self.theme)
+
+        self.value_box.currentTextChanged.connect(self.update_value_type) # noqa
+        QGuiApplication.styleHints().colorSchemeChanged.connect(self.apply_theme)
+
+    def set_tab_borders(self) -> None:
+
         column_count = len(self.column_list)
 
         # Used to solve some issues with borders not appearing when there's only 1 tab.
@@ -104,83 +221,248 @@ class AnalysisTab(QWidget):
             self.bottom_border_width = "0"
             self.margin_top = "0"
 
-        # For each chainladder column, we create a horizontal tab to the left.
-        for i in self.column_list:
+    def add_column(
+            self,
+            column: str
+    ) -> None:
+        """
+        Adds the tab for a triangle column. The diagnostics are left out until they are first shown,
+        see build_diagnostics.
+        """
+
+        triangle_column = get_column(
+            triangle=self.triangle,
+            column=column,
+            lob=self.lob,
+            view=self.view
+        )
 
-            triangle_column = get_column(
-                triangle=self.triangle,
-                column=i,
-                lob=self.lob
-            )
+        self.triangle_views[column] = TriangleView()
+        # We use QStackedWidget to switch between tabular and diagnostic views.
+        self.analysis_containers[column] = QStackedWidget()
+        self.analysis_containers[column].addWidget(self.triangle_views[column])
 
-            self.triangle_views[i] = TriangleView()
-            # We use QStackedWidget to switch between tabular and diagnostic views.
-            self.analysis_containers[i] = QStackedWidget()
-            self.analysis_containers[i].addWidget(self.triangle_views[i])
-            self.diagnostic_containers[i] = QVBoxLayout()
-            self.diagnostic_containers[i].setSpacing(30)
-
-            self.mack_valuation_groupboxes[i] = MackAllYearGroupBox(
-                title="Mack Valuation Correlation Test - All Years",
-                triangle=triangle_column,
-                test_type="valuation correlation"
-            )
-            self.diagnostic_containers[i].addWidget(self.mack_valuation_groupboxes[i])
+        triangle_model = TriangleModel(triangle_column, 'value')
+        self.triangle_views[column].setModel(triangle_model)
 
-            self.mack_valuation_individual_groupboxes[i] = MackIndividualGroupBox(
-                title="Mack Valuation Correlation Test - Individual Years",
-                triangle=triangle_column
+        self.column_tab.addTab(self.analysis_containers[column], column)
+
+    def build_diagnostics(
+            self,
+            column: str
+    ) -> None:
+        """
+        Shows the diagnostics of a triangle column, if they have not been built already. The Mack tests are run on
+        the global thread pool while a placeholder is shown, and the group boxes are filled in by fill_diagnostics
+        once the results are ready.
+        """
+
+        if column in self.diagnostic_widgets:
+            return
+
+        if column not in self.mack_results:
+            self.mack_results[column] = MackTestResults(
+                triangle=get_column(
+                    triangle=self.triangle,
+                    column=column,
+                    lob=self.lob,
+                    view=self.view
+                )
             )
 
-            self.diagnostic_containers[i].addWidget(self.mack_valuation_individual_groupboxes[i])
+        # The message left by a calculation that failed is replaced.
+        failed_widget = self.analysis_containers[column].widget(1)
 
-            self.mack_development_groupboxes[i] = MackAllYearGroupBox(
-                title="Mack Development Correlation Test",
-                triangle=triangle_column,
-                test_type="development correlation"
-            )
+        if failed_widget is not None:
+            self.analysis_containers[column].removeWidget(failed_widget)
+            failed_widget.deleteLater()
 
-            self.diagnostic_containers[i].addWidget(
-                self.mack_development_groupboxes[i],
-                stretch=0
-            )
+        self.diagnostic_containers[column] = QVBoxLayout()
+        self.diagnostic_containers[column].setSpacing(30)
 
-            self.diagnostic_containers[i].addWidget(
-                QWidget(),
-                stretch=2
-            )
+        self.diagnostic_containers[column].addWidget(
+            QLabel("Calculating diagnostics..."),
+            alignment=Qt.AlignmentFlag.AlignTop
+        )
 
-            self.mack_development_view = MackValuationView()
+        self.diagnostic_widgets[column] = DiagnosticWidget()
 
-            self.diagnostic_widgets[i] = DiagnosticWidget()
+        self.diagnostic_widgets[column].setLayout(self.diagnostic_containers[column])
+        self.analysis_containers[column].addWidget(self.diagnostic_widgets[column])
 
-            self.diagnostic_widgets[i].setLayout(self.diagnostic_containers[i])
-            self.analysis_containers[i].addWidget(self.diagnostic_widgets[i])
+        worker = FWorker(
+            self.calculate_diagnostics,
+            column,
+            self.mack_results[column]
+        )
 
-            triangle_model = TriangleModel(triangle_column, 'value')
-            self.triangle_views[i].setModel(triangle_model)
+        worker.signals.result.connect(self.fill_diagnostics)  # noqa
+        worker.signals.error.connect(self.diagnostics_failed)  # noqa
 
-            self.column_tab.addTab(self.analysis_containers[i], i)
+        self.diagnostic_workers[column] = worker
 
-        self.layout.addWidget(
-            self.value_box,
-            alignment=Qt.AlignmentFlag.AlignRight
+        worker.start()
+
+    @staticmethod
+    def calculate_diagnostics(
+            column: str,
+            results: MackTestResults,
+            progress_callback=None,
+            is_cancelled=None
+    ) -> tuple:
+        """
+        Runs the Mack tests of a column at their starting critical values. Runs on a worker thread.
+        """
+
+        results.calculate_defaults()
+
+        return column, results
+
+    def fill_diagnostics(
+            self,
+            outcome: tuple
+    ) -> None:
+        """
+        Replaces the placeholder of a column's diagnostics with the Mack diagnostic group boxes, which read their
+        results from the column's MackTestResults. Results of a triangle that has since been replaced are ignored.
+        """
+
+        column, results = outcome
+
+        if (self.mack_results.get(column) is not results) or (column not in self.diagnostic_containers):
+            return
+
+        self.diagnostic_workers.pop(column, None)
+
+        layout = self.diagnostic_containers[column]
+
+        placeholder = layout.takeAt(0).widget()
+        placeholder.deleteLater()
+
+        self.mack_valuation_groupboxes[column] = MackAllYearGroupBox(
+            title="Mack Valuation Correlation Test - All Years",
+            triangle=results.triangle,
+            test_type="valuation correlation",
+            results=results
         )
-        self.layout.addWidget(self.column_tab)
+        layout.addWidget(self.mack_valuation_groupboxes[column])
 
-        self.setLayout(self.layout)
+        self.mack_valuation_individual_groupboxes[column] = MackIndividualGroupBox(
+            title="Mack Valuation Correlation Test - Individual Years",
+            triangle=results.triangle,
+            results=results
+        )
 
-        self.setAutoFillBackground(True)
-        self.apply_theme(scheme=self.theme)
+        layout.addWidget(self.mack_valuation_individual_groupboxes[column])
 
-        self.value_box.currentTextChanged.connect(self.update_value_type) # noqa
-        QGuiApplication.styleHints().colorSchemeChanged.connect(self.apply_theme)
+        self.mack_development_groupboxes[column] = MackAllYearGroupBox(
+            title="Mack Development Correlation Test",
+            triangle=results.triangle,
+            test_type="development correlation",
+            results=results
+        )
+
+        layout.addWidget(
+            self.mack_development_groupboxes[column],
+            stretch=0
+        )
+
+        layout.addWidget(
+            QWidget(),
+            stretch=2
+        )
+
+        self.mack_development_view = MackValuationView()
+
+        self.resize_diagnostics()
+
+    def diagnostics_failed(
+            self,
+            error: Exception
+    ) -> None:
+        """
+        Replaces the placeholder of a column's diagnostics with the error raised while calculating them. The column is
+        forgotten, so that the calculation is tried again the next time the diagnostics are shown.
+        """
+
+        signals = self.sender()
+
+        column = next(
+            (column for column, worker in self.diagnostic_workers.items() if worker.signals is signals),
+            None
+        )
+
+        # Errors of a triangle that has since been replaced are ignored.
+        if column is None:
+            return
+
+        del self.diagnostic_workers[column]
+        del self.diagnostic_widgets[column]
+
+        layout = self.diagnostic_containers.pop(column)
+
+        layout.itemAt(0).widget().setText("The diagnostics could not be calculated: " + str(error))
+
+    def clear_diagnostics(self) -> None:
+        """
+        Removes the diagnostics built so far, so that they are rebuilt from the current triangle when next shown.
+        """
+
+        for column, widget in self.diagnostic_widgets.items():
+            self.analysis_containers[column].removeWidget(widget)
+            widget.deleteLater()
+
+        self.diagnostic_containers = {}
+        self.diagnostic_widgets = {}
+        self.mack_results = {}
+        self.diagnostic_workers = {}
+        self.mack_valuation_groupboxes = {}
+        self.mack_development_groupboxes = {}
+        self.mack_valuation_individual_groupboxes = {}
+
+    def set_triangle(
+            self,
+            triangle: Triangle
+    ) -> None:
+        """
+        Shows a different triangle. The existing views are kept and given new models. The column tabs are only
+        rebuilt if the triangle has different columns.
+        """
+
+        self.triangle = triangle
+
+        self.clear_diagnostics()
+
+        column_list = list(self.triangle.columns)
+
+        if column_list != self.column_list:
+
+            self.column_tab.clear()
+
+            for container in self.analysis_containers.values():
+                container.deleteLater()
+
+            self.triangle_views = {}
+            self.analysis_containers = {}
+
+            self.column_list = column_list
+            self.set_tab_borders()
+
+            for i in self.column_list:
+                self.add_column(column=i)
+
+            self.apply_theme(scheme=self.theme)
+
+        self.update_value_type()
 
     def resizeEvent(self, event):
 
-        for i in self.column_list:
+        self.resize_diagnostics()
+
+    def resize_diagnostics(self) -> None:
+
+        for groupbox in self.mack_valuation_individual_groupboxes.values():
 
-            groupbox = self.mack_valuation_individual_groupboxes[i]
             max_width = groupbox.mv_max_individual_width
             padding_widget = groupbox.vertical_padding_widget
 
@@ -212,10 +494,13 @@ class AnalysisTab(QWidget):
             if value_type != "diagnostics":
                 triangle_column = triangle[self.column_list[index]]
 
-                triangle_model = TriangleModel(triangle_column, value_type)
-                self.triangle_views[tab_name].setModel(triangle_model)
+                self.triangle_views[tab_name].model().set_triangle(
+                    triangle=triangle_column,
+                    value_type=value_type
+                )
                 self.analysis_containers[tab_name].setCurrentIndex(0)
             else:
+                self.build_diagnostics(column=tab_name)
                 self.analysis_containers[tab_name].setCurrentIndex(1)
 
     def apply_theme(self, scheme: Qt.ColorScheme):
@@ -242,7 +527,8 @@ class MackValuationModel(FAbstractTableModel):
     def __init__(
         self,
         triangle: Triangle,
-        critical: QDoubleSpinBox
+        critical: QDoubleSpinBox,
+        results: MackTestResults = None
     ):
         super(
             MackValuationModel,
@@ -250,6 +536,7 @@ class MackValuationModel(FAbstractTableModel):
         ).__init__()
 
         self.triangle = triangle
+        self.results = results or MackTestResults(triangle=triangle)
         self.spin_box = critical
         self.critical_value = self.spin_box.value()
         self._data = None
@@ -302,17 +589,12 @@ class MackValuationModel(FAbstractTableModel):
 
     def calculate(self):
         self.critical_value = self.spin_box.value()
-        corr = self.triangle.valuation_correlation(
-            p_critical=self.critical_value,
-            total=False
-        ).z_critical
 
-        self._data = corr.to_frame(
-            origin_as_datetime=False
+        self._data = self.results.calculate(
+            test_type="individual valuation correlation",
+            critical=self.critical_value
         )
 
-        self._data = self._data.rename(index={min(self._data.index): 'Status'})
-
     def recalculate(self):
 
         self.calculate()
@@ -340,13 +622,15 @@ class MackResultLabel(QLabel):
             self,
             spin: QDoubleSpinBox,
             triangle: Triangle,
-            test_type: str
+            test_type: str,
+            results: MackTestResults = None
     ):
         super().__init__()
 
         self.spin = spin
         self.triangle = triangle
         self.test_type = test_type
+        self.results = results or MackTestResults(triangle=triangle)
         self.test_bool = None
 
         self.update_result()
@@ -355,20 +639,14 @@ class MackResultLabel(QLabel):
 
     def update_result(self):
 
-        if self.test_type == "valuation correlation":
-            self.test_bool = self.triangle.valuation_correlation(
-                p_critical=self.spin.value(),
-                total=True
-            ).z_critical.values[0][0]
-
-        elif self.test_type == "development correlation":
-            self.test_bool = self.triangle.development_correlation(
-                p_critical=self.spin.value()
-            ).t_critical.values[0][0]
-
-        else:
+        if self.test_type not in starting_value_lookup:
             raise ValueError("Invalid test-type indicated.")
 
+        self.test_bool = self.results.calculate(
+            test_type=self.test_type,
+            critical=self.spin.value()
+        )
+
         self.setText("Status: " + pass_alias[self.test_bool])
 
 
@@ -395,13 +673,15 @@ class MackAllYearGroupBox(QGroupBox):
             self,
             title: str,
             triangle: Triangle,
-            test_type: str
+            test_type: str,
+            results: MackTestResults = None
     ):
         super().__init__()
 
         self.setTitle(title)
         self.triangle = triangle
         self.test_type = test_type
+        self.results = results
 
         starting_value = starting_value_lookup[self.test_type]
 
@@ -418,7 +698,8 @@ class MackAllYearGroupBox(QGroupBox):
         self.test_result_label = MackResultLabel(
             spin=self.spin_box,
             triangle=triangle,
-            test_type=self.test_type
+            test_type=self.test_type,
+            results=self.results
         )
 
         self.critical_layout.addRow(
@@ -449,12 +730,14 @@ class MackIndividualGroupBox(QGroupBox):
     def __init__(
         self,
         title: str,
-        triangle: Triangle
+        triangle: Triangle,
+        results: MackTestResults = None
     ):
         super().__init__()
 
         self.setTitle(title)
         self.triangle = triangle
+        self.results = results
 
         # Holds 2 levels, one for the critical spin box,
         # the other for the individual years results
@@ -508,7 +791,8 @@ class MackIndividualGroupBox(QGroupBox):
 
         self.individual_model = MackValuationModel(
             triangle=self.triangle,
-            critical=self.spin_box
+            critical=self.spin_box,
+            results=self.results
         )
 
         self.individual_view = MackValuationView()
@@ -1,6 +1,8 @@
 """
 Contains base table classes.
 """
+from __future__ import annotations
+
 import csv
 import io
 
@@ -8,9 +10,15 @@ import pandas as pd
 
 from faslr.common.table import make_corner_button
 
+from faslr.style.triangle import BLANK_TEXT
+
+from faslr.utilities.dataframe import changed_blocks
+
 from PyQt6.QtCore import (
     QAbstractTableModel,
-    QEvent
+    QEvent,
+    QModelIndex,
+    Qt
 )
 
 from PyQt6.QtWidgets import (
@@ -22,16 +30,259 @@ from PyQt6.QtWidgets import (
     QTableView
 )
 
+from typing import (
+    Any,
+    Callable,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pandas import DataFrame
+
 
 class FAbstractTableModel(QAbstractTableModel):
     """
     Base table model class for (almost) all tables in FASLR.
+
+    The base data method looks up a handler for the requested role in role_handlers. The handler for the display
+    role, display_data, reads cells from NumPy arrays holding the columns of _data, rather than from the DataFrame,
+    and formats them with the format string that column_format returns for the column. Missing values are displayed
+    blank. The arrays are loaded on the first request after _data is assigned, and are reloaded for the columns in
+    any dataChanged range, so subclasses that modify _data in place should emit dataChanged afterwards, as setData
+    does.
+
+    Rather than emitting dataChanged for an invalid index and layoutChanged after every update, which makes the
+    attached views repaint every cell and recalculate their geometry, subclasses should replace _data with
+    update_data, or modify it in place and then call emit_changes with a copy taken beforehand. Both compare the new
+    data to the old and emit dataChanged for the blocks of cells that changed, and layoutChanged only when the shape
+    or labels of _data changed. repaint_requests and repainted_cells count the change signals emitted and the cells
+    they cover.
     """
+
+    # Format strings, such as VALUE_STYLE or PERCENT_STYLE, keyed by column name. Columns not listed use
+    # default_format, and are displayed with str when it is None.
+    column_formats: dict = {}
+    default_format: str | None = None
+
     def __init__(self):
         super().__init__()
 
+        # The values, missing value masks, and formatters of the columns of _data, and the shape they were loaded at.
+        self.column_values: list | None = None
+        self.column_blanks: list | None = None
+        self.column_formatters: list | None = None
+        self.loaded_shape: tuple | None = None
+
         self._data = pd.DataFrame()
 
+        self.role_handlers: dict = {
+            Qt.ItemDataRole.DisplayRole: self.display_data
+        }
+
+        # The number of change signals emitted, and of the cells they asked the attached views to repaint.
+        self.repaint_requests: int = 0
+        self.repainted_cells: int = 0
+
+        self.dataChanged.connect(self.refresh_columns)  # noqa
+        self.layoutChanged.connect(self.clear_columns)  # noqa
+        self.modelReset.connect(self.clear_columns)  # noqa
+
+        self.dataChanged.connect(self.count_data_changed)  # noqa
+        self.layoutChanged.connect(self.count_layout_changed)  # noqa
+        self.modelReset.connect(self.count_layout_changed)  # noqa
+
+    @property
+    def _data(self) -> DataFrame:
+        return self.__data
+
+    @_data.setter
+    def _data(
+            self,
+            data: DataFrame
+    ) -> None:
+
+        self.__data = data
+        self.clear_columns()
+
+    def data(
+            self,
+            index: QModelIndex,
+            role: int = None
+    ) -> Any:
+
+        handler = self.role_handlers.get(role)
+
+        if handler is not None:
+            return handler(index)
+
+    def display_data(
+            self,
+            index: QModelIndex
+    ) -> str:
+        """
+        Returns the formatted value of a cell.
+        """
+
+        if self.column_values is None:
+            self.load_columns()
+
+        row = index.row()
+        column = index.column()
+
+        if self.column_blanks[column][row]:
+            return BLANK_TEXT
+
+        return self.column_formatters[column](self.column_values[column][row])
+
+    def column_format(
+            self,
+            column: Any
+    ) -> str | None:
+        """
+        Returns the format string used to display a column, given its name.
+        """
+
+        return self.column_formats.get(column, self.default_format)
+
+    def column_formatter(
+            self,
+            column: Any
+    ) -> Callable[[Any], str]:
+
+        style = self.column_format(column)
+
+        if style is None:
+            return str
+        else:
+            return style.format
+
+    def load_columns(
+            self,
+            columns: range = None
+    ) -> None:
+        """
+        Loads the values, missing value masks, and formatters of the columns of _data.
+
+        Parameters
+        ----------
+        columns: range
+            The positions of the columns to reload. All columns are loaded if omitted.
+        """
+
+        if columns is None:
+            columns = range(self._data.shape[1])
+
+            self.column_values = [None] * len(columns)
+            self.column_blanks = [None] * len(columns)
+            self.column_formatters = [None] * len(columns)
+            self.loaded_shape = self._data.shape
+
+        for i in columns:
+            column = self._data.iloc[:, i]
+
+            # NumPy datetimes and timedeltas print in ISO form, so they are kept as pandas objects, which print as
+            # they did when cells were read from the DataFrame.
+            if pd.api.types.is_datetime64_any_dtype(column.dtype) or pd.api.types.is_timedelta64_dtype(column.dtype):
+                values = column.astype(object).to_numpy()
+            else:
+                values = column.to_numpy()
+
+            self.column_values[i] = values
+            self.column_blanks[i] = pd.isna(values)
+            self.column_formatters[i] = self.column_formatter(column=self._data.columns[i])
+
+    def clear_columns(self) -> None:
+        """
+        Discards the loaded columns, so that they are loaded from _data when next displayed.
+        """
+
+        self.column_values = None
+        self.column_blanks = None
+        self.column_formatters = None
+
+    def refresh_columns(
+            self,
+            top_left: QModelIndex = None,
+            bottom_right: QModelIndex = None
+    ) -> None:
+        """
+        Reloads the columns in a changed range of cells, or discards all of them if the range is invalid or the
+        shape of _data has changed.
+        """
+
+        if self.column_values is None:
+            return
+
+        if (top_left is not None) and top_left.isValid() and bottom_right.isValid() and \
+                (self.loaded_shape == self._data.shape):
+            self.load_columns(columns=range(top_left.column(), bottom_right.column() + 1))
+        else:
+            self.clear_columns()
+
+    def update_data(
+            self,
+            data: DataFrame
+    ) -> None:
+        """
+        Replaces _data, emitting dataChanged for the blocks of cells whose values changed, or layoutChanged if the
+        shape or labels of the data changed. Nothing is emitted if the data are the same.
+        """
+
+        previous = self._data
+
+        # Assigning the private attribute keeps the loaded columns, which emit_changes refreshes as needed.
+        self.__data = data
+
+        self.emit_changes(previous=previous)
+
+    def emit_changes(
+            self,
+            previous: DataFrame
+    ) -> None:
+        """
+        Emits dataChanged for the blocks of cells whose values differ between previous and the current _data, or
+        layoutChanged if their shapes or labels differ. Subclasses that modify _data in place can pass a copy taken
+        beforehand.
+        """
+
+        if (previous.shape == self._data.shape) and \
+                previous.index.equals(self._data.index) and \
+                previous.columns.equals(self._data.columns):
+
+            for top, bottom, left, right in changed_blocks(previous=previous, current=self._data):
+                self.dataChanged.emit(self.index(top, left), self.index(bottom, right))  # noqa
+        else:
+            self.layoutChanged.emit()  # noqa
+
+    def count_data_changed(
+            self,
+            top_left: QModelIndex = None,
+            bottom_right: QModelIndex = None,
+            roles: list = None
+    ) -> None:
+        """
+        Counts a dataChanged signal. Views repaint all their cells for an invalid range.
+        """
+
+        self.repaint_requests += 1
+
+        if (top_left is not None) and top_left.isValid() and bottom_right.isValid():
+            self.repainted_cells += (bottom_right.row() - top_left.row() + 1) * \
+                (bottom_right.column() - top_left.column() + 1)
+        else:
+            self.repainted_cells += self.rowCount() * self.columnCount()
+
+    def count_layout_changed(
+            self,
+            *args
+    ) -> None:
+        """
+        Counts a layoutChanged or modelReset signal, after which views repaint all their cells.
+        """
+
+        self.repaint_requests += 1
+        self.repainted_cells += self.rowCount() * self.columnCount()
+
     def rowCount(
             self,
             parent=None,
@@ -39,6 +290,10 @@ class FAbstractTableModel(QAbstractTableModel):
             **kwargs
     ):
 
+        # Table cells have no children.
+        if parent is not None and parent.isValid():
+            return 0
+
         return self._data.shape[0]
 
     def columnCount(
@@ -48,6 +303,9 @@ class FAbstractTableModel(QAbstractTableModel):
             **kwargs
     ):
 
+        if parent is not None and parent.isValid():
+            return 0
+
         return self._data.shape[1]
 
 
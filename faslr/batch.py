@@ -0,0 +1,431 @@
+"""
+Runs the reserving methods over every project view in a database without the GUI, e.g., for a quarter-end close:
+
+python -m faslr.batch path/to/project.db --workers 4
+
+Each view's data is built into reported and paid triangles, which are developed with the chainladder method. The
+chainladder ultimates then feed the expected loss, Bornhuetter-Ferguson, and Benktander methods via a ReserveEngine.
+The views are evaluated in parallel in a pool of processes, and the results are written to the batch_run,
+batch_result, and batch_result_data tables, along with the time each view took and the error of each view that failed.
+
+No loss development selections are stored in the database, so the methods use the same defaults as a newly opened
+analysis: volume-weighted factors over all periods, and an a priori ultimate equal to the average of the reported and
+paid chainladder ultimates, as in the expected loss method's initial selection.
+"""
+from __future__ import annotations
+
+import argparse
+import chainladder as cl
+import numpy as np
+import pandas as pd
+import time
+import traceback
+
+import faslr.schema as schema
+
+from concurrent.futures import (
+    as_completed,
+    ProcessPoolExecutor
+)
+
+from datetime import datetime
+
+from faslr.connection import (
+    engine_registry,
+    session_scope
+)
+
+from faslr.schema import (
+    BatchResultData,
+    BatchResultTable,
+    BatchRunTable,
+    ProjectViewData,
+    ProjectViewTable
+)
+
+from faslr.utilities.chainladder import (
+    fetch_cdf,
+    fetch_latest_diagonal,
+    fetch_origin,
+    fetch_ultimate
+)
+
+from faslr.utilities.fit_cache import (
+    configure_fit_cache,
+    fit_cache
+)
+
+from faslr.utilities.ingest import bulk_insert
+from faslr.utilities.reserving import ReserveEngine
+
+from typing import (
+    Optional,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pandas import DataFrame
+
+BATCH_TABLES = [
+    BatchRunTable.__table__,
+    BatchResultTable.__table__,
+    BatchResultData.__table__
+]
+
+
+def load_views(
+        db_path: str,
+        view_ids: Optional[list] = None
+) -> dict:
+    """
+    Reads the data of the project views, or of every view if view_ids is None, in a single query.
+
+    Returns
+    -------
+    A dictionary of DataFrames of claim data keyed by view id. Views without data have empty DataFrames.
+    """
+
+    with session_scope(db_path=db_path) as session:
+
+        view_query = session.query(ProjectViewTable.view_id)
+
+        data_query = session.query(
+            ProjectViewData.view_id,
+            ProjectViewData.accident_year,
+            ProjectViewData.calendar_year,
+            ProjectViewData.paid_loss,
+            ProjectViewData.reported_loss
+        )
+
+        if view_ids is not None:
+            view_query = view_query.filter(ProjectViewTable.view_id.in_(view_ids))
+            data_query = data_query.filter(ProjectViewData.view_id.in_(view_ids))
+
+        ids = [view_id for view_id, in view_query.order_by(ProjectViewTable.view_id)]
+
+        data = pd.read_sql(
+            data_query.statement,
+            con=session.connection()
+        )
+
+    data.columns = [
+        'View',
+        'Accident Year',
+        'Calendar Year',
+        'Paid Loss',
+        'Reported Loss'
+    ]
+
+    groups = dict(list(data.groupby('View')))
+
+    return {
+        view_id: groups.get(view_id, data.iloc[:0]).drop(columns='View').reset_index(drop=True) for view_id in ids
+    }
+
+
+def estimate_view(
+        data: DataFrame,
+        iterations: int = 1
+) -> DataFrame:
+    """
+    Calculates the ultimates of a project view's claim data, with one row per accident year, whose columns are those
+    of batch_result_data.
+
+    Parameters
+    ----------
+    data: DataFrame
+        The claim data of the view, with the columns 'Accident Year', 'Calendar Year', 'Paid Loss', and
+        'Reported Loss'.
+    iterations: int
+        The number of Benktander iterations.
+    """
+
+    triangle = cl.Triangle(
+        data=data,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=['Paid Loss', 'Reported Loss'],
+        cumulative=True
+    )
+
+    models = {}
+
+    for basis in ['Reported', 'Paid']:
+
+        losses = triangle[basis + ' Loss']
+
+        development = fit_cache.fit(
+            estimator=cl.Development(),
+            triangle=losses
+        )
+
+        models[basis] = fit_cache.fit(
+            estimator=cl.Chainladder(),
+            triangle=development.transform(losses)
+        )
+
+    result = pd.DataFrame(
+        {
+            'accident_year': np.array(fetch_origin(models['Reported']), dtype=int),
+            'reported_loss': fetch_latest_diagonal(models['Reported']),
+            'paid_loss': fetch_latest_diagonal(models['Paid']),
+            'reported_cdf': fetch_cdf(models['Reported']),
+            'paid_cdf': fetch_cdf(models['Paid']),
+            'chainladder_reported': fetch_ultimate(models['Reported']),
+            'chainladder_paid': fetch_ultimate(models['Paid'])
+        }
+    )
+
+    # With a loss ratio of 1, the premium is the a priori ultimate.
+    estimates = ReserveEngine(
+        premium=(result['chainladder_reported'] + result['chainladder_paid']) / 2,
+        loss_ratio=1,
+        reported_losses=result['reported_loss'],
+        paid_losses=result['paid_loss'],
+        reported_cdf=result['reported_cdf'],
+        paid_cdf=result['paid_cdf']
+    ).estimates(iterations=iterations)
+
+    result['expected_loss'] = estimates['Ultimate Loss']
+    result['bornhuetter_reported'] = estimates['Ultimate BF Reported']
+    result['bornhuetter_paid'] = estimates['Ultimate BF Paid']
+    result['benktander_reported'] = estimates['Ultimate GB Reported']
+    result['benktander_paid'] = estimates['Ultimate GB Paid']
+
+    return result
+
+
+def run_view(
+        view_id: int,
+        data: DataFrame,
+        iterations: int = 1
+) -> dict:
+    """
+    Evaluates a single view, catching any error so that one bad view does not stop the rest of the batch. Runs in
+    the worker processes.
+
+    Returns
+    -------
+    A dictionary with the view_id, the result of estimate_view, or None if it failed, the number of seconds taken,
+    and the error traceback, if any.
+    """
+
+    start = time.perf_counter()
+
+    try:
+        result = estimate_view(
+            data=data,
+            iterations=iterations
+        )
+        error = None
+    except Exception: # noqa
+        result = None
+        error = traceback.format_exc()
+
+    return {
+        'view_id': view_id,
+        'result': result,
+        'seconds': time.perf_counter() - start,
+        'error': error
+    }
+
+
+def run_batch(
+        db_path: str,
+        max_workers: Optional[int] = None,
+        iterations: int = 1,
+        view_ids: Optional[list] = None,
+        cache: bool = False
+) -> dict:
+    """
+    Evaluates the project views of a database in a pool of processes and saves the results.
+
+    Parameters
+    ----------
+    db_path: str
+        The path to the database.
+    max_workers: Optional[int]
+        The number of worker processes. Defaults to the number of processors.
+    iterations: int
+        The number of Benktander iterations.
+    view_ids: Optional[list]
+        The views to evaluate. Defaults to all of them.
+    cache: bool
+        Whether the workers save their fitted models next to the database, so that views whose data has not changed
+        are not refitted by later runs.
+
+    Returns
+    -------
+    A report of the run, i.e., its run_id, the total number of seconds taken, and the outcome of each view as
+    returned by run_view, without the results, in order of view id.
+    """
+
+    started = datetime.now()
+    start = time.perf_counter()
+
+    # Databases created before batch runs existed do not have the tables yet.
+    schema.Base.metadata.create_all(
+        engine_registry.get_engine(db_path=db_path),
+        tables=BATCH_TABLES
+    )
+
+    views = load_views(
+        db_path=db_path,
+        view_ids=view_ids
+    )
+
+    with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=configure_fit_cache,
+            initargs=(
+                db_path,
+                cache
+            )
+    ) as executor:
+        futures = [
+            executor.submit(
+                run_view,
+                view_id,
+                data,
+                iterations
+            ) for view_id, data in views.items()
+        ]
+
+        outcomes = sorted(
+            [future.result() for future in as_completed(futures)],
+            key=lambda outcome: outcome['view_id']
+        )
+
+    with session_scope(db_path=db_path) as session:
+
+        batch_run = BatchRunTable(
+            started=started,
+            finished=datetime.now(),
+            iterations=iterations
+        )
+
+        session.add(batch_run)
+        session.flush()
+
+        for outcome in outcomes:
+
+            result = outcome.pop('result')
+
+            batch_result = BatchResultTable(
+                run_id=batch_run.run_id,
+                view_id=outcome['view_id'],
+                seconds=outcome['seconds'],
+                error=outcome['error']
+            )
+
+            session.add(batch_result)
+            session.flush()
+
+            if result is not None:
+                bulk_insert(
+                    connection=session.connection(),
+                    table=BatchResultData.__table__,
+                    data=result.assign(result_id=batch_result.result_id)
+                )
+
+        run_id = batch_run.run_id
+
+    return {
+        'run_id': run_id,
+        'seconds': time.perf_counter() - start,
+        'views': outcomes
+    }
+
+
+def format_report(report: dict) -> str:
+    """
+    Formats the report returned by run_batch as a table of view timings followed by the errors of failed views.
+    """
+
+    lines = ["Batch run " + str(report['run_id'])]
+
+    failures = [outcome for outcome in report['views'] if outcome['error']]
+
+    for outcome in report['views']:
+        lines.append(
+            "View {:>6}  {:>9.3f} s  {}".format(
+                outcome['view_id'],
+                outcome['seconds'],
+                "failed" if outcome['error'] else "ok"
+            )
+        )
+
+    lines.append(
+        "{} views, {} failed, {:.3f} s".format(
+            len(report['views']),
+            len(failures),
+            report['seconds']
+        )
+    )
+
+    for outcome in failures:
+        lines.append("")
+        lines.append("View " + str(outcome['view_id']) + " failed:")
+        lines.append(outcome['error'].rstrip())
+
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list] = None) -> int:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m faslr.batch",
+        description="Runs the reserving methods over every project view in a FASLR database."
+    )
+
+    parser.add_argument(
+        "db_path",
+        help="the path to the database"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="the number of worker processes, defaults to the number of processors"
+    )
+
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=1,
+        help="the number of Benktander iterations"
+    )
+
+    parser.add_argument(
+        "--views",
+        type=int,
+        nargs="+",
+        default=None,
+        help="the ids of the views to evaluate, defaults to all of them"
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="save the fitted models next to the database so that later runs reuse them"
+    )
+
+    args = parser.parse_args(argv)
+
+    report = run_batch(
+        db_path=args.db_path,
+        max_workers=args.workers,
+        iterations=args.iterations,
+        view_ids=args.views,
+        cache=args.cache
+    )
+
+    print(format_report(report=report))
+
+    # A nonzero exit status lets schedulers detect a run with failed views.
+    return int(any(outcome['error'] for outcome in report['views']))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
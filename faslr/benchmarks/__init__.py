@@ -0,0 +1,5 @@
+"""
+Standalone timing scripts for performance-sensitive parts of FASLR. Each module can be run directly, e.g.,
+
+python -m faslr.benchmarks.project_tree
+"""
@@ -0,0 +1,58 @@
+"""
+Times the analysis tabs of the main window's two sample triangles: constructing them, as at startup, switching them to
+the diagnostic view, which is how long the GUI thread is blocked, and waiting until the Mack diagnostics are shown.
+"""
+import sys
+import time
+
+from faslr.analysis import AnalysisTab
+
+from faslr.benchmarks.utilities import (
+    print_results,
+    timer
+)
+
+from faslr.utilities.sample import load_sample
+
+from PyQt6.QtWidgets import QApplication
+
+SAMPLES = [
+    'us_industry_auto',
+    'uspp_incr_case'
+]
+
+TIMEOUT = 60
+
+
+def main() -> None:
+
+    app = QApplication(sys.argv)
+
+    triangles = [load_sample(sample) for sample in SAMPLES]
+
+    results = {}
+
+    with timer(label="Construct tabs (startup)", results=results):
+        tabs = [AnalysisTab(triangle=triangle) for triangle in triangles]
+
+    with timer(label="Switch to diagnostics (GUI thread)", results=results):
+        for tab in tabs:
+            tab.value_box.setCurrentText("Diagnostics")
+
+    n_groupboxes = sum(len(tab.column_list) for tab in tabs)
+
+    with timer(label="Switch until diagnostics are shown", results=results):
+        start = time.perf_counter()
+        while sum(len(tab.mack_valuation_groupboxes) for tab in tabs) < n_groupboxes:
+            if time.perf_counter() - start > TIMEOUT:
+                raise TimeoutError("The diagnostics were not shown in time.")
+            app.processEvents()
+            time.sleep(.001)
+
+    results["Switch until diagnostics are shown"] += results["Switch to diagnostics (GUI thread)"]
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
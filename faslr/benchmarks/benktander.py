@@ -0,0 +1,143 @@
+"""
+Times calculating Benktander ultimates for up to 1,000 iterations, comparing the pandas loop
+BenktanderIBNRModel.setData ran previously, one pass per iteration, against benktander_ultimates, whose cost does not
+depend on the number of iterations. Also times the path of convergence over all 1,000 iterations at once against a
+NumPy recursion. The results of each pair are checked against each other.
+"""
+import numpy as np
+import pandas as pd
+import timeit
+
+from faslr.benchmarks.utilities import print_results
+
+from faslr.utilities.benktander import benktander_ultimates
+
+N_ORIGINS = 40
+
+ITERATIONS = [
+    1,
+    10,
+    100,
+    1000
+]
+
+REPEATS = 5
+
+
+def generate_data() -> pd.DataFrame:
+
+    rng = np.random.default_rng(seed=0)
+
+    # The percent unreported falls from 90% for the latest origin period to 0% for the oldest.
+    unreported = np.linspace(
+        start=0,
+        stop=.9,
+        num=N_ORIGINS
+    )
+
+    ultimate = rng.uniform(
+        low=1e6,
+        high=2e6,
+        size=N_ORIGINS
+    )
+
+    return pd.DataFrame(
+        {
+            'Reported Losses': ultimate * (1 - unreported),
+            '% Unreported': unreported,
+            'Ultimate BF Reported': ultimate * rng.uniform(low=.8, high=1.2, size=N_ORIGINS)
+        }
+    )
+
+
+def ultimates_by_loop(
+        data: pd.DataFrame,
+        iterations: int
+) -> pd.Series:
+
+    ultimate = data['Ultimate BF Reported']
+
+    for i in range(iterations):
+        ultimate = data['Reported Losses'] + ultimate * data['% Unreported']
+
+    return ultimate
+
+
+def path_by_recursion(
+        data: pd.DataFrame,
+        iterations: int
+) -> np.ndarray:
+
+    losses = data['Reported Losses'].to_numpy()
+    unreported = data['% Unreported'].to_numpy()
+
+    path = np.empty((iterations + 1, len(data)))
+    path[0] = data['Ultimate BF Reported'].to_numpy()
+
+    for i in range(1, iterations + 1):
+        path[i] = losses + unreported * path[i - 1]
+
+    return path
+
+
+def main() -> None:
+
+    data = generate_data()
+
+    arguments = {
+        'losses': data['Reported Losses'].to_numpy(),
+        'unreported': data['% Unreported'].to_numpy(),
+        'apriori': data['Ultimate BF Reported'].to_numpy()
+    }
+
+    results = {}
+
+    for iterations in ITERATIONS:
+
+        np.testing.assert_allclose(
+            benktander_ultimates(iterations=iterations, **arguments),
+            ultimates_by_loop(data=data, iterations=iterations).to_numpy(),
+            rtol=1e-10
+        )
+
+        label = str(N_ORIGINS) + " origins, " + str(iterations) + " iterations"
+
+        results[label + ", pandas loop"] = min(timeit.repeat(
+            lambda: ultimates_by_loop(data=data, iterations=iterations),
+            number=1,
+            repeat=REPEATS
+        ))
+
+        results[label + ", closed form"] = min(timeit.repeat(
+            lambda: benktander_ultimates(iterations=iterations, **arguments),
+            number=1,
+            repeat=REPEATS
+        ))
+
+    n_iterations = ITERATIONS[-1]
+
+    np.testing.assert_allclose(
+        benktander_ultimates(iterations=np.arange(n_iterations + 1), **arguments),
+        path_by_recursion(data=data, iterations=n_iterations),
+        rtol=1e-10
+    )
+
+    label = str(N_ORIGINS) + " origins, path over 0 to " + str(n_iterations) + " iterations"
+
+    results[label + ", NumPy recursion"] = min(timeit.repeat(
+        lambda: path_by_recursion(data=data, iterations=n_iterations),
+        number=1,
+        repeat=REPEATS
+    ))
+
+    results[label + ", closed form"] = min(timeit.repeat(
+        lambda: benktander_ultimates(iterations=np.arange(n_iterations + 1), **arguments),
+        number=1,
+        repeat=REPEATS
+    ))
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Times deriving the drop list from the link ratios struck out in the factor view, comparing the per-cell loop that
+FactorModel.recalculate_factors used previously against the vectorized FactorModel.get_drop_list, for triangles of
+12, 40 and 240 development periods with about a tenth of the link ratios excluded.
+"""
+import numpy as np
+import sys
+import timeit
+
+from faslr.benchmarks.utilities import (
+    generate_triangle,
+    print_results
+)
+
+from faslr.factor import FactorModel
+from faslr.utilities import df_set_false
+
+from pandas import DataFrame
+
+from PyQt6.QtWidgets import QApplication
+
+SIZES = [
+    12,
+    40,
+    240
+]
+
+EXCLUDED_SHARE = 0.1
+
+REPEATS = 5
+
+
+def drop_list_per_cell(
+        link_frame: DataFrame,
+        excl_frame: DataFrame
+) -> list:
+
+    drop_list = []
+    for i in range(link_frame.shape[0]):
+        for j in range(link_frame.shape[1]):
+
+            exclude = excl_frame.iloc[[i], [j]].squeeze()
+
+            if exclude:
+                row_drop = str(link_frame.iloc[i].name)
+                col_drop = int(str(link_frame.columns[j]).split('-')[0])
+
+                drop_list.append((row_drop, col_drop))
+
+    return drop_list
+
+
+def main() -> None:
+
+    app = QApplication(sys.argv)  # noqa
+
+    rng = np.random.default_rng(seed=0)
+
+    results = {}
+
+    for size in SIZES:
+
+        factor_model = FactorModel(triangle=generate_triangle(n_periods=size))
+
+        observed = factor_model.link_frame.notna().to_numpy()
+        factor_model.excl_array = observed & (rng.uniform(size=observed.shape) < EXCLUDED_SHARE)
+
+        excl_frame = df_set_false(df=factor_model.link_frame.copy())
+        excl_frame.loc[:] = factor_model.excl_array
+
+        drop_list = factor_model.get_drop_list()
+        assert drop_list == drop_list_per_cell(link_frame=factor_model.link_frame, excl_frame=excl_frame)
+
+        label = str(size) + "x" + str(size) + ", " + str(len(drop_list)) + " excluded"
+
+        results[label + ", per-cell loop"] = min(timeit.repeat(
+            lambda: drop_list_per_cell(link_frame=factor_model.link_frame, excl_frame=excl_frame),
+            number=1,
+            repeat=REPEATS
+        ))
+
+        results[label + ", get_drop_list"] = min(timeit.repeat(
+            factor_model.get_drop_list,
+            number=1,
+            repeat=REPEATS
+        ))
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
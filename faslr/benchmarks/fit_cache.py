@@ -0,0 +1,77 @@
+"""
+Times fitting the estimators of the tail pane to triangles of increasing size, comparing a new fit against a hit in
+the fit cache, both in memory and on disk, i.e., after a restart. Each hit is checked against the new fit.
+"""
+import chainladder as cl
+import numpy as np
+import tempfile
+import timeit
+
+from faslr.benchmarks.utilities import (
+    generate_triangle,
+    print_results
+)
+
+from faslr.utilities.fit_cache import FitCache
+
+N_PERIODS = [
+    20,
+    60,
+    120
+]
+
+ESTIMATORS = {
+    'Development': lambda: cl.Development(),
+    'TailCurve': lambda: cl.TailCurve(),
+    'TailClark': lambda: cl.TailClark()
+}
+
+REPEATS = 5
+
+
+def main() -> None:
+
+    results = {}
+
+    for n_periods in N_PERIODS:
+
+        triangle = generate_triangle(n_periods=n_periods)
+
+        for name, estimator in ESTIMATORS.items():
+
+            label = str(n_periods) + " periods, " + name
+
+            with tempfile.TemporaryDirectory() as directory:
+
+                cache = FitCache(directory=directory)
+                expected = cache.fit(estimator=estimator(), triangle=triangle)
+
+                np.testing.assert_allclose(
+                    cache.fit(estimator=estimator(), triangle=triangle).ldf_.values,
+                    expected.ldf_.values
+                )
+
+                results[label + ", fit"] = min(timeit.repeat(
+                    lambda: estimator().fit(triangle),
+                    number=1,
+                    repeat=REPEATS
+                ))
+
+                results[label + ", memory hit"] = min(timeit.repeat(
+                    lambda: cache.fit(estimator=estimator(), triangle=triangle),
+                    number=1,
+                    repeat=REPEATS
+                ))
+
+                # A new cache each time, as after a restart, so that every hit is read from disk.
+                results[label + ", disk hit"] = min(timeit.repeat(
+                    lambda: FitCache(directory=directory).fit(estimator=estimator(), triangle=triangle),
+                    number=1,
+                    repeat=REPEATS
+                ))
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Measures the throughput, in rows per second, of saving claim-level data to the project_view_data table. The ORM path
+that the data pane used previously, one ProjectViewData object per row, is compared against bulk_insert at a
+few chunk sizes, with and without the bulk load pragmas.
+"""
+import numpy as np
+import os
+import pandas as pd
+import sqlalchemy as sa
+import tempfile
+import time
+
+import faslr.schema as schema
+
+from faslr.connection import (
+    engine_registry,
+    session_scope
+)
+
+from faslr.constants import SQLITE_BULK_PRAGMAS
+
+from faslr.schema import (
+    ProjectViewData,
+    ProjectViewTable
+)
+
+from faslr.utilities.ingest import bulk_insert
+
+N_ROWS = 1000000
+
+# The ORM path is too slow to run over every row.
+N_ROWS_ORM = 100000
+
+CHUNK_SIZES = [
+    1000,
+    10000,
+    50000
+]
+
+
+def make_data(n_rows: int) -> pd.DataFrame:
+
+    rng = np.random.default_rng(seed=0)
+
+    return pd.DataFrame(
+        data={
+            'accident_year': rng.integers(1990, 2024, n_rows),
+            'calendar_year': rng.integers(1990, 2024, n_rows),
+            'paid_loss': rng.gamma(2, 5000, n_rows),
+            'reported_loss': rng.gamma(2, 6000, n_rows)
+        }
+    )
+
+
+def save_orm(db_path: str, data: pd.DataFrame) -> float:
+
+    start = time.perf_counter()
+
+    with session_scope(db_path=db_path) as session:
+        project_view = ProjectViewTable(name="ORM")
+        session.add(project_view)
+        session.flush()
+
+        data = data.assign(view_id=project_view.view_id)
+        session.add_all([ProjectViewData(**record) for record in data.to_dict('records')])
+
+    return time.perf_counter() - start
+
+
+def save_bulk(
+        db_path: str,
+        data: pd.DataFrame,
+        chunk_size: int,
+        pragmas: dict = None
+) -> float:
+
+    start = time.perf_counter()
+
+    with session_scope(
+        db_path=db_path,
+        pragmas=pragmas
+    ) as session:
+        project_view = ProjectViewTable(name="Bulk")
+        session.add(project_view)
+        session.flush()
+
+        bulk_insert(
+            connection=session.connection(),
+            table=ProjectViewData.__table__,
+            data=data.assign(view_id=project_view.view_id),
+            chunk_size=chunk_size
+        )
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+
+    data = make_data(N_ROWS)
+
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        db_path = os.path.join(tmp_dir, 'ingest.db')
+
+        engine = sa.create_engine('sqlite:///' + db_path)
+        schema.Base.metadata.create_all(engine)
+        engine.dispose()
+
+        seconds = save_orm(db_path=db_path, data=data.iloc[:N_ROWS_ORM])
+        results.append(("ORM objects", N_ROWS_ORM, seconds))
+
+        for chunk_size in CHUNK_SIZES:
+            seconds = save_bulk(db_path=db_path, data=data, chunk_size=chunk_size)
+            results.append(("bulk_insert, chunk " + str(chunk_size), N_ROWS, seconds))
+
+        for chunk_size in CHUNK_SIZES:
+            seconds = save_bulk(db_path=db_path, data=data, chunk_size=chunk_size, pragmas=SQLITE_BULK_PRAGMAS)
+            results.append(("bulk_insert + pragmas, chunk " + str(chunk_size), N_ROWS, seconds))
+
+        engine_registry.dispose(db_path=db_path)
+
+    width = max(len(label) for label, _, _ in results)
+
+    for label, n_rows, seconds in results:
+        print(label.ljust(width) + "  " + format(n_rows, '>9,') + " rows  " + format(seconds, '8.3f') + " s  " +
+              format(n_rows / seconds, '>12,.0f') + " rows/s")
+
+
+if __name__ == "__main__":
+    main()
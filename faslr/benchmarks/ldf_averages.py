@@ -0,0 +1,96 @@
+"""
+Times calculating 12 LDF averages, i.e., regression, straight and volume-weighted averages over all, 3, 5 and 10
+periods, comparing one cl.Development fit per average, as FactorModel.get_display_data did previously, against a
+single LDFEngine.ldfs call. The results of the two are checked against each other.
+"""
+import chainladder as cl
+import numpy as np
+import pandas as pd
+import timeit
+import warnings
+
+from faslr.benchmarks.utilities import (
+    generate_triangle,
+    print_results
+)
+
+from faslr.utilities.ldf import LDFEngine
+
+SIZES = [
+    12,
+    40,
+    120
+]
+
+AVERAGES = [
+    (average, n_periods) for average in ['regression', 'simple', 'volume'] for n_periods in [-1, 3, 5, 10]
+]
+
+REPEATS = 5
+
+
+def ldfs_per_average(triangle: cl.Triangle) -> pd.DataFrame:
+
+    factor_frame = pd.DataFrame()
+
+    for i, (average, n_periods) in enumerate(AVERAGES):
+
+        development = cl.Development(
+            n_periods=[n_periods] * (triangle.shape[3] - 1),
+            average=average
+        )
+
+        factor_row = development.fit(X=triangle).ldf_.to_frame(origin_as_datetime=False)
+
+        if i == 0:
+            factor_frame = factor_row
+        else:
+            factor_frame = pd.concat([factor_frame, factor_row])
+
+    return factor_frame
+
+
+def main() -> None:
+
+    # chainladder warns that regression statistics are unavailable for short windows, which is irrelevant here.
+    warnings.simplefilter('ignore')
+
+    results = {}
+
+    for size in SIZES:
+
+        triangle = generate_triangle(n_periods=size)
+
+        engine = LDFEngine(triangle=triangle)
+
+        np.testing.assert_allclose(
+            engine.ldfs(averages=AVERAGES),
+            ldfs_per_average(triangle=triangle).to_numpy(),
+            rtol=1e-12
+        )
+
+        label = str(size) + "x" + str(size) + ", " + str(len(AVERAGES)) + " averages"
+
+        results[label + ", cl.Development per average"] = min(timeit.repeat(
+            lambda: ldfs_per_average(triangle=triangle),
+            number=1,
+            repeat=REPEATS
+        ))
+
+        results[label + ", LDFEngine"] = min(timeit.repeat(
+            lambda: engine.ldfs(averages=AVERAGES),
+            number=1,
+            repeat=REPEATS
+        ))
+
+        results[label + ", LDFEngine incl. setup"] = min(timeit.repeat(
+            lambda: LDFEngine(triangle=triangle).ldfs(averages=AVERAGES),
+            number=1,
+            repeat=REPEATS
+        ))
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
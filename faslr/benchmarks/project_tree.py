@@ -0,0 +1,145 @@
+"""
+Times loading the project tree from a database holding 50,000 LOB segments, comparing the per-row loader that
+FASLR used previously against the set-based loader in faslr.connection, and against the lazily loaded ProjectModel,
+which only reads the countries until a segment is expanded.
+"""
+import os
+import sys
+import tempfile
+
+from faslr.benchmarks.utilities import (
+    generate_project_db,
+    print_results,
+    timer
+)
+
+from faslr.connection import (
+    engine_registry,
+    populate_project_model,
+    session_scope
+)
+
+from faslr.project import ProjectModel
+from faslr.project_item import ProjectItem
+
+from faslr.schema import (
+    CountryTable,
+    LOBTable,
+    LocationTable,
+    StateTable
+)
+
+from PyQt6.QtGui import QStandardItem
+from PyQt6.QtWidgets import QApplication
+
+N_COUNTRIES = 10
+N_STATES = 100
+N_LOBS = 50
+
+
+def populate_per_row(session, project_model: ProjectModel) -> None:
+    """
+    The previous loader: one query per country for its states and one per state for its LOBs, with rows attached to
+    the live model one at a time.
+    """
+    countries = session.query(
+        CountryTable.country_id,
+        CountryTable.country_name,
+        CountryTable.project_id
+    ).all()
+
+    for country_id, country, country_uuid in countries:
+
+        country_item = ProjectItem(
+            text=country,
+            segment_level='country',
+            set_bold=True
+        )
+
+        country_row = [country_item, QStandardItem(country_uuid)]
+
+        states = session.query(
+            StateTable.state_id,
+            StateTable.state_name,
+            StateTable.project_id
+        ).filter(
+            StateTable.country_id == country_id
+        )
+
+        for state_id, state, state_uuid in states:
+
+            state_item = ProjectItem(
+                text=state,
+                segment_level='state'
+            )
+
+            state_row = [state_item, QStandardItem(state_uuid)]
+
+            lobs = session.query(
+                LOBTable.lob_type,
+                LOBTable.project_id
+            ).join(
+                LocationTable
+            ).join(
+                StateTable
+            ).filter(
+                StateTable.state_id == state_id
+            )
+
+            for lob, lob_uuid in lobs:
+                state_item.appendRow([ProjectItem(lob, segment_level='lob'), QStandardItem(lob_uuid)])
+
+            country_item.appendRow(state_row)
+
+        project_model.project_root.appendRow(country_row)
+
+
+def main() -> None:
+
+    app = QApplication(sys.argv) # noqa
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        db_path = os.path.join(tmp_dir, 'project_tree.db')
+
+        with timer("generate " + str(N_COUNTRIES * N_STATES * N_LOBS) + " LOBs", results):
+            generate_project_db(
+                db_path=db_path,
+                n_countries=N_COUNTRIES,
+                n_states=N_STATES,
+                n_lobs=N_LOBS
+            )
+
+        with timer("per-row loader", results):
+            with session_scope(db_path=db_path) as session:
+                populate_per_row(
+                    session=session,
+                    project_model=ProjectModel()
+                )
+
+        with timer("set-based loader", results):
+            with session_scope(db_path=db_path) as session:
+                populate_project_model(
+                    session=session,
+                    project_model=ProjectModel()
+                )
+
+        project_model = ProjectModel()
+
+        with timer("lazy model, open", results):
+            project_model.load(db_path=db_path)
+
+        with timer("lazy model, expand one state", results):
+            country_idx = project_model.index(0, 0)
+            project_model.fetchMore(country_idx)
+            project_model.fetchMore(project_model.index(0, 0, country_idx))
+
+        engine_registry.dispose(db_path=db_path)
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
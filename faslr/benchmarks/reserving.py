@@ -0,0 +1,105 @@
+"""
+Times evaluating the Bornhuetter-Ferguson estimates of a portfolio of segments, comparing the chain of pandas column
+arithmetic the IBNR models ran previously, once per segment, against a single ReserveEngine call over arrays with one
+row per segment. The results of the two are checked against each other.
+"""
+import numpy as np
+import pandas as pd
+import timeit
+
+from faslr.benchmarks.utilities import print_results
+
+from faslr.utilities.reserving import ReserveEngine
+
+N_ORIGINS = 20
+
+SEGMENTS = [
+    10,
+    100,
+    1000
+]
+
+REPEATS = 5
+
+
+def generate_portfolio(n_segments: int) -> dict:
+
+    rng = np.random.default_rng(seed=0)
+
+    shape = (n_segments, N_ORIGINS)
+
+    premium = rng.uniform(low=1e6, high=2e6, size=shape)
+    reported_cdf = np.broadcast_to(np.geomspace(1, 3, N_ORIGINS), shape)
+    paid_cdf = reported_cdf * 1.2
+
+    return {
+        'premium': premium,
+        'loss_ratio': rng.uniform(low=.6, high=.8, size=shape),
+        'reported_losses': premium * .7 / reported_cdf,
+        'paid_losses': premium * .7 / paid_cdf,
+        'reported_cdf': reported_cdf,
+        'paid_cdf': paid_cdf
+    }
+
+
+def estimates_per_segment(portfolio: dict) -> list:
+
+    results = []
+
+    for i in range(len(portfolio['premium'])):
+
+        data = pd.DataFrame({key: values[i] for key, values in portfolio.items()})
+
+        data['Expected Claims'] = data['loss_ratio'] * data['premium']
+        data['Reported CDF'] = np.maximum(1, data['reported_cdf'])
+        data['Paid CDF'] = np.maximum(1, data['paid_cdf'])
+        data['% Unreported'] = 1 - data['Reported CDF'] ** (-1)
+        data['% Unpaid'] = 1 - data['Paid CDF'] ** (-1)
+        data['Expected Unreported'] = data['% Unreported'] * data['Expected Claims']
+        data['Expected Unpaid'] = data['% Unpaid'] * data['Expected Claims']
+        data['Ultimate BF Reported'] = data['Expected Unreported'] + data['reported_losses']
+        data['Ultimate BF Paid'] = data['Expected Unpaid'] + data['paid_losses']
+        data['Case Outstanding'] = data['reported_losses'] - data['paid_losses']
+        data['BF Reported IBNR'] = data['Ultimate BF Reported'] - data['reported_losses']
+        data['BF Paid IBNR'] = data['Ultimate BF Paid'] - data['reported_losses']
+        data['BF Reported Unpaid Claims'] = data['Ultimate BF Reported'] - data['paid_losses']
+        data['BF Paid Unpaid Claims'] = data['Ultimate BF Paid'] - data['paid_losses']
+
+        results.append(data)
+
+    return results
+
+
+def main() -> None:
+
+    results = {}
+
+    for n_segments in SEGMENTS:
+
+        portfolio = generate_portfolio(n_segments=n_segments)
+
+        np.testing.assert_allclose(
+            ReserveEngine(**portfolio).estimates()['BF Paid Unpaid Claims'],
+            np.stack([data['BF Paid Unpaid Claims'] for data in estimates_per_segment(portfolio=portfolio)]),
+            rtol=1e-12
+        )
+
+        label = str(n_segments) + " segments x " + str(N_ORIGINS) + " origins"
+
+        results[label + ", pandas per segment"] = min(timeit.repeat(
+            lambda: estimates_per_segment(portfolio=portfolio),
+            number=1,
+            repeat=REPEATS
+        ))
+
+        results[label + ", ReserveEngine"] = min(timeit.repeat(
+            lambda: ReserveEngine(**portfolio).estimates(),
+            number=1,
+            repeat=REPEATS
+        ))
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
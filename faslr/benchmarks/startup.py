@@ -0,0 +1,160 @@
+"""
+Measures how long FASLR takes to start, in a new interpreter each time: the -X importtime breakdown of importing the
+main window's module, i.e., how much of it is spent importing each of the heavy third-party packages, and the wall
+clock time from launching the interpreter to the first paint of the main window.
+
+chainladder, matplotlib, and pandas should be missing from the breakdown, since they are imported when a triangle is
+first opened rather than at startup.
+"""
+import os
+import subprocess
+import sys
+import time
+
+from faslr.benchmarks.utilities import print_results
+
+# Third-party packages whose import time is reported on its own.
+PACKAGES = [
+    'chainladder',
+    'matplotlib',
+    'pandas',
+    'numpy',
+    'sqlalchemy',
+    'PyQt6.QtWidgets',
+    'git'
+]
+
+# Packages that are deferred until a triangle is opened.
+DEFERRED_PACKAGES = [
+    'chainladder',
+    'matplotlib',
+    'pandas'
+]
+
+MAIN_MODULE = 'faslr.__main__'
+
+# Shows the main window and prints the time of its first paint event.
+FIRST_PAINT_SCRIPT = """
+import time
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+from PyQt6.QtWidgets import QApplication
+
+app = QApplication([])
+
+from faslr.__main__ import MainWindow
+
+
+class FirstPaintFilter(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint:
+            print(time.time(), flush=True)
+            app.quit()
+        return False
+
+
+window = MainWindow(application=app)
+paint_filter = FirstPaintFilter()
+window.installEventFilter(paint_filter)
+window.show()
+
+QTimer.singleShot(60000, app.quit)
+app.exec()
+"""
+
+REPEATS = 3
+
+# The directory containing the faslr package, which the new interpreters need on their path when FASLR is run from a
+# source checkout rather than installed.
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def interpreter_environment() -> dict:
+
+    path = [PACKAGE_PARENT] + [entry for entry in os.environ.get('PYTHONPATH', '').split(os.pathsep) if entry]
+
+    return dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(path)
+    )
+
+
+def import_times(module: str = MAIN_MODULE) -> dict:
+    """
+    Imports a module in a new interpreter with -X importtime.
+
+    Returns
+    -------
+    A dictionary of the cumulative seconds spent importing each module that was imported, including the module's
+    dependencies, keyed by module name.
+    """
+
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=interpreter_environment()
+    )
+
+    times = {}
+
+    for line in process.stderr.splitlines():
+
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line.split('|')
+
+        times[name.strip()] = int(cumulative) / 1e6
+
+    return times
+
+
+def time_to_first_paint() -> float:
+    """
+    Launches a new interpreter that shows the main window.
+
+    Returns
+    -------
+    The wall clock seconds from launching the interpreter to the first paint of the main window.
+    """
+
+    start = time.time()
+
+    process = subprocess.run(
+        [sys.executable, '-c', FIRST_PAINT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=interpreter_environment()
+    )
+
+    # The time is the last line printed, after anything the application prints while starting.
+    return float(process.stdout.split()[-1]) - start
+
+
+def main() -> None:
+
+    results = {}
+
+    breakdowns = [import_times() for _ in range(REPEATS)]
+
+    results["Import " + MAIN_MODULE] = min(times[MAIN_MODULE] for times in breakdowns)
+
+    for package in PACKAGES:
+        if package in breakdowns[0]:
+            results["  of which " + package] = min(times[package] for times in breakdowns)
+        else:
+            print(package + " is not imported at startup.")
+
+    results["Launch to first paint"] = min(time_to_first_paint() for _ in range(REPEATS))
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    # Without a display, e.g., on a build server, the window is painted offscreen.
+    if 'DISPLAY' not in os.environ and sys.platform.startswith('linux'):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    main()
@@ -0,0 +1,139 @@
+"""
+Measures how many cells per second TriangleModel can serve to a view, by scanning every row of the model and
+requesting the display, alignment and background roles of each cell, as a view does when painting. The model is
+compared against the DataFrame-backed data method it used previously, which looked up and formatted each cell on
+every paint. The first scan fills the display cache and later scans reuse it.
+"""
+import sys
+import time
+
+from faslr.benchmarks.utilities import generate_triangle
+
+from faslr.style.triangle import (
+    BLANK_TEXT,
+    RATIO_STYLE,
+    VALUE_STYLE
+)
+
+from faslr.triangle_model import TriangleModel
+
+from PyQt6.QtCore import (
+    Qt,
+    QVariant
+)
+
+from PyQt6.QtWidgets import QApplication
+
+SIZES = [
+    40,
+    120,
+    240
+]
+
+ROLES = [
+    Qt.ItemDataRole.DisplayRole,
+    Qt.ItemDataRole.TextAlignmentRole,
+    Qt.ItemDataRole.BackgroundRole
+]
+
+N_SCANS = 3
+
+
+class DataFrameTriangleModel(TriangleModel):
+    """
+    TriangleModel with the data method it had before the display cache was added.
+    """
+    def data(
+            self,
+            index,
+            role=None
+    ):
+
+        if role == Qt.ItemDataRole.DisplayRole:
+
+            value = self._data.iloc[index.row(), index.column()]
+
+            if str(value) == "nan":
+
+                display_value = BLANK_TEXT
+            else:
+                if self.value_type == "value":
+
+                    display_value = VALUE_STYLE.format(value)
+
+                else:
+
+                    display_value = RATIO_STYLE.format(value)
+
+                display_value = str(display_value)
+
+            self.setData(
+                self.index(
+                    index.row(),
+                    index.column()
+                ),
+                QVariant(Qt.AlignmentFlag.AlignRight),
+                Qt.ItemDataRole.TextAlignmentRole
+            )
+
+            return display_value
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignRight
+
+        if role == Qt.ItemDataRole.BackgroundRole and (index.column() >= self.n_rows - index.row()):
+
+            return self.lower_diag_color
+
+
+def scan(model: TriangleModel) -> float:
+    """
+    Requests every role of every cell, row by row, and returns the time taken.
+    """
+
+    start = time.perf_counter()
+
+    for row in range(model.rowCount()):
+        for column in range(model.columnCount()):
+            index = model.index(row, column)
+            for role in ROLES:
+                model.data(index, role)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+
+    app = QApplication(sys.argv)  # noqa
+
+    rows = []
+
+    for size in SIZES:
+
+        triangle = generate_triangle(n_periods=size)
+        n_cells = size * size
+
+        for label, model_class in [
+            ("DataFrame lookups", DataFrameTriangleModel),
+            ("TriangleModel", TriangleModel)
+        ]:
+            model = model_class(
+                triangle=triangle,
+                value_type='value'
+            )
+
+            seconds = [scan(model=model) for _ in range(N_SCANS)]
+
+            rows.append((str(size) + "x" + str(size) + ", " + label, n_cells, seconds[0], min(seconds[1:])))
+
+    width = max(len(label) for label, _, _, _ in rows)
+
+    print("".ljust(width) + "  " + "first scan".rjust(16) + "  " + "later scans".rjust(16))
+
+    for label, n_cells, first, later in rows:
+        print(label.ljust(width) + "  " + format(n_cells / first, '>10,.0f') + " cells/s  " +
+              format(n_cells / later, '>10,.0f') + " cells/s")
+
+
+if __name__ == "__main__":
+    main()
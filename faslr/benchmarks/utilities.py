@@ -0,0 +1,154 @@
+"""
+Helpers shared by the benchmark scripts.
+"""
+import chainladder as cl
+import faslr.schema as schema
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+import time
+
+from contextlib import contextmanager
+
+from faslr.schema import (
+    CountryTable,
+    LOBTable,
+    LocationTable,
+    ProjectTable,
+    StateTable
+)
+
+from typing import Iterator
+from uuid import uuid4
+
+
+@contextmanager
+def timer(label: str, results: dict) -> Iterator[None]:
+    """
+    Records the wall time of the enclosed block in results[label].
+    """
+    start = time.perf_counter()
+    yield
+    results[label] = time.perf_counter() - start
+
+
+def print_results(results: dict) -> None:
+
+    width = max(len(label) for label in results)
+
+    for label, seconds in results.items():
+        print(label.ljust(width) + "  " + format(seconds, '10.4f') + " s")
+
+
+def generate_project_db(
+        db_path: str,
+        n_countries: int,
+        n_states: int,
+        n_lobs: int
+) -> None:
+    """
+    Creates a database with a synthetic project hierarchy of n_countries countries, n_states states per country and
+    n_lobs LOBs per state. Rows are written with bulk inserts so that large trees can be generated quickly.
+    """
+    engine = sa.create_engine('sqlite:///' + db_path)
+    schema.Base.metadata.create_all(engine)
+
+    projects = []
+    locations = []
+    countries = []
+    states = []
+    lobs = []
+
+    location_id = 0
+    state_id = 0
+
+    for country_id in range(1, n_countries + 1):
+
+        location_id += 1
+        country_uuid = str(uuid4())
+        projects.append({'project_id': country_uuid})
+        locations.append({'location_id': location_id, 'hierarchy': 'country'})
+        countries.append({
+            'country_id': country_id,
+            'location_id': location_id,
+            'country_name': "Country " + str(country_id),
+            'project_id': country_uuid
+        })
+
+        for _ in range(n_states):
+
+            location_id += 1
+            state_id += 1
+            state_uuid = str(uuid4())
+            projects.append({'project_id': state_uuid})
+            locations.append({'location_id': location_id, 'hierarchy': 'state'})
+            states.append({
+                'state_id': state_id,
+                'location_id': location_id,
+                'country_id': country_id,
+                'state_name': "State " + str(state_id),
+                'project_id': state_uuid
+            })
+
+            for lob in range(n_lobs):
+
+                lob_uuid = str(uuid4())
+                projects.append({'project_id': lob_uuid})
+                lobs.append({
+                    'lob_type': "LOB " + str(lob + 1),
+                    'location_id': location_id,
+                    'project_id': lob_uuid
+                })
+
+    with engine.begin() as connection:
+        for table, rows in [
+            (ProjectTable, projects),
+            (LocationTable, locations),
+            (CountryTable, countries),
+            (StateTable, states),
+            (LOBTable, lobs)
+        ]:
+            connection.execute(sa.insert(table), rows)
+
+    engine.dispose()
+
+
+def generate_triangle(
+        n_periods: int,
+        columns: list = None,
+        seed: int = 0
+) -> cl.Triangle:
+    """
+    Creates a cumulative triangle with n_periods monthly origin periods and n_periods monthly development ages, with
+    random, increasing values in each of columns.
+    """
+    if columns is None:
+        columns = ['Paid Claims']
+
+    rng = np.random.default_rng(seed=seed)
+
+    # The cells of the upper-left triangle, i.e., those evaluated by the latest diagonal.
+    periods = np.arange(n_periods)
+    origins, ages = np.nonzero(np.add.outer(periods, periods) < n_periods)
+
+    origin_dates = pd.period_range('1990-01', periods=n_periods, freq='M')
+
+    data = pd.DataFrame(
+        data={
+            'origin': origin_dates[origins].strftime('%Y-%m'),
+            'valuation': origin_dates[origins + ages].strftime('%Y-%m')
+        }
+    )
+
+    for column in columns:
+        # Each origin's losses develop towards a random ultimate.
+        ultimate = rng.gamma(10, 10000, n_periods)[origins]
+        data[column] = ultimate * (1 - 0.9 ** (ages + 1)) * rng.uniform(0.95, 1.05, len(data))
+
+    return cl.Triangle(
+        data=data,
+        origin='origin',
+        development='valuation',
+        columns=columns,
+        cumulative=True
+    )
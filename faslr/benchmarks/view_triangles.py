@@ -0,0 +1,183 @@
+"""
+Times loading and fitting the chainladder method to many project views, comparing one query, Triangle, and fit per
+view, as ProjectDataView.open_triangle does for a single view, against a single load_view_triangle call and one fit
+of the resulting multi-index Triangle. The ultimates of the two are checked against each other.
+"""
+import chainladder as cl
+import numpy as np
+import os
+import pandas as pd
+import sqlalchemy as sa
+import tempfile
+import time
+import warnings
+
+import faslr.schema as schema
+
+from faslr.benchmarks.utilities import print_results
+
+from faslr.connection import (
+    engine_registry,
+    session_scope
+)
+
+from faslr.schema import (
+    ProjectViewData,
+    ProjectViewTable
+)
+
+from faslr.utilities.ingest import bulk_insert
+from faslr.utilities.queries import load_view_triangle
+
+N_VIEWS = [
+    10,
+    100,
+    500
+]
+
+N_YEARS = 10
+
+
+def make_views(
+        db_path: str,
+        n_views: int
+) -> list:
+
+    rng = np.random.default_rng(seed=0)
+
+    accident_years, calendar_years = np.triu_indices(N_YEARS)
+
+    view_ids = []
+
+    with session_scope(db_path=db_path) as session:
+
+        for i in range(n_views):
+
+            project_view = ProjectViewTable(name="View " + str(i))
+            session.add(project_view)
+            session.flush()
+
+            view_ids.append(project_view.view_id)
+
+            age = calendar_years - accident_years + 1
+
+            bulk_insert(
+                connection=session.connection(),
+                table=ProjectViewData.__table__,
+                data=pd.DataFrame(
+                    {
+                        'view_id': project_view.view_id,
+                        'accident_year': 2000 + accident_years,
+                        'calendar_year': 2000 + calendar_years,
+                        'paid_loss': rng.uniform(1, 2, len(age)) * age,
+                        'reported_loss': rng.uniform(2, 3, len(age)) * age
+                    }
+                )
+            )
+
+    return view_ids
+
+
+def fit(triangle: cl.Triangle) -> cl.Chainladder:
+
+    return cl.Chainladder().fit(cl.Development().fit_transform(triangle))
+
+
+def ultimates_per_view(
+        db_path: str,
+        view_ids: list
+) -> np.ndarray:
+
+    ultimates = []
+
+    for view_id in view_ids:
+
+        with session_scope(db_path=db_path) as session:
+            query = session.query(
+                ProjectViewData.accident_year,
+                ProjectViewData.calendar_year,
+                ProjectViewData.paid_loss,
+                ProjectViewData.reported_loss
+            ).filter(
+                ProjectViewData.view_id == view_id
+            )
+
+            df = pd.read_sql(query.statement, con=session.connection())
+
+        df.columns = [
+            'Accident Year',
+            'Calendar Year',
+            'Paid Loss',
+            'Reported Loss'
+        ]
+
+        triangle = cl.Triangle(
+            data=df,
+            origin='Accident Year',
+            development='Calendar Year',
+            columns=['Paid Loss', 'Reported Loss'],
+            cumulative=True
+        )
+
+        ultimates.append(fit(triangle=triangle).ultimate_.values[0])
+
+    return np.stack(ultimates)
+
+
+def ultimates_at_once(
+        db_path: str,
+        view_ids: list
+) -> np.ndarray:
+
+    with session_scope(db_path=db_path) as session:
+        triangle = load_view_triangle(
+            session=session,
+            view_ids=view_ids
+        )
+
+    return fit(triangle=triangle).ultimate_.values
+
+
+def main() -> None:
+
+    # chainladder warns about the regression statistics of short triangles, which are irrelevant here.
+    warnings.simplefilter('ignore')
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        for n_views in N_VIEWS:
+
+            db_path = os.path.join(tmp_dir, str(n_views) + '.db')
+
+            engine = sa.create_engine('sqlite:///' + db_path)
+            schema.Base.metadata.create_all(engine)
+            engine.dispose()
+
+            view_ids = make_views(
+                db_path=db_path,
+                n_views=n_views
+            )
+
+            start = time.perf_counter()
+            per_view = ultimates_per_view(db_path=db_path, view_ids=view_ids)
+            results[str(n_views) + " views, query and fit per view"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            at_once = ultimates_at_once(db_path=db_path, view_ids=view_ids)
+            results[str(n_views) + " views, load_view_triangle and one fit"] = time.perf_counter() - start
+
+            np.testing.assert_allclose(
+                at_once,
+                per_view,
+                rtol=1e-10
+            )
+
+            engine_registry.dispose(db_path=db_path)
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,8 @@ from faslr.common.table import make_corner_button
 
 from faslr.model.average import FAverageBox
 
+from faslr.utilities.ratio import RatioAverageEngine
+
 from PyQt6.QtCore import (
     QModelIndex
 )
@@ -108,29 +110,6 @@ class FSelectionModel(FAbstractTableModel):
             self.df_ratio = pd.DataFrame()
             self._data = pd.DataFrame()
 
-    def data(self, index: QModelIndex, role: int = ...) -> typing.Any:
-        """
-        Base method for displaying data in the accompanying QTableView. Loss models will override this method
-        with their own formatting for display, e.g., percentages, ratios, etc., depending on the particular model.
-
-        Parameters
-        ----------
-
-        index: QModelIndex
-            The index containing the row and column position of the data element to be displayed.
-        role: int
-            Usually set to Qt.ItemDataRole.DisplayRole.
-        """
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-
-            # If value is nan, display blank. Otherwise, display the string representation.
-            if np.isnan(value):
-                return ""
-            else:
-                return str(value)
-
     def headerData(
             self,
             p_int: int,
@@ -155,17 +134,20 @@ class FSelectionModel(FAbstractTableModel):
         if role == UpdateIndexRole:
             self.df_ratio = value
 
-        # Calculate the ratio averages.
-        self.average_frame = self.calculate_averages()
+        # Allocate the values of the display frame: the ratios, a spacer row, a section header row, one row per
+        # average, another spacer row, and the selected ratios.
+        n_averages = self.num_average_types if self.average_types is not None else 0
+        averages_start = self.n_ratio_rows + 2
+
+        values = np.full((averages_start + n_averages + 2, self.df_ratio.shape[1]), np.nan)
+        values[:self.n_ratio_rows] = self.df_ratio.to_numpy(dtype=float)
+
+        # Calculate the ratio averages, directly into their block of the display values.
+        self.average_frame = self.calculate_averages(out=values[averages_start:averages_start + n_averages])
 
         # Create a spacer row.
         spacer_row = self.blank_row.copy()
 
-        # Create a row for a section header.
-        section_header_row = spacer_row.copy()
-        section_header_row[self.df_ratio.index.name] = 'Averages'
-        section_header_row = section_header_row.set_index(self.df_ratio.index.name)
-
         # Create a row for the selected ratios.
         if role == SelectAverageRole:
             self.selected_ratios_row = value
@@ -182,18 +164,21 @@ class FSelectionModel(FAbstractTableModel):
             self.selected_ratios_row[self.df_ratio.index.name] = 'Selected Averages'
             self.selected_ratios_row = self.selected_ratios_row.set_index(self.df_ratio.index.name)
 
-        # Combine ratios, averages and spacer rows into a single DataFrame.
-        self._data = pd.concat([
-            self.df_ratio,
-            spacer_row,
-            section_header_row,
-            self.average_frame,
-            spacer_row,
-            self.selected_ratios_row
-        ])
+        values[-1] = self.selected_ratios_row.to_numpy(dtype=float)[0]
 
-        self.dataChanged.emit(index, index)
-        self.layoutChanged.emit()
+        labels = list(self.df_ratio.index) + \
+            ['', 'Averages'] + \
+            list(self.average_frame.index) + \
+            ['', self.selected_ratios_row.index[0]]
+
+        # Combine ratios, averages and spacer rows into a single DataFrame, and update the cells that changed.
+        self.update_data(
+            data=pd.DataFrame(
+                data=values,
+                index=pd.Index(labels, dtype=object),
+                columns=self.df_ratio.columns
+            )
+        )
 
         return True
 
@@ -209,33 +194,49 @@ class FSelectionModel(FAbstractTableModel):
         else:
             return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
 
-    def calculate_averages(self) -> DataFrame:
+    def calculate_averages(
+            self,
+            out: Optional[np.ndarray] = None
+    ) -> DataFrame:
         """
         Applies the included averages to the ratio data frame. Each average type gets its own row. In this context,
         'included' means those averages indicated out of all the available averages to be calculated and looked at
         in the model.
+
+        All the averages are calculated together by a RatioAverageEngine.
+
+        Parameters
+        ----------
+        out: Optional[np.ndarray]
+            An array, with one row per included average, to write the averages into.
         """
 
-        average_frame = pd.DataFrame()
+        included_averages = self.included_averages
 
-        for i in range(self.num_average_types):
-            # For each average, extract the metadata.
-            average_name = self.included_averages['Label'].iloc[i]
-            average_years = int(self.included_averages['Number of Years'].iloc[i])
-            average_type = self.included_averages['Type'].iloc[i]
+        if included_averages is None:
+            return pd.DataFrame()
 
-            # Use the metadata as inputs to calculate the specific type of average.
-            average_row: DataFrame = self.calculate_average(
-                average_name=average_name,
-                average_years=average_years,
-                average_type=average_type
-            )
+        engine = RatioAverageEngine(
+            ratios=self.df_ratio.to_numpy(dtype=float),
+            weights=self.ratio_weights
+        )
 
-            # Initialize the DataFrame containing the averages to the first result, and then append with the rest.
-            if i == 0:
-                average_frame = average_row
-            else:
-                average_frame = pd.concat([average_frame, average_row])
+        averages = engine.averages(
+            averages=[
+                (average_type, int(average_years)) for average_type, average_years in zip(
+                    included_averages['Type'],
+                    included_averages['Number of Years']
+                )
+            ],
+            out=out
+        )
+
+        average_frame = pd.DataFrame(
+            data=averages,
+            index=pd.Index(included_averages['Label'].tolist(), name=self.df_ratio.index.name),
+            columns=self.df_ratio.columns,
+            copy=False
+        )
 
         return average_frame
 
@@ -259,24 +260,16 @@ class FSelectionModel(FAbstractTableModel):
             not display.
         """
 
-        averages = []
-        if average_type == 'Straight':
-            for col in self.df_ratio.columns:
-                col_average = self.df_ratio[col].tail(average_years).mean()
-                averages += [col_average]
-        elif average_type == 'Medial':
-            # Straight average excluding the high and low values.
-            for col in self.df_ratio.columns:
-                ratios = list(self.df_ratio[col].tail(average_years))
-                ratios.sort()
-                ratios = ratios[1:-1]
-                col_average = np.mean(ratios)
-                averages += [col_average]
-        dict_avg = {col: [avg] for col, avg in zip(self.df_ratio.columns, averages)}
-        dict_avg[self.df_ratio.index.name] = [average_name]
-
-        df_avg = pd.DataFrame(data=dict_avg)
-        df_avg = df_avg.set_index(self.df_ratio.index.name)
+        engine = RatioAverageEngine(
+            ratios=self.df_ratio.to_numpy(dtype=float),
+            weights=self.ratio_weights
+        )
+
+        df_avg = pd.DataFrame(
+            data=engine.averages(averages=[(average_type, average_years)]),
+            index=pd.Index([average_name], name=self.df_ratio.index.name),
+            columns=self.df_ratio.columns
+        )
 
         return df_avg
 
@@ -320,6 +313,14 @@ class FSelectionModel(FAbstractTableModel):
             model.setData(index=QModelIndex(), role=Qt.ItemDataRole.EditRole, value=None)
 
 
+    @property
+    def ratio_weights(self) -> np.ndarray | None:
+        """
+        The volumes behind the ratios, used for volume-weighted averages, e.g., the premiums behind loss ratios. By
+        default, there are none, and volume-weighted averages are straight averages.
+        """
+        return None
+
     @property
     def n_ratio_rows(self) -> int:
         """
@@ -0,0 +1,94 @@
+"""
+Runs long tasks on the global thread pool so that the GUI stays responsive.
+"""
+from __future__ import annotations
+
+import logging
+
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal
+)
+
+from typing import Callable
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by an FWorker. They are delivered to slots on the GUI thread.
+    """
+    progress = pyqtSignal(int)
+    result = pyqtSignal(object)
+    error = pyqtSignal(object)
+    cancelled = pyqtSignal()
+
+
+class FWorker(QRunnable):
+    """
+    Runs a function on a worker thread. The function is passed two extra keyword arguments, progress_callback, which
+    it can call with a percentage complete, and is_cancelled, which it should poll and stop when it returns True.
+
+    Exactly one of the result, error, or cancelled signals is emitted when the function ends.
+
+    Parameters
+    ----------
+    fn: Callable
+        The function to run.
+    args
+        Positional arguments passed to fn.
+    kwargs
+        Keyword arguments passed to fn.
+    """
+    def __init__(
+            self,
+            fn: Callable,
+            *args,
+            **kwargs
+    ):
+        super().__init__()
+
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancelled = False
+
+    def run(self) -> None:
+
+        try:
+            result = self.fn(
+                *self.args,
+                progress_callback=self.signals.progress.emit,
+                is_cancelled=self.is_cancelled,
+                **self.kwargs
+            )
+        except Exception as e:
+            # A function that stops early because it was cancelled may do so by raising.
+            if self._cancelled:
+                self.signals.cancelled.emit()  # noqa
+            else:
+                logging.exception("Background task failed.")
+                self.signals.error.emit(e)  # noqa
+        else:
+            if self._cancelled:
+                self.signals.cancelled.emit()  # noqa
+            else:
+                self.signals.result.emit(result)  # noqa
+
+    def cancel(self) -> None:
+        """
+        Asks the function to stop. The worker emits cancelled once it does.
+        """
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+
+        return self._cancelled
+
+    def start(self) -> None:
+        """
+        Queues the worker on the global thread pool.
+        """
+        QThreadPool.globalInstance().start(self)
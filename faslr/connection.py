@@ -2,11 +2,18 @@ from __future__ import annotations
 import configparser
 import logging
 import os
+import threading
+import time
 import faslr.schema as schema
 import sqlalchemy as sa
 
+from contextlib import contextmanager
+
 from faslr.constants import (
+    DB_MAX_OVERFLOW,
     DB_NOT_FOUND_TEXT,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
     DEFAULT_DIALOG_PATH,
     QT_FILEPATH_OPTION
 )
@@ -16,11 +23,15 @@ import faslr.core as core
 from faslr.schema import (
     CountryTable,
     LOBTable,
-    LocationTable,
     StateTable,
 )
 
-from faslr.project_item import ProjectItem
+from faslr.project_item import (
+    ProjectItem,
+    get_project_text_color
+)
+
+from faslr.utilities.fit_cache import configure_fit_cache
 
 from PyQt6.QtCore import QEvent
 
@@ -38,17 +49,29 @@ from PyQt6.QtWidgets import (
 
 )
 
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import (
+    scoped_session,
+    sessionmaker
+)
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy import event
 from sqlalchemy.orm.session import Session
 from sqlalchemy.engine.base import Connection
+from sqlalchemy.pool import QueuePool
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from faslr.__main__ import MainWindow
     from faslr.menu import MainMenuBar
+    from faslr.project import ProjectModel
+    from typing import (
+        Callable,
+        ContextManager,
+        Iterator,
+        Optional
+    )
 
 
 class ConnectionDialog(QDialog):
@@ -113,6 +136,12 @@ class ConnectionDialog(QDialog):
         elif self.new_connection.isChecked():
             core.db = self.create_new_db()
 
+            # Existing databases are configured when their project tree is populated.
+            configure_fit_cache(
+                db_path=core.db,
+                persist=core.fit_cache_persist
+            )
+
     def create_new_db(
             self
     ) -> str:
@@ -141,14 +170,12 @@ class ConnectionDialog(QDialog):
             os.remove(db_filename)
 
         if not db_filename == "":
-            engine = sa.create_engine(
-                'sqlite:///' + filename[0],
-                echo=True
-            )
+            # Drop any pooled connections to a file that has just been replaced.
+            engine_registry.dispose(db_path=db_filename)
+
+            engine = engine_registry.get_engine(db_path=db_filename)
 
             schema.Base.metadata.create_all(engine)
-            connection = engine.connect()
-            connection.close()
 
             self.close()
 
@@ -217,114 +244,690 @@ def populate_project_tree(
     main window based on what projects have been saved to the database.
     """
 
-    # Open up the connection to the database
-    session, connection = connect_db(db_path=db_filename)
+    # Large databases are loaded lazily, so only expand the tree if it has been loaded in full.
+    main_window.project_model.load(db_path=db_filename)
+    main_window.project_pane.expand_project_tree()
+
+    configure_fit_cache(
+        db_path=db_filename,
+        persist=core.fit_cache_persist
+    )
+
+    main_window.connection_established = True
+    main_window.db = db_filename
+    main_window.menu_bar.toggle_project_actions()
+
+
+def project_filter_clauses(name_filter: str) -> (ColumnElement, ColumnElement, ColumnElement):
+    """
+    Builds the WHERE clauses that restrict each level of the project hierarchy to segments whose name contains
+    name_filter (case-insensitive), keeping the ancestors of a matching segment and the descendants of a matching
+    country or state so that matches are shown in context.
+
+    Returns
+    -------
+    A tuple of clauses for the country, state and LOB queries. The state clause expects CountryTable to be joined,
+    and the LOB clause expects both CountryTable and StateTable to be joined.
+    """
+    pattern = '%' + name_filter + '%'
+
+    # Independent subqueries, not correlated with the tables of the enclosing query.
+    lob_match = sa.select(
+        StateTable.state_id
+    ).join(
+        LOBTable,
+        LOBTable.location_id == StateTable.location_id
+    ).where(
+        LOBTable.lob_type.like(pattern)
+    ).correlate(None)
+
+    state_match = sa.select(
+        StateTable.state_id
+    ).where(
+        sa.or_(
+            StateTable.state_name.like(pattern),
+            StateTable.state_id.in_(lob_match)
+        )
+    ).correlate(None)
+
+    country_match = sa.select(
+        StateTable.country_id
+    ).where(
+        StateTable.state_id.in_(state_match)
+    ).correlate(None)
+
+    country_clause = sa.or_(
+        CountryTable.country_name.like(pattern),
+        CountryTable.country_id.in_(country_match)
+    )
+
+    state_clause = sa.or_(
+        CountryTable.country_name.like(pattern),
+        StateTable.state_id.in_(state_match)
+    )
+
+    lob_clause = sa.or_(
+        CountryTable.country_name.like(pattern),
+        StateTable.state_name.like(pattern),
+        LOBTable.lob_type.like(pattern)
+    )
+
+    return country_clause, state_clause, lob_clause
 
-    # Query all the countries
-    countries = session.query(
+
+def query_countries(
+        session: Session,
+        name_filter: Optional[str] = None
+) -> list:
+    """
+    Returns the (country_id, country_name, project_id) of each country in the database, optionally filtered by name.
+    """
+    query = session.query(
         CountryTable.country_id,
         CountryTable.country_name,
         CountryTable.project_id
-    ).all()
+    )
+
+    if name_filter:
+        query = query.filter(project_filter_clauses(name_filter)[0])
+
+    return query.order_by(CountryTable.country_id).all()
+
+
+def query_states(
+        session: Session,
+        country_id: Optional[int] = None,
+        name_filter: Optional[str] = None
+) -> list:
+    """
+    Returns the (country_id, state_id, state_name, project_id) of the states of one country, or of all countries if
+    country_id is None, optionally filtered by name.
+    """
+    query = session.query(
+        StateTable.country_id,
+        StateTable.state_id,
+        StateTable.state_name,
+        StateTable.project_id
+    )
+
+    if country_id is not None:
+        query = query.filter(StateTable.country_id == country_id)
+
+    if name_filter:
+        query = query.join(
+            CountryTable,
+            CountryTable.country_id == StateTable.country_id
+        ).filter(
+            project_filter_clauses(name_filter)[1]
+        )
+
+    return query.order_by(StateTable.state_id).all()
+
+
+def query_lobs(
+        session: Session,
+        state_id: Optional[int] = None,
+        name_filter: Optional[str] = None
+) -> list:
+    """
+    Returns the (state_id, lob_type, project_id) of the LOBs of one state, or of all states if state_id is None,
+    optionally filtered by name.
+    """
+    # LOBs share the location of the state they belong to.
+    query = session.query(
+        StateTable.state_id,
+        LOBTable.lob_type,
+        LOBTable.project_id
+    ).join(
+        StateTable,
+        StateTable.location_id == LOBTable.location_id
+    )
 
-    # Append each row one at a time, brute force method. For each country, add state rows, and
-    # for each state, add LOB rows.
+    if state_id is not None:
+        query = query.filter(StateTable.state_id == state_id)
+
+    if name_filter:
+        query = query.join(
+            CountryTable,
+            CountryTable.country_id == StateTable.country_id
+        ).filter(
+            project_filter_clauses(name_filter)[2]
+        )
+
+    return query.order_by(LOBTable.lob_id).all()
+
+
+def count_project_segments(session: Session) -> int:
+    """
+    Returns the total number of countries, states and LOBs in the database, using a single query.
+    """
+    counts = session.execute(
+        sa.select(
+            *[
+                sa.select(sa.func.count()).select_from(table).scalar_subquery()
+                for table in [CountryTable, StateTable, LOBTable]
+            ]
+        )
+    ).one()
+
+    return sum(counts)
+
+
+def query_project_tree(
+        session: Session,
+        name_filter: Optional[str] = None
+) -> (list, dict, dict):
+    """
+    Fetches the whole country/state/LOB hierarchy using three set-based queries, one per level, regardless of how
+    many segments are in the database.
+
+    Parameters
+    ----------
+    session: Session
+        An open session against the project database.
+    name_filter: Optional[str]
+        If given, only segments whose name, or the name of an ancestor or descendant, contains this text are
+        returned.
+
+    Returns
+    -------
+    A tuple (countries, states, lobs). countries is a list of (country_id, country_name, project_id) tuples. states
+    maps each country_id to its (state_id, state_name, project_id) tuples. lobs maps each state_id to its
+    (lob_type, project_id) tuples.
+    """
+    countries = query_countries(
+        session=session,
+        name_filter=name_filter
+    )
+
+    states = {}
+    for country_id, state_id, state_name, state_uuid in query_states(session=session, name_filter=name_filter):
+        states.setdefault(country_id, []).append((state_id, state_name, state_uuid))
+
+    lobs = {}
+    for state_id, lob_type, lob_uuid in query_lobs(session=session, name_filter=name_filter):
+        lobs.setdefault(state_id, []).append((lob_type, lob_uuid))
+
+    return countries, states, lobs
+
+
+def build_project_rows(
+        countries: list,
+        states: dict,
+        lobs: dict,
+        fetched: bool = True
+) -> list:
+    """
+    Assembles the project tree in memory from the output of query_project_tree. Children are appended to their
+    parents before anything is attached to a model, so building the tree emits no model signals. The items do not
+    track theme changes themselves; the ProjectModel they are attached to does that for them.
+
+    Parameters
+    ----------
+    countries: list
+        (country_id, country_name, project_id) tuples.
+    states: dict
+        Lists of (state_id, state_name, project_id) tuples, keyed by country_id.
+    lobs: dict
+        Lists of (lob_type, project_id) tuples, keyed by state_id.
+    fetched: bool
+        Whether states and lobs hold every child of the countries and states. Pass False when building only the top
+        of a lazily loaded tree, so that the ProjectModel fetches the children when they are expanded.
+
+    Returns
+    -------
+    A list of [ProjectItem, QStandardItem] rows, one per country, each holding its states and LOBs.
+    """
+    country_rows = []
+
+    # Look up the theme once rather than once per item.
+    text_color = get_project_text_color()
 
     for country_id, country, country_uuid in countries:
 
         country_item = ProjectItem(
             text=country,
             segment_level='country',
-            set_bold=True
+            set_bold=True,
+            text_color=text_color,
+            follow_theme=False,
+            segment_id=country_id,
+            children_fetched=fetched
         )
 
-        country_row = [
-            country_item,
-            QStandardItem(country_uuid)
-        ]
+        for state_row in build_state_rows(
+            states=states.get(country_id, []),
+            lobs=lobs,
+            fetched=fetched,
+            text_color=text_color
+        ):
+            country_item.appendRow(state_row)
 
-        states = session.query(
-            StateTable.state_id,
-            StateTable.state_name,
-            StateTable.project_id
-        ).filter(
-            StateTable.country_id == country_id
+        country_rows.append([country_item, QStandardItem(country_uuid)])
+
+    return country_rows
+
+
+def build_state_rows(
+        states: list,
+        lobs: dict,
+        fetched: bool = True,
+        text_color: Optional[QColor] = None
+) -> list:
+    """
+    Builds the rows of the states of a single country, along with their LOBs. See build_project_rows.
+    """
+    text_color = text_color or get_project_text_color()
+
+    state_rows = []
+
+    for state_id, state, state_uuid in states:
+
+        state_item = ProjectItem(
+            text=state,
+            segment_level='state',
+            text_color=text_color,
+            follow_theme=False,
+            segment_id=state_id,
+            children_fetched=fetched
         )
 
-        for state_id, state, state_uuid in states:
+        for lob_row in build_lob_rows(
+            lobs=lobs.get(state_id, []),
+            text_color=text_color
+        ):
+            state_item.appendRow(lob_row)
 
-            state_item = ProjectItem(
-                text=state,
-                segment_level='state'
-            )
+        state_rows.append([state_item, QStandardItem(state_uuid)])
 
-            state_row = [state_item, QStandardItem(state_uuid)]
+    return state_rows
 
-            lobs = session.query(
-                LOBTable.lob_type, LOBTable.project_id
-            ).join(
-                LocationTable
-            ).join(
-                StateTable
-            ).filter(
-                StateTable.state_id == state_id
+
+def build_lob_rows(
+        lobs: list,
+        text_color: Optional[QColor] = None
+) -> list:
+    """
+    Builds the rows of the LOBs of a single state. See build_project_rows.
+    """
+    text_color = text_color or get_project_text_color()
+
+    return [
+        [
+            ProjectItem(
+                text=lob,
+                segment_level='lob',
+                text_color=text_color,
+                follow_theme=False
+            ),
+            QStandardItem(lob_uuid)
+        ] for lob, lob_uuid in lobs
+    ]
+
+
+def populate_project_model(
+        session: Session,
+        project_model: ProjectModel,
+        name_filter: Optional[str] = None,
+        lazy: bool = False
+) -> None:
+    """
+    Replaces the contents of the project model with the hierarchy stored in the database. The tree is queried and
+    built up front and then attached with the model's signals blocked, followed by a single reset so that attached
+    views redraw once rather than once per row. If lazy is True, only the countries are loaded, and the model fetches
+    states and LOBs as they are expanded.
+    """
+    if lazy:
+        country_rows = build_project_rows(
+            countries=query_countries(
+                session=session,
+                name_filter=name_filter
+            ),
+            states={},
+            lobs={},
+            fetched=False
+        )
+    else:
+        country_rows = build_project_rows(
+            *query_project_tree(
+                session=session,
+                name_filter=name_filter
             )
+        )
+
+    project_model.blockSignals(True)
+    try:
+        project_model.removeRows(0, project_model.rowCount())
+        for country_row in country_rows:
+            project_model.project_root.appendRow(country_row)
+    finally:
+        project_model.blockSignals(False)
 
-            for lob, lob_uuid in lobs:
-                lob_item = ProjectItem(
-                    lob,
-                    segment_level='lob'
+    project_model.beginResetModel()
+    project_model.endResetModel()
+
+
+class EngineRegistry:
+    """
+    Process-wide registry of SQLAlchemy engines, one per database path. Engines are created on first use and then
+    reused, so that repeated opens of the same database share a single bounded connection pool instead of paying for
+    engine construction on every query.
+
+    Parameters
+    ----------
+    pool_size: int
+        The number of connections kept open in each pool.
+    max_overflow: int
+        The number of connections allowed beyond pool_size when the pool is exhausted.
+    pool_timeout: int
+        Seconds to wait for a connection to be returned to an exhausted pool before giving up.
+    echo: Optional[bool]
+        Passed to the engine. The default of None leaves SQL echo to the 'sqlalchemy.engine' logger, so that it can
+        be switched on or off through the logging configuration.
+    """
+    def __init__(
+            self,
+            pool_size: int = DB_POOL_SIZE,
+            max_overflow: int = DB_MAX_OVERFLOW,
+            pool_timeout: int = DB_POOL_TIMEOUT,
+            echo: Optional[bool] = None
+    ):
+
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.echo = echo
+
+        self._engines: dict[str, Engine] = {}
+        self._session_factories: dict[str, sessionmaker] = {}
+        self._scoped_sessions: dict[str, scoped_session] = {}
+        self._session_listeners: list[tuple[str, Callable]] = []
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'engines_created': 0,
+            'checkouts': 0,
+            'wait_time': 0.0
+        }
+
+    @staticmethod
+    def _key(db_path: str) -> str:
+        """
+        Normalizes a database path so that relative and absolute references to the same file share an engine.
+        """
+        return os.path.abspath(db_path)
+
+    def get_engine(
+            self,
+            db_path: str
+    ) -> Engine:
+        """
+        Returns the engine for the database, creating it if this is the first request for that path.
+        """
+        key = self._key(db_path)
+
+        with self._lock:
+            engine = self._engines.get(key)
+
+            if engine is None:
+                engine = sa.create_engine(
+                    'sqlite:///' + key,
+                    echo=self.echo,
+                    poolclass=QueuePool,
+                    pool_size=self.pool_size,
+                    max_overflow=self.max_overflow,
+                    pool_timeout=self.pool_timeout,
+                    connect_args={
+                        'check_same_thread': False
+                    }
                 )
 
-                lob_row = [lob_item, QStandardItem(lob_uuid)]
+                event.listen(engine, 'checkout', self._count_checkout)
 
-                state_item.appendRow(lob_row)
+                self._engines[key] = engine
+                self.stats['engines_created'] += 1
 
-            country_item.appendRow(state_row)
+                logging.info("Engine created for " + key)
 
-        main_window.project_model.project_root.appendRow(country_row)
+        return engine
 
-    main_window.project_pane.expandAll()
+    def _count_checkout(
+            self,
+            dbapi_connection,
+            connection_record,
+            connection_proxy
+    ) -> None:
 
-    connection.close()
+        self.stats['checkouts'] += 1
 
-    main_window.connection_established = True
-    main_window.db = db_filename
-    main_window.menu_bar.toggle_project_actions()
+    def get_session_factory(
+            self,
+            db_path: str
+    ) -> sessionmaker:
+        """
+        Returns the sessionmaker bound to the database's engine.
+        """
+        key = self._key(db_path)
 
+        factory = self._session_factories.get(key)
 
-class FaslrConnection:
-    def __init__(
+        if factory is None:
+            factory = sessionmaker(bind=self.get_engine(db_path=key))
+
+            for identifier, fn in self._session_listeners:
+                event.listen(factory, identifier, fn)
+
+            self._session_factories[key] = factory
+
+        return factory
+
+    def listen_sessions(
+            self,
+            identifier: str,
+            fn: Callable
+    ) -> None:
+        """
+        Registers a session event listener, e.g., for 'do_orm_execute', on the sessionmaker of every database, including
+        those created later. Unlike a listener on the Session class, it only sees sessions opened through the
+        registry.
+        """
+        self._session_listeners.append((identifier, fn))
+
+        for factory in self._session_factories.values():
+            event.listen(factory, identifier, fn)
+
+    def get_scoped_session(
             self,
             db_path: str
-    ):
+    ) -> scoped_session:
+        """
+        Returns a thread-local session registry for the database, for callers that hold a session for the lifetime
+        of a widget rather than a single unit of work.
+        """
+        key = self._key(db_path)
 
-        if not os.path.isfile(db_path):
-            raise FileNotFoundError(DB_NOT_FOUND_TEXT)
+        scoped = self._scoped_sessions.get(key)
 
-        self.engine = sa.create_engine(
-            'sqlite:///' + db_path,
-            echo=True
-        )
-        self.raw_connection = self.engine.raw_connection()
+        if scoped is None:
+            scoped = scoped_session(self.get_session_factory(db_path=key))
+            self._scoped_sessions[key] = scoped
+
+        return scoped
+
+    def connect(
+            self,
+            db_path: str
+    ) -> Connection:
+        """
+        Checks a connection out of the database's pool, recording how long the checkout waited.
+        """
+        check_db_path(db_path=db_path)
+
+        engine = self.get_engine(db_path=db_path)
+
+        start = time.perf_counter()
+        connection = engine.connect()
+        self.stats['wait_time'] += time.perf_counter() - start
+
+        return connection
+
+    @contextmanager
+    def session_scope(
+            self,
+            db_path: str,
+            pragmas: Optional[dict] = None
+    ) -> Iterator[Session]:
+        """
+        Unit of work against the database. Yields a session bound to a single pooled connection, commits when the
+        block exits normally, rolls back if it raises, and returns the connection to the pool either way.
+
+        SQLite pragmas given in pragmas, e.g., {'synchronous': 'OFF'}, are set before the unit of work begins and
+        restored to their previous values afterwards, so that they do not leak to other users of the pooled
+        connection.
+        """
+        connection = self.connect(db_path=db_path)
+
+        previous_pragmas = set_pragmas(
+            connection=connection,
+            pragmas=pragmas
+        ) if pragmas else None
+
+        session = self.get_session_factory(db_path=db_path)(bind=connection)
+
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+            if previous_pragmas:
+                set_pragmas(
+                    connection=connection,
+                    pragmas=previous_pragmas
+                )
+            connection.close()
+
+    def dispose(
+            self,
+            db_path: Optional[str] = None
+    ) -> None:
+        """
+        Closes the pooled connections of one database, or of every database if no path is given.
+        """
+        with self._lock:
+            if db_path is None:
+                keys = list(self._engines.keys())
+            else:
+                keys = [self._key(db_path)]
+
+            for key in keys:
+                scoped = self._scoped_sessions.pop(key, None)
+                if scoped is not None:
+                    scoped.remove()
+
+                self._session_factories.pop(key, None)
+
+                engine = self._engines.pop(key, None)
+                if engine is not None:
+                    engine.dispose()
+
+    def reset_stats(self) -> None:
+
+        self.stats['engines_created'] = 0
+        self.stats['checkouts'] = 0
+        self.stats['wait_time'] = 0.0
 
-        self.session = sessionmaker(bind=self.engine)()
-        self.connection = self.engine.connect()
 
+# Shared by the whole application.
+engine_registry = EngineRegistry()
 
-def connect_db(db_path: str) -> (Session, Connection):
+
+def check_db_path(db_path: str) -> None:
     """
-    Connects the db. Shortens amount of code required to do so.
+    Raises an error if the database does not exist, rather than letting sqlite silently create an empty one.
     """
-    print(db_path)
-    if not os.path.isfile(db_path):
+    if (db_path is None) or (not os.path.isfile(db_path)):
         raise FileNotFoundError(DB_NOT_FOUND_TEXT)
 
-    engine = sa.create_engine(
-        'sqlite:///' + db_path,
-        echo=True
+
+def session_scope(
+        db_path: str,
+        pragmas: Optional[dict] = None
+) -> ContextManager[Session]:
+    """
+    Unit of work against the database, using the application's engine registry. Usage:
+
+    with session_scope(db_path=core.db) as session:
+        ...
+
+    See EngineRegistry.session_scope for the pragmas argument.
+    """
+    return engine_registry.session_scope(
+        db_path=db_path,
+        pragmas=pragmas
     )
-    session = sessionmaker(bind=engine)()
-    connection = engine.connect()
-    return session, connection
 
+
+def set_pragmas(
+        connection: Connection,
+        pragmas: dict
+) -> dict:
+    """
+    Sets SQLite pragmas on a connection and returns their previous values. Some pragmas, such as synchronous and
+    journal_mode, cannot be changed inside a transaction, so this must be called while the connection is idle.
+    """
+    previous = {}
+
+    for name, value in pragmas.items():
+        previous[name] = connection.exec_driver_sql("PRAGMA " + name).scalar()
+        connection.exec_driver_sql("PRAGMA " + name + "=" + str(value))
+
+    # Pragma statements do not open a database transaction, but end the one SQLAlchemy began implicitly.
+    connection.commit()
+
+    return previous
+
+
+class FaslrConnection:
+    """
+    Holds a session, a connection, and a raw DBAPI connection checked out from the engine registry's pool. They are
+    returned to the pool by close(), or on leaving a with block:
+
+    with FaslrConnection(db_path=core.db) as faslr_connection:
+        ...
+    """
+    def __init__(
+            self,
+            db_path: str
+    ):
+
+        check_db_path(db_path=db_path)
+
+        self.engine = engine_registry.get_engine(db_path=db_path)
+        self.raw_connection = self.engine.raw_connection()
+
+        self.session = engine_registry.get_session_factory(db_path=db_path)()
+        self.connection = engine_registry.connect(db_path=db_path)
+
+    def __enter__(self) -> FaslrConnection:
+
+        return self
+
+    def __exit__(
+            self,
+            exc_type,
+            exc_value,
+            traceback
+    ) -> None:
+
+        self.close()
+
+    def close(self) -> None:
+        """
+        Returns all connections held by this object to the pool.
+        """
+        self.session.close()
+        self.connection.close()
+        self.raw_connection.close()
@@ -1,14 +1,30 @@
 from faslr.constants.analysis import (
+    SAMPLE_TRIANGLES,
     VALUE_TYPES,
     VALUE_TYPES_COMBO_BOX_WIDTH
 )
 
 from faslr.constants.connection import (
-    DB_NOT_FOUND_TEXT
+    DB_MAX_OVERFLOW,
+    DB_NOT_FOUND_TEXT,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    INGEST_CHUNK_SIZE,
+    SQLITE_BULK_PRAGMAS
+)
+
+from faslr.constants.data import (
+    CSV_CHUNK_SIZE,
+    CSV_PREVIEW_ROWS,
+    CSV_SAMPLE_ROWS,
+    PREVIEW_DEBOUNCE_MS
 )
 
 from faslr.constants.development import (
+    HEATMAP_CACHE_SIZE,
+    LDF_AVERAGE_EXPONENTS,
     LDF_AVERAGES,
+    LDF_VALUATION_OFFSETS,
     TEMP_LDF_LIST
 )
 
@@ -17,6 +33,15 @@ from faslr.constants.diagnostics import (
     MACK_VALUATION_CRITICAL
 )
 
+from faslr.constants.expected_loss import (
+    TREND_CACHE_SIZE
+)
+
+from faslr.constants.fit_cache import (
+    FIT_CACHE_DIRECTORY_SUFFIX,
+    FIT_CACHE_MAX_BYTES
+)
+
 from faslr.constants.settings import (
     SETTINGS_LIST
 )
@@ -49,6 +74,11 @@ from faslr.constants.model import (
     BASE_MODEL_AVERAGES
 )
 
+from faslr.constants.project import (
+    PROJECT_TREE_CACHE_SIZE,
+    PROJECT_TREE_EAGER_LIMIT
+)
+
 from faslr.constants.role import (
     ColumnSpanRole,
     RowSpanRole,
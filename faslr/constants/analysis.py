@@ -5,3 +5,9 @@ VALUE_TYPES = [
 ]
 
 VALUE_TYPES_COMBO_BOX_WIDTH = 110
+
+# Sample triangles that Help > Sample Triangles opens in analysis tabs, keyed by tab title.
+SAMPLE_TRIANGLES = {
+    'Auto': 'us_industry_auto',
+    'XYZ': 'uspp_incr_case'
+}
@@ -1 +1,16 @@
 DB_NOT_FOUND_TEXT = "Invalid database path specified. File does not exist."
+
+# Connection pool settings for the engines held by the EngineRegistry. Each database path gets its own pool.
+DB_POOL_SIZE = 5
+DB_MAX_OVERFLOW = 10
+DB_POOL_TIMEOUT = 30
+
+# Number of rows written per executemany call when bulk loading data into the database.
+INGEST_CHUNK_SIZE = 50000
+
+# SQLite settings used while bulk loading. The rollback journal is kept in memory and the database file is not synced
+# after each write. The previous settings are restored once the load finishes.
+SQLITE_BULK_PRAGMAS = {
+    'journal_mode': 'MEMORY',
+    'synchronous': 'OFF'
+}
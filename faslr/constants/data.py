@@ -0,0 +1,11 @@
+# Number of rows read from an uploaded file to populate the import wizard, i.e., the header mapping and sample view.
+CSV_SAMPLE_ROWS = 1000
+
+# Number of sample rows shown in the import wizard's file data view.
+CSV_PREVIEW_ROWS = 5
+
+# Number of rows per chunk when reading the remainder of an uploaded file in the background.
+CSV_CHUNK_SIZE = 100000
+
+# Milliseconds the import wizard waits after the last change before rebuilding the triangle preview.
+PREVIEW_DEBOUNCE_MS = 200
@@ -1,5 +1,3 @@
-import pandas as pd
-
 LDF_AVERAGES = {
             # 'Geometric': 'geometric',
             # 'Medial': 'medial',
@@ -8,13 +6,33 @@ LDF_AVERAGES = {
             'Volume': 'volume'
 }
 
-TEMP_LDF_LIST = pd.DataFrame(
-    data=[
-        [True, "All-year volume-weighted", "Volume", "9"],
-        [False, "3-year volume-weighted", "Volume", "3"],
-        [False, "5-year volume-weighted", "Volume", "5"],
-    ],
-    columns=["Selected", "Label", "Type", "Number of Years"]
-)
+# The columns of the LDF average table a FactorModel starts with. Kept as plain lists so that importing the constants
+# does not import pandas.
+TEMP_LDF_LIST = {
+    "Selected": [True, False, False],
+    "Label": ["All-year volume-weighted", "3-year volume-weighted", "5-year volume-weighted"],
+    "Type": ["Volume", "Volume", "Volume"],
+    "Number of Years": ["9", "3", "5"]
+}
+
+
 
+# Number of sets of heatmap colors a FactorModel keeps, one per colormap and set of excluded link ratios.
+HEATMAP_CACHE_SIZE = 16
 
+# Exponent of the starting losses in the weights of each type of LDF average, as in chainladder. The factor for a
+# development period is sum(w * x ** (1 - e) * y) / sum(w * x ** (2 - e)).
+LDF_AVERAGE_EXPONENTS = {
+    'regression': 0,
+    'volume': 1,
+    'simple': 2
+}
+
+# Number of valuation dates per origin period, by development grain and origin grain. Used to convert an LDF
+# average's number of periods into a number of diagonals.
+LDF_VALUATION_OFFSETS = {
+    'Y': {'Y': 1},
+    'S': {'Y': 2, 'S': 1},
+    'Q': {'Y': 4, 'S': 2, 'Q': 1},
+    'M': {'Y': 12, 'S': 6, 'Q': 3, 'M': 1}
+}
@@ -1,3 +1,6 @@
+# Number of composed trends kept by ExpectedLossRatioModel, shared between models.
+TREND_CACHE_SIZE = 32
+
 EXPECTED_LOSS_RATIO_AVERAGES = {
             'Geometric': 'geometric',
             'Medial': 'medial', # latest x years excluding high low
@@ -0,0 +1,5 @@
+# Memory budget of the fitted model cache. The least recently used fits are evicted beyond it.
+FIT_CACHE_MAX_BYTES = 64 * 1024 ** 2
+
+# Fits saved to disk go in a directory next to the database, named after it with this suffix.
+FIT_CACHE_DIRECTORY_SUFFIX = '.fitcache'
@@ -0,0 +1,6 @@
+# Databases with at most this many project segments (countries, states and LOBs) are loaded and expanded in full on
+# connection. Larger ones load the countries only and fetch states and LOBs as they are expanded.
+PROJECT_TREE_EAGER_LIMIT = 1000
+
+# The number of fetched subtrees (the children of a country or state) a lazily loaded project tree keeps in memory.
+PROJECT_TREE_CACHE_SIZE = 256
@@ -2,5 +2,6 @@ SETTINGS_LIST = [
     "Startup",
     "User",
     "Plots",
-    "Display"
+    "Display",
+    "Cache"
 ]
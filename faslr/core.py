@@ -17,6 +17,19 @@ def get_startup_db_path(
     return startup_db
 
 
+def get_fit_cache_persist(
+        config_path: str = CONFIG_PATH
+) -> bool:
+    """
+    Extracts whether fitted models are saved next to the database. Configuration files written before the fit cache
+    existed do not have the setting, in which case fits are kept in memory only.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_path)
+
+    return config.getboolean('FIT_CACHE', 'persist', fallback=False)
+
+
 config_path: str = CONFIG_PATH
 
 use_sample = False
@@ -37,6 +50,8 @@ if os.path.isfile(config_path):
 else:
     startup_db: None = None
 
+fit_cache_persist: bool = get_fit_cache_persist(config_path=config_path)
+
 def set_db(path: str) -> None:
     global db
     db = path
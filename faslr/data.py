@@ -4,6 +4,7 @@ from chainladder import Triangle
 import datetime as dt
 import numpy as np
 import pandas as pd
+import time
 
 from faslr.analysis import AnalysisTab
 
@@ -12,8 +13,10 @@ from faslr.base_table import (
     FTableView
 )
 
+from faslr.common.worker import FWorker
+
 from faslr.connection import (
-    FaslrConnection
+    session_scope
 )
 
 import faslr.core as core
@@ -21,14 +24,31 @@ import faslr.core as core
 from faslr.constants import (
     DEVELOPMENT_FIELDS,
     GRAINS,
+    CSV_PREVIEW_ROWS,
+    CSV_SAMPLE_ROWS,
     ICONS_PATH,
+    INGEST_CHUNK_SIZE,
     LOSS_FIELDS,
     ORIGIN_FIELDS,
+    PREVIEW_DEBOUNCE_MS,
     QT_FILEPATH_OPTION,
-    SAMPLE_DIALOG_PATH
+    SAMPLE_DIALOG_PATH,
+    SQLITE_BULK_PRAGMAS
+)
+
+from faslr.utilities import (
+    aggregate_triangle_data,
+    bulk_insert,
+    open_item_tab
+)
+
+from faslr.utilities.csv_reader import (
+    infer_dtypes,
+    read_csv_chunked,
+    sample_csv
 )
 
-from faslr.utilities import open_item_tab
+from faslr.utilities.queries import load_view_triangle
 
 from faslr.schema import (
     ProjectViewTable,
@@ -37,11 +57,13 @@ from faslr.schema import (
 
 from PyQt6.QtCore import (
     QModelIndex,
-    Qt
+    Qt,
+    QTimer
 )
 
 from PyQt6.QtGui import (
     QAction,
+    QCloseEvent,
     QIcon
 )
 
@@ -56,6 +78,8 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMenu,
+    QMessageBox,
+    QProgressBar,
     QPushButton,
     QRadioButton,
     QTabWidget,
@@ -66,6 +90,7 @@ from PyQt6.QtWidgets import (
 
 from typing import (
     Any,
+    Callable,
     TYPE_CHECKING
 )
 
@@ -101,6 +126,13 @@ data_views_df = pd.DataFrame(
 
 COMBO_BOX_STARTING_WIDTH = 120
 
+# The columns of ProjectViewData that the mapped value columns of an import are stored in, in the order the value
+# columns appear in the file.
+VIEW_VALUE_COLUMNS = [
+    'paid_loss',
+    'reported_loss'
+]
+
 
 class DataPane(QWidget):
     """
@@ -120,6 +152,7 @@ class DataPane(QWidget):
         self.project_id = project_id
         self.triangle = None  # for testing purposes, will store triangle data in db later so remove once that is done
         self.data = None
+        self.save_worker = None
 
         self.layout = QVBoxLayout()
         self.upload_btn = QPushButton("Upload")
@@ -160,7 +193,8 @@ class DataPane(QWidget):
             triangle: Triangle
     ) -> None:
         """
-        Adds a data view record and saves data to the database.
+        Saves the uploaded data as a new data view on a worker thread. The data view record is added, and the import
+        wizard closed, once the save finishes.
 
         :param name: A human-readable label to identify the data view.
         :param desc: A longer description of the data view contents.
@@ -174,82 +208,98 @@ class DataPane(QWidget):
         self.triangle = triangle
         self.data = self.wizard.args_tab.data
 
-        view_id = self.save_to_db(
-            name=name,
-            description=desc,
-            created=created,
-            modified=modified
-        )
+        # Widgets are read here, on the GUI thread, since the save itself runs on a worker thread.
+        origin = self.wizard.args_tab.dropdowns['origin'].currentText()
+        development = self.wizard.args_tab.dropdowns['development'].currentText()
+
+        view = {
+            'name': name,
+            'description': desc,
+            'created': created,
+            'modified': modified,
+            'origin': origin,
+            'development': development,
+            'columns': ';'.join(self.wizard.preview_tab.columns),
+            'cumulative': self.wizard.preview_tab.cumulative,
+            'project_id': self.project_id
+        }
+
+        # Only the mapped columns of the file are read. Store them as origin, development, and then the value
+        # columns in the order they appear in the file.
+        value_columns = [
+            column for column in self.data.columns if column in self.wizard.preview_tab.columns
+        ]
 
-        test_record = [
-            view_id,
+        data = self.data[[origin, development] + value_columns].copy()
+
+        # The number of value columns is checked by the wizard before the import is accepted.
+        data.columns = [
+            'accident_year',
+            'calendar_year'
+        ] + VIEW_VALUE_COLUMNS
+
+        record = [
             name,
             desc,
             created,
             modified
         ]
 
-        self.data_model.add_record(record=test_record)
-
-    def save_to_db(
-            self,
-            name: str,
-            description: str,
-            created,
-            modified,
-    ):
+        worker = FWorker(
+            save_data_view,
+            db_path=core.db,
+            view=view,
+            data=data
+        )
 
-        faslr_conn = FaslrConnection(db_path=core.db)
-
-        project_view = ProjectViewTable(
-            name=name,
-            description=description,
-            created=created,
-            modified=modified,
-            origin=self.wizard.args_tab.dropdowns['origin'].currentText(),
-            development=self.wizard.args_tab.dropdowns['development'].currentText(),
-            columns=';'.join(self.wizard.preview_tab.columns),
-            cumulative=self.wizard.preview_tab.cumulative,
-            project_id=self.project_id
+        worker.signals.progress.connect(self.wizard.progress_bar.setValue)  # noqa
+        worker.signals.result.connect(  # noqa
+            lambda view_id, w=worker: self.finish_save(worker=w, view_id=view_id, record=record)
         )
+        worker.signals.error.connect(lambda error, w=worker: self.fail_save(worker=w, error=error))  # noqa
 
-        faslr_conn.session.add(project_view)
+        self.save_worker = worker
 
-        faslr_conn.session.flush()
-        view_id = project_view.view_id
+        self.wizard.set_saving(saving=True)
 
-        data = self.data.copy()
+        worker.start()
 
-        data.columns = [
-            'accident_year',
-            'calendar_year',
-            'paid_loss',
-            'reported_loss'
-        ]
+    def finish_save(
+            self,
+            worker: FWorker,
+            view_id: int,
+            record: list
+    ) -> None:
 
-        data['view_id'] = view_id
-        #
-        # data.to_sql(
-        #     name='project_view_data',
-        #     con=connection,
-        #     index=False,
-        #     if_exists='append'
-        # )
+        if worker is not self.save_worker:
+            return
+
+        self.save_worker = None
 
-        data_list = data.to_dict('records')
+        self.data_model.add_record(record=[view_id] + record)
 
-        obj_list = []
-        for record in data_list:
-            data_obj = ProjectViewData(**record)
-            obj_list.append(data_obj)
+        self.wizard.set_saving(saving=False)
+        self.wizard.close()
+
+    def fail_save(
+            self,
+            worker: FWorker,
+            error: Exception
+    ) -> None:
 
-        faslr_conn.session.add_all(obj_list)
+        if worker is not self.save_worker:
+            return
 
-        faslr_conn.session.commit()
+        self.save_worker = None
 
-        faslr_conn.connection.close()
+        # The transaction was rolled back, so nothing was saved and the import can be retried.
+        self.wizard.set_saving(saving=False)
 
-        return view_id
+        QMessageBox.warning(
+            self.wizard,
+            "Import Error",
+            "Unable to save the data:\n" + str(error)
+        )
 
 
 class DataImportWizard(QWidget):
@@ -305,6 +355,13 @@ class DataImportWizard(QWidget):
         self.button_box.accepted.connect(self.accept_import)  # noqa
         self.button_box.rejected.connect(self.reject_import)  # noqa
 
+        # Shows the share of rows saved while the data is written to the database.
+        self.saving = False
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFormat("Saving %p%")
+        self.progress_bar.hide()
+
+        self.layout.addWidget(self.progress_bar)
         self.layout.addWidget(self.button_box)
 
     def accept_import(self) -> None:
@@ -313,25 +370,87 @@ class DataImportWizard(QWidget):
         """
 
         if self.parent:
-            # Add metadata to data pane view
-            self.preview_tab.generate_triangle()
-            triangle = self.triangle
-            self.parent.add_record(
-                name=self.args_tab.name_line.text(),
-                desc=self.args_tab.desc_edit.toPlainText(),
-                triangle=triangle
-            )
+            if not self.check_value_columns():
+                return
+
+            # The import finishes once the whole file has been read.
+            self.args_tab.request_data(callback=self.save_import)
+        else:
             self.close()
 
-        self.close()
+    def check_value_columns(self) -> bool:
+        """
+        Checks that as many different value columns are mapped as a data view stores, i.e., paid and reported loss,
+        and warns the user if not.
+        """
+
+        value_columns = {
+            dropdown.currentText() for key, dropdown in self.args_tab.dropdowns.items() if 'values' in key
+        }
+
+        if len(value_columns) == len(VIEW_VALUE_COLUMNS):
+            return True
+
+        QMessageBox.warning(
+            self,
+            "Import Error",
+            "Exactly " + str(len(VIEW_VALUE_COLUMNS)) + " different value columns, paid loss and reported loss, "
+            "must be mapped to import the data."
+        )
+
+        return False
+
+    def save_import(self) -> None:
+        """
+        Builds the triangle from the uploaded data and saves the data to the database. The wizard closes once the save
+        finishes.
+        """
+
+        # Add metadata to data pane view
+        self.preview_tab.generate_triangle()
+        triangle = self.triangle
+        self.parent.add_record(
+            name=self.args_tab.name_line.text(),
+            desc=self.args_tab.desc_edit.toPlainText(),
+            triangle=triangle
+        )
 
     def reject_import(self) -> None:
         """
         Cancel import and close the dialog box.
         """
 
+        self.args_tab.cancel_read()
+        self.preview_tab.stop_build()
         self.close()
 
+    def set_saving(
+            self,
+            saving: bool
+    ) -> None:
+        """
+        Locks the wizard and shows the progress bar while the imported data is saved to the database, so that the
+        import cannot be changed, accepted again, or cancelled partway through the save.
+        """
+
+        self.saving = saving
+
+        self.tab_container.setEnabled(not saving)
+        self.button_box.setEnabled(not saving)
+
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(saving)
+
+    def closeEvent(
+            self,
+            event: QCloseEvent
+    ) -> None:
+
+        if self.saving:
+            event.ignore()
+        else:
+            event.accept()
+
 
 class ImportArgumentsTab(QWidget):
     """
@@ -347,10 +466,22 @@ class ImportArgumentsTab(QWidget):
         self.setWindowTitle("Import Wizard")
         self.parent = parent
 
-        # Holds the uploaded dataframe
+        # Holds the uploaded dataframe. The sample holds the first rows of the file, which are enough to set up the
+        # header mapping; the full data, restricted to the mapped columns, are read in the background when needed.
         self.data = None
+        self.sample = None
+        self.dtypes = None
+        self.sample_complete = False
         self.triangle = None
 
+        # Parsing engine passed to read_csv_chunked. Set to 'pyarrow' to parse large files with pyarrow, if installed.
+        self.csv_engine = None
+
+        # Background read of the full file, and callbacks waiting on its result.
+        self.worker = None
+        self.worker_columns = None
+        self.pending_callbacks = []
+
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
@@ -384,6 +515,29 @@ class ImportArgumentsTab(QWidget):
             self.file_path_container
         )
 
+        # Progress of the background read of the file, with a button to cancel it.
+        self.read_progress_bar = QProgressBar()
+        self.read_progress_bar.setFormat("Reading file: %p%")
+        self.read_cancel_btn = QPushButton("Cancel")
+        self.read_cancel_btn.pressed.connect(self.cancel_read)  # noqa
+
+        self.read_progress_layout = QHBoxLayout()
+        self.read_progress_layout.setContentsMargins(
+            0,
+            0,
+            0,
+            0
+        )
+        self.read_progress_container = QWidget()
+        self.read_progress_container.setLayout(self.read_progress_layout)
+        self.read_progress_layout.addWidget(self.read_progress_bar)
+        self.read_progress_layout.addWidget(self.read_cancel_btn)
+        self.read_progress_container.hide()
+
+        self.upload_form.addRow(
+            self.read_progress_container
+        )
+
         self.layout.addWidget(self.upload_container)
 
         self.upload_btn.pressed.connect(self.load_file)  # noqa
@@ -554,16 +708,34 @@ class ImportArgumentsTab(QWidget):
         if filename == '':
             return
 
-        self.file_path.setText(filename)
+        self.open_file(file_path=filename)
+
+    def open_file(
+            self,
+            file_path: str
+    ) -> None:
+        """
+        Reads a sample of the file to populate the sample view and header mapping. The rest of the file is not read
+        until the data are needed, see request_data.
+        """
+
+        self.cancel_read()
+
+        self.file_path.setText(file_path)
+
+        self.sample = sample_csv(file_path=file_path)
+        self.sample_complete = len(self.sample) < CSV_SAMPLE_ROWS
+        self.dtypes = infer_dtypes(sample=self.sample)
+        self.data = None
 
         self.upload_sample_model.read_header(
-            file_path=filename
+            file_path=file_path,
+            sample=self.sample
         )
 
         self.upload_sample_view.resizeColumnsToContents()
 
-        self.data = pd.read_csv(filename)
-        columns = self.data.columns
+        columns = self.sample.columns
 
         # Resize mapping dropdowns to fit contents
         width = None
@@ -578,6 +750,132 @@ class ImportArgumentsTab(QWidget):
 
         self.smart_match()
 
+    def mapped_columns(self) -> list:
+        """
+        Returns the file columns selected in the header mapping, in the order they appear in the file.
+        """
+
+        selected = {dropdown.currentText() for dropdown in self.dropdowns.values()}
+
+        return [column for column in self.sample.columns if column in selected]
+
+    def request_data(
+            self,
+            callback: Callable[[], None]
+    ) -> None:
+        """
+        Makes sure self.data holds the mapped columns of the whole file, then calls callback. If the file fits in
+        the sample, this happens immediately. Otherwise, the file is read in the background and callback is called
+        once the read finishes. It is not called if the read is cancelled or fails.
+        """
+
+        usecols = self.mapped_columns()
+
+        if (self.data is not None) and (list(self.data.columns) == usecols):
+            callback()
+            return
+
+        if self.sample_complete:
+            self.data = self.sample[usecols]
+            callback()
+            return
+
+        self.pending_callbacks.append(callback)
+
+        # A read of the same columns is already underway.
+        if (self.worker is not None) and (self.worker_columns == usecols):
+            return
+
+        self.stop_worker()
+
+        worker = FWorker(
+            read_csv_chunked,
+            file_path=self.file_path.text(),
+            usecols=usecols,
+            dtype=self.dtypes,
+            engine=self.csv_engine
+        )
+
+        worker.signals.progress.connect(self.read_progress_bar.setValue)  # noqa
+        worker.signals.result.connect(lambda data, w=worker: self.finish_read(worker=w, data=data))  # noqa
+        worker.signals.error.connect(lambda error, w=worker: self.fail_read(worker=w, error=error))  # noqa
+        worker.signals.cancelled.connect(lambda w=worker: self.stop_read(worker=w))  # noqa
+
+        self.worker = worker
+        self.worker_columns = usecols
+
+        self.read_progress_bar.setValue(0)
+        self.read_progress_container.show()
+
+        worker.start()
+
+    def finish_read(
+            self,
+            worker: FWorker,
+            data: DataFrame
+    ) -> None:
+
+        # Ignore reads that have been superseded.
+        if worker is not self.worker:
+            return
+
+        self.data = data
+        self.worker = None
+        self.read_progress_container.hide()
+
+        callbacks = self.pending_callbacks
+        self.pending_callbacks = []
+
+        for callback in callbacks:
+            callback()
+
+    def fail_read(
+            self,
+            worker: FWorker,
+            error: Exception
+    ) -> None:
+
+        if worker is not self.worker:
+            return
+
+        self.stop_read(worker=worker)
+
+        QMessageBox.warning(
+            self,
+            "Import Error",
+            "Unable to read " + self.file_path.text() + ":\n" + str(error)
+        )
+
+    def stop_read(
+            self,
+            worker: FWorker
+    ) -> None:
+
+        if worker is not self.worker:
+            return
+
+        self.worker = None
+        self.pending_callbacks = []
+        self.read_progress_container.hide()
+
+    def stop_worker(self) -> None:
+        """
+        Cancels the background read, if any, without discarding the callbacks waiting on the data.
+        """
+
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+
+    def cancel_read(self) -> None:
+        """
+        Cancels the background read, if any, along with the actions waiting on it.
+        """
+
+        self.stop_worker()
+        self.pending_callbacks = []
+        self.read_progress_container.hide()
+
     def add_values_row(
             self,
             form: QFormLayout
@@ -604,10 +902,10 @@ class ImportArgumentsTab(QWidget):
         )
 
         # add fields if there are any
-        if self.data is None:
+        if self.sample is None:
             pass
         else:
-            new_dropdown.addItems(self.data.columns)
+            new_dropdown.addItems(self.sample.columns)
             new_dropdown.setFixedWidth(new_dropdown.sizeHint().width() - 1)
 
     def delete_values_row(
@@ -633,7 +931,7 @@ class ImportArgumentsTab(QWidget):
         Tries to set the starting mapping value to the most likely value.
         """
 
-        columns = self.data.columns
+        columns = self.sample.columns
 
         for column in columns:
             if column.upper() in ORIGIN_FIELDS:
@@ -648,8 +946,12 @@ class ImportArgumentsTab(QWidget):
         Resets the form and clears all fields.
         """
 
+        self.cancel_read()
         self.file_path.clear()
         self.data = None
+        self.sample = None
+        self.dtypes = None
+        self.sample_complete = False
         self.upload_sample_model._data = dummy_df
         index = QModelIndex()
         self.upload_sample_model.setData(
@@ -682,23 +984,6 @@ class UploadSampleModel(FAbstractTableModel):
 
         self._data = dummy_df
 
-    def data(
-            self,
-            index: QModelIndex,
-            role: int = None
-    ) -> Any:
-
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-
-            value = str(value)
-
-            if value == "nan":
-                value = ""
-
-            return value
-
     def headerData(
             self,
             p_int: int,
@@ -716,11 +1001,20 @@ class UploadSampleModel(FAbstractTableModel):
 
     def read_header(
             self,
-            file_path: str
+            file_path: str,
+            sample: DataFrame = None
     ):
-        df = pd.read_csv(file_path)
+        """
+        Shows the first rows of the file. If a sample of the file has already been read, it is used instead of
+        reading the file again.
+        """
+        if sample is None:
+            sample = pd.read_csv(
+                file_path,
+                nrows=CSV_PREVIEW_ROWS
+            )
 
-        self._data = df.head()
+        self._data = sample.head(CSV_PREVIEW_ROWS)
 
         index = QModelIndex()
 
@@ -764,6 +1058,13 @@ class TrianglePreviewTab(QWidget):
 
         self.sibling = sibling
         self.parent = parent
+        self.layout = QVBoxLayout()
+        self.layout.setContentsMargins(
+            0,
+            0,
+            0,
+            0
+        )
         self.analysis_layout = QVBoxLayout()
         self.analysis_layout.setContentsMargins(
             0,
@@ -772,16 +1073,39 @@ class TrianglePreviewTab(QWidget):
             0
         )
 
-        self.setLayout(self.analysis_layout)
+        # Shows how long the last triangle took to build.
+        self.timing_label = QLabel()
+
+        self.layout.addLayout(self.analysis_layout)
+        self.layout.addWidget(self.timing_label)
+        self.setLayout(self.layout)
         self.analysis_tab = None
         self.dropdowns = None
         self.columns = None
         self.cumulative = None
 
+        # Uploaded data aggregated to one row per triangle cell, keyed by the header mapping and cumulative flag.
+        # The cache is emptied when different data are uploaded.
+        self.aggregate_cache = {}
+        self.aggregate_source = None
+        self.timings = {}
+
+        # The mapping and data of the triangle being shown, used to skip rebuilding an unchanged preview.
+        self.preview_key = None
+        self.preview_source = None
+
+        # The preview is built in the background, once the arguments have stopped changing for a moment.
+        self.worker = None
+        self.rebuild_timer = QTimer(self)
+        self.rebuild_timer.setSingleShot(True)
+        self.rebuild_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self.rebuild_timer.timeout.connect(self.rebuild)  # noqa
+
     def refresh_triangle(self) -> None:
 
         """
-        Builds the triangle that goes into the preview pane.
+        Schedules a rebuild of the triangle that goes into the preview pane. Repeated calls in quick succession
+        result in a single rebuild.
         """
         index = self.parent.tab_container.currentIndex()
 
@@ -791,24 +1115,151 @@ class TrianglePreviewTab(QWidget):
 
         # If no data have been loaded yet, do nothing
 
-        if (self.sibling.data is None) or self.sibling.data.equals(dummy_df):
+        if self.sibling.sample is None:
+            self.stop_build()
             self.clear_layout()
             return
 
-        # Removes the previous triangle when arguments are changed
-        self.clear_layout()
+        self.rebuild_timer.start()
+
+    def rebuild(self) -> None:
+        """
+        Builds the preview once the whole file has been read.
+        """
+
+        if self.parent.tab_container.currentIndex() == 0:
+            return
+
+        self.sibling.request_data(callback=self.start_build)
+
+    def start_build(self) -> None:
+        """
+        Starts building the triangle on a worker thread, unless the preview already shows the current arguments.
+        """
+
+        # The user may have returned to the arguments tab while the file was being read.
+        if self.parent.tab_container.currentIndex() == 0:
+            return
+
+        key = self.read_arguments()
+        data = self.sibling.data
 
-        self.generate_triangle()
+        if (self.analysis_tab is not None) and (key == self.preview_key) and (data is self.preview_source):
+            return
 
-        self.analysis_tab = AnalysisTab(
-            triangle=self.parent.triangle
+        self.stop_build()
+
+        worker = FWorker(
+            build_preview_triangle,
+            data=data,
+            origin=key[0],
+            development=key[1],
+            columns=self.columns,
+            cumulative=self.cumulative,
+            aggregated=self.get_cached_aggregate(key=key)
         )
 
-        self.analysis_layout.addWidget(self.analysis_tab)
+        worker.signals.result.connect(lambda result, w=worker: self.finish_build(worker=w, result=result))  # noqa
+        worker.signals.error.connect(lambda error, w=worker: self.fail_build(worker=w, error=error))  # noqa
+        worker.signals.cancelled.connect(lambda w=worker: self.stop_build(worker=w))  # noqa
+
+        self.worker = worker
+
+        self.timing_label.setText("Building triangle...")
+
+        worker.start()
+
+    def finish_build(
+            self,
+            worker: FWorker,
+            result: dict
+    ) -> None:
+
+        if worker is not self.worker:
+            return
+
+        self.worker = None
+
+        self.apply_result(result=result)
+
+        self.show_triangle()
+
+    def fail_build(
+            self,
+            worker: FWorker,
+            error: Exception
+    ) -> None:
+
+        if worker is not self.worker:
+            return
+
+        self.worker = None
+
+        self.timing_label.clear()
+
+        QMessageBox.warning(
+            self,
+            "Preview Error",
+            "Unable to build the triangle:\n" + str(error)
+        )
+
+    def stop_build(
+            self,
+            worker: FWorker = None
+    ) -> None:
+        """
+        Cancels the pending or underway build. If worker is given, only cancels the build if it is that worker's.
+        """
+
+        if worker is None:
+            self.rebuild_timer.stop()
+            worker = self.worker
+
+        if (worker is None) or (worker is not self.worker):
+            return
+
+        worker.cancel()
+        self.worker = None
+
+    def show_triangle(self) -> None:
+        """
+        Shows the triangle in the preview pane, reusing the existing analysis tab if there is one.
+        """
+
+        if self.analysis_tab is None:
+            self.analysis_tab = AnalysisTab(
+                triangle=self.parent.triangle
+            )
+
+            self.analysis_layout.addWidget(self.analysis_tab)
+        else:
+            self.analysis_tab.set_triangle(triangle=self.parent.triangle)
 
     def generate_triangle(
             self,
     ) -> None:
+        """
+        Builds the triangle on the calling thread, e.g., when the import is accepted.
+        """
+
+        key = self.read_arguments()
+
+        result = build_preview_triangle(
+            data=self.sibling.data,
+            origin=key[0],
+            development=key[1],
+            columns=self.columns,
+            cumulative=self.cumulative,
+            aggregated=self.get_cached_aggregate(key=key)
+        )
+
+        self.apply_result(result=result)
+
+    def read_arguments(self) -> tuple:
+        """
+        Reads the header mapping and cumulative flag from the arguments tab and returns them as a key that
+        identifies the triangle.
+        """
 
         self.dropdowns = self.sibling.dropdowns
         self.columns = self.get_columns()
@@ -818,12 +1269,46 @@ class TrianglePreviewTab(QWidget):
         else:
             self.cumulative = False
 
-        self.parent.triangle = Triangle(
-            data=self.sibling.data,
-            origin=self.dropdowns['origin'].currentText(),
-            development=self.sibling.dropdowns['development'].currentText(),
-            columns=self.columns,
-            cumulative=self.cumulative
+        return (
+            self.dropdowns['origin'].currentText(),
+            self.dropdowns['development'].currentText(),
+            tuple(self.columns),
+            self.cumulative
+        )
+
+    def get_cached_aggregate(
+            self,
+            key: tuple
+    ) -> DataFrame | None:
+        """
+        Returns the aggregated data previously computed for the mapping, if the uploaded data have not changed since.
+        """
+
+        if self.sibling.data is not self.aggregate_source:
+            self.aggregate_cache = {}
+            self.aggregate_source = self.sibling.data
+
+        return self.aggregate_cache.get(key)
+
+    def apply_result(
+            self,
+            result: dict
+    ) -> None:
+        """
+        Takes on a triangle returned by build_preview_triangle and caches its aggregated data.
+        """
+
+        if result['data'] is self.aggregate_source:
+            self.aggregate_cache[result['key']] = result['aggregated']
+
+        self.parent.triangle = result['triangle']
+        self.preview_key = result['key']
+        self.preview_source = result['data']
+        self.timings = result['timings']
+
+        self.timing_label.setText(
+            "Aggregated {rows:,} rows to {cells:,} cells in {aggregate:.3f} s, "
+            "built triangle in {triangle:.3f} s.".format(**self.timings)
         )
 
     def get_columns(self) -> list:
@@ -837,6 +1322,8 @@ class TrianglePreviewTab(QWidget):
         return columns
 
     def clear_layout(self):
+        self.analysis_tab = None
+        self.preview_key = None
         if self.analysis_layout is not None:
             while self.analysis_layout.count():
                 item = self.analysis_layout.takeAt(0)
@@ -847,6 +1334,145 @@ class TrianglePreviewTab(QWidget):
                     self.clear_layout()
 
 
+def build_preview_triangle(
+        data: DataFrame,
+        origin: str,
+        development: str,
+        columns: list,
+        cumulative: bool,
+        aggregated: DataFrame = None,
+        progress_callback: Callable[[int], None] = None,
+        is_cancelled: Callable[[], bool] = None
+) -> dict | None:
+    """
+    Builds the triangle previewed in the import wizard. Touches no widgets, so it can be run by an FWorker.
+
+    Parameters
+    ----------
+    data: DataFrame
+        The uploaded data.
+    origin: str
+        The origin column.
+    development: str
+        The development column.
+    columns: list
+        The value columns.
+    cumulative: bool
+        Whether the values are cumulative.
+    aggregated: DataFrame
+        The data already aggregated by a previous call with the same mapping, if any.
+    progress_callback: Callable[[int], None]
+        Unused, accepted so that the function can be run by an FWorker.
+    is_cancelled: Callable[[], bool]
+        Returns True if the build should stop.
+
+    Returns
+    -------
+    A dictionary holding the triangle, the aggregated data, the mapping key, the source data, and timings, or None if
+    the build was cancelled.
+    """
+
+    start = time.perf_counter()
+
+    if aggregated is None:
+        aggregated = aggregate_triangle_data(
+            data=data,
+            origin=origin,
+            development=development,
+            columns=columns
+        )
+
+    aggregated_time = time.perf_counter()
+
+    if is_cancelled and is_cancelled():
+        return None
+
+    triangle = Triangle(
+        data=aggregated,
+        origin=origin,
+        development=development,
+        columns=columns,
+        cumulative=cumulative
+    )
+
+    end = time.perf_counter()
+
+    return {
+        'triangle': triangle,
+        'aggregated': aggregated,
+        'key': (
+            origin,
+            development,
+            tuple(columns),
+            cumulative
+        ),
+        'data': data,
+        'timings': {
+            'rows': len(data),
+            'cells': len(aggregated),
+            'aggregate': aggregated_time - start,
+            'triangle': end - aggregated_time
+        }
+    }
+
+
+def save_data_view(
+        db_path: str,
+        view: dict,
+        data: DataFrame,
+        chunk_size: int = INGEST_CHUNK_SIZE,
+        progress_callback: Callable[[int], None] = None,
+        is_cancelled: Callable[[], bool] = None
+) -> int:
+    """
+    Saves uploaded data as a new data view. The view and its rows are written in a single transaction, so a failed
+    save leaves nothing behind. Touches no widgets, so it can be run by an FWorker.
+
+    Parameters
+    ----------
+    db_path: str
+        The database to save to.
+    view: dict
+        The fields of the new ProjectViewTable record.
+    data: DataFrame
+        The rows to save, with columns named after those of ProjectViewData, except for view_id.
+    chunk_size: int
+        The number of rows written per batch.
+    progress_callback: Callable[[int], None]
+        Called after each batch with the percentage of rows written.
+    is_cancelled: Callable[[], bool]
+        Unused, accepted so that the function can be run by an FWorker. A save is not cancelled partway through.
+
+    Returns
+    -------
+    The id of the new data view.
+    """
+
+    with session_scope(
+        db_path=db_path,
+        pragmas=SQLITE_BULK_PRAGMAS
+    ) as session:
+
+        project_view = ProjectViewTable(**view)
+
+        session.add(project_view)
+
+        session.flush()
+        view_id = project_view.view_id
+
+        bulk_insert(
+            connection=session.connection(),
+            table=ProjectViewData.__table__,
+            data=data.assign(view_id=view_id),
+            chunk_size=chunk_size,
+            progress_callback=(
+                lambda rows_written, total_rows: progress_callback(int(100 * rows_written / total_rows))
+            ) if progress_callback else None
+        )
+
+    return view_id
+
+
 class ProjectDataModel(FAbstractTableModel):
     def __init__(
             self,
@@ -864,12 +1490,13 @@ class ProjectDataModel(FAbstractTableModel):
             'Modified'
         ]
 
-        def read_sql(fc: FaslrConnection) -> DataFrame:
+        def read_sql(db_path: str) -> DataFrame:
 
-            df_res = pd.read_sql_table(
-                table_name='project_view',
-                con=fc.connection
-            )
+            with session_scope(db_path=db_path) as session:
+                df_res = pd.read_sql_table(
+                    table_name='project_view',
+                    con=session.connection()
+                )
 
             df_res = df_res[
                 [
@@ -888,42 +1515,17 @@ class ProjectDataModel(FAbstractTableModel):
         # running in standalone demo mode.
         if self.parent.main_window:
 
-            faslr_connection = FaslrConnection(
-                db_path=core.db
-            )
-
-            df = read_sql(fc=faslr_connection)
+            df = read_sql(db_path=core.db)
 
         elif core:
 
-            faslr_connection = FaslrConnection(
-                db_path=core.db
-            )
-
-            df = read_sql(fc=faslr_connection)
+            df = read_sql(db_path=core.db)
 
         else:
             df = pd.DataFrame(columns=column_list)
 
         self._data = df
 
-    def data(
-            self,
-            index: QModelIndex,
-            role: int = None
-    ) -> Any:
-
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-
-            value = str(value)
-
-            if value == "nan":
-                value = ""
-
-            return value
-
     def headerData(
             self,
             p_int: int,
@@ -980,34 +1582,13 @@ class ProjectDataView(FTableView):
             val: QModelIndex
     ) -> None:
 
-        fc = FaslrConnection(db_path=core.db)
-
         view_id = self.model().sibling(val.row(), 0, val).data()
-        query = fc.session.query(
-            ProjectViewData.accident_year,
-            ProjectViewData.calendar_year,
-            ProjectViewData.paid_loss,
-            ProjectViewData.reported_loss
-        ).filter(
-            ProjectViewData.view_id == view_id
-        )
 
-        df = pd.read_sql(query.statement, con=fc.connection)
-
-        df.columns = [
-            'Accident Year',
-            'Calendar Year',
-            'Paid Loss',
-            'Reported Loss'
-        ]
-
-        triangle = Triangle(
-            data=df,
-            origin='Accident Year',
-            development='Calendar Year',
-            columns=['Paid Loss', 'Reported Loss'],
-            cumulative=True
-        )
+        with session_scope(db_path=core.db) as session:
+            triangle = load_view_triangle(
+                session=session,
+                view_ids=[view_id]
+            )
 
         open_item_tab(
             title="Test Triangle",
@@ -1015,8 +1596,6 @@ class ProjectDataView(FTableView):
             item_widget=AnalysisTab(triangle=triangle)
         )
 
-        fc.connection.close()
-
     def contextMenuEvent(self, event):
 
         menu = QMenu()
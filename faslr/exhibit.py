@@ -177,6 +177,8 @@ class ExhibitModel(FAbstractTableModel):
         to its model.
         """
 
+        previous = self._data.copy()
+
         # When role is AddColumnRole, value is sent as a 2-valued tuple, the first element is the name of the
         # column, and the second element is a list of the corresponding values.
         if role == AddColumnRole:
@@ -271,8 +273,7 @@ class ExhibitModel(FAbstractTableModel):
 
             self._data = self._data[cols]
 
-        self.dataChanged.emit(index, index)  # noqa
-        self.layoutChanged.emit()  # noqa
+        self.emit_changes(previous=previous)
 
         return True
 
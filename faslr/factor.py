@@ -1,7 +1,8 @@
-import chainladder as cl
 import numpy as np
 import pandas as pd
 
+from collections import OrderedDict
+
 from chainladder import (
     Triangle
 )
@@ -12,6 +13,7 @@ from faslr.base_table import (
 )
 
 from faslr.constants import (
+    HEATMAP_CACHE_SIZE,
     LDF_AVERAGES,
     TEMP_LDF_LIST
 )
@@ -20,7 +22,8 @@ from faslr.style.factor import (
     FACTOR_VIEW_QSS
 )
 
-from faslr.utilities import df_set_false
+from faslr.utilities import LDFEngine
+from faslr.utilities.heatmap import heatmap_rgb
 
 from pandas import DataFrame
 
@@ -28,8 +31,7 @@ from PyQt6.QtCore import (
     QAbstractTableModel,
     QModelIndex,
     Qt,
-    QSize,
-    QVariant
+    QSize
 )
 
 from PyQt6.QtGui import (
@@ -84,13 +86,21 @@ class FactorModel(FAbstractTableModel):
 
         self.triangle = triangle
         self.link_frame = triangle.link_ratio.to_frame(origin_as_datetime=False)
+
+        # Origin labels and development ages of the link ratios, in the form chainladder expects in a drop list.
+        self.origin_labels = [str(origin) for origin in self.link_frame.index]
+        self.development_ages = [int(str(age).split('-')[0]) for age in self.link_frame.columns]
+
         self.factor_frame = None
         self.heatmap_checked = False
+        self.heatmap_cmap = "coolwarm"
 
-        self.heatmap_frame = self.triangle.to_frame(origin_as_datetime=False).astype(str)
-        self.heatmap_frame.loc[:] = LOWER_DIAG_COLOR_LIGHT.name()
+        # QColors of the link ratios when the heatmap is shown, and those calculated so far, keyed by colormap and
+        # excluded link ratios, in least recently used order.
+        self.heatmap_colors: np.ndarray | None = None
+        self.heatmap_cache: OrderedDict = OrderedDict()
 
-        self.ldf_types = TEMP_LDF_LIST
+        self.ldf_types = pd.DataFrame(TEMP_LDF_LIST)
         self.num_ldf_types = self.ldf_types[self.ldf_types["Selected"]].shape[0]
 
         ldf_blanks = [np.nan] * len(self.link_frame.columns)
@@ -116,16 +126,24 @@ class FactorModel(FAbstractTableModel):
 
         self.n_triangle_columns = self.triangle.shape[3] - 1
 
-        # Extract data from the triangle that gets displayed in the tab.
-        self._data = self.get_display_data()
+        # excl_array is a boolean array that is the same size of the triangle which
+        # indicates which factors in the corresponding triangle should be excluded
+        # it is first initialized to be all False, indicating no factors excluded initially
+        self.excl_array = np.zeros(
+            shape=self.link_frame.shape,
+            dtype=bool
+        )
+
+        # Calculates the LDF averages shown below the link ratios, and the CDFs and ultimates from the selected LDFs.
+        self.ldf_engine = LDFEngine(triangle=self.triangle)
+        self.origin_index = self.triangle.latest_diagonal.to_frame(origin_as_datetime=False).index
 
         self.value_type = value_type
 
-        # excl_frame is a dataframe that is the same size of the triangle which uses
-        # boolean values to indicate which factors in the corresponding triangle should be excluded
-        # it is first initialized to be all False, indicating no factors excluded initially
-        self.excl_frame = self.link_frame.copy()
-        self.excl_frame = df_set_false(df=self.excl_frame)
+        # Extract data from the triangle that gets displayed in the tab.
+        self._data = self.get_display_data()
+
+        self.ultimate_column = self._data.columns.get_loc("Ultimate Loss")
 
         # Get the position of a blank row to be inserted between the end of the triangle
         # and before the development factors
@@ -145,51 +163,21 @@ class FactorModel(FAbstractTableModel):
 
         if role == Qt.ItemDataRole.DisplayRole:
 
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
-
-            if col == "Ultimate Loss":
+            if index.column() == self.ultimate_column:
                 if index.row() > self.n_triangle_rows:
-                    display_value = BLANK_TEXT
-                else:
-                    display_value = VALUE_STYLE.format(value)
-            else:
-                if (index.row() == self.cdf_row_num) and self.selected_row.isnull().all().all():
-                    display_value = BLANK_TEXT
-
-                # Display blank when there are nans in the lower-right hand of the triangle.
-                elif str(value) == "nan":
-
-                    display_value = BLANK_TEXT
-                else:
-                    # "value" means stuff like losses and premiums, should have 2 decimal places.
-                    if self.value_type == "value":
+                    return BLANK_TEXT
 
-                        display_value = VALUE_STYLE.format(value)
-
-                    # for "ratio", want to display 3 decimal places.
-                    else:
-
-                        display_value = RATIO_STYLE.format(value)
-
-            display_value = str(display_value)
-
-            self.setData(
-                self.index(
-                    index.row(),
-                    index.column()
-                ),
-                QVariant(Qt.AlignmentFlag.AlignRight),
-                Qt.ItemDataRole.TextAlignmentRole
-            )
+            elif (index.row() == self.cdf_row_num) and self.selected_row.isnull().all().all():
+                return BLANK_TEXT
 
-            return display_value
+            # Missing values, such as those in the lower-right hand of the triangle, are displayed blank.
+            return self.display_data(index)
 
         if role == Qt.ItemDataRole.TextAlignmentRole:
             return Qt.AlignmentFlag.AlignRight
 
         if role == Qt.ItemDataRole.BackgroundRole:
-            if self._data.columns[index.column()] != "Ultimate Loss":
+            if index.column() != self.ultimate_column:
                 # Case when the index is on the lower diagonal
                 if (index.column() >= self.n_triangle_rows - index.row()) and \
                         (index.row() < self.triangle_spacer_row):
@@ -197,11 +185,10 @@ class FactorModel(FAbstractTableModel):
                 # Case when the index is on the triangle
                 elif index.row() < self.triangle_spacer_row:
                     if self.heatmap_checked:
-                        return QColor(self.heatmap_frame.iloc[[index.row()], [index.column()]].squeeze())
+                        return self.heatmap_colors[index.row(), index.column()]
                     else:
-                        exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
                         # Change color if factor is excluded
-                        if exclude:
+                        if self.excl_array[index.row(), index.column()]:
                             return EXCL_FACTOR_COLOR
                         else:
                             return MAIN_TRIANGLE_COLOR
@@ -220,13 +207,24 @@ class FactorModel(FAbstractTableModel):
                 (index.column() < self.n_triangle_columns):
 
             font = QFont()
-            exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
-            if exclude:
+            if self.excl_array[index.row(), index.column()]:
                 font.setStrikeOut(True)
             else:
                 font.setStrikeOut(False)
             return font
 
+    def column_format(
+            self,
+            column: Any
+    ) -> str:
+
+        # "value" means stuff like losses and premiums, which are shown as whole numbers. For "ratio", want to display
+        # 3 decimal places.
+        if (column == "Ultimate Loss") or (self.value_type == "value"):
+            return VALUE_STYLE
+        else:
+            return RATIO_STYLE
+
     def flags(
             self,
             index: QModelIndex
@@ -257,14 +255,28 @@ class FactorModel(FAbstractTableModel):
             index: QModelIndex
     ) -> None:
         """
-        Sets values of the exclusion frame to True or False to indicate whether a link ratio should be excluded.
+        Sets values of the exclusion array to True or False to indicate whether a link ratio should be excluded.
         """
-        exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
+        self.excl_array[index.row(), index.column()] = not self.excl_array[index.row(), index.column()]
 
-        if exclude:
-            self.excl_frame.iloc[[index.row()], [index.column()]] = False
-        else:
-            self.excl_frame.iloc[[index.row()], [index.column()]] = True
+        # The value of the link ratio is unchanged, only its font and color.
+        self.dataChanged.emit(  # noqa
+            index,
+            index,
+            [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.FontRole]
+        )
+
+    def repaint_link_ratios(self) -> None:
+        """
+        Asks the views to repaint the colors and fonts of the link ratios, e.g., after the heatmap is toggled, without
+        repainting the rest of the table.
+        """
+
+        self.dataChanged.emit(  # noqa
+            self.index(0, 0),
+            self.index(self.link_frame.shape[0] - 1, self.link_frame.shape[1] - 1),
+            [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.FontRole]
+        )
 
     def select_factor(
             self,
@@ -273,7 +285,7 @@ class FactorModel(FAbstractTableModel):
 
         self.selected_row.iloc[[0], [index.column()]] = self._data.iloc[[index.row()], [index.column()]].copy()
 
-        self.recalculate_factors()
+        self.update_selected_ldfs(last_column=index.column())
 
     def select_ldf_row(
             self,
@@ -281,78 +293,163 @@ class FactorModel(FAbstractTableModel):
     ) -> None:
 
         self.selected_row.iloc[[0]] = self._data.iloc[[index.row()], 0:self.link_frame.shape[1]]
-        self.recalculate_factors()
+        self.update_selected_ldfs(last_column=self.link_frame.shape[1] - 1)
 
     def clear_selected_ldfs(self) -> None:
 
         self.selected_row.iloc[[0]] = np.nan
-        self.recalculate_factors()
+        self.update_selected_ldfs(last_column=self.link_frame.shape[1] - 1)
 
     def delete_ldf(
             self,
             index: QModelIndex
     ) -> None:
         self.selected_row.iloc[[0], [index.column()]] = np.nan
-        self.recalculate_factors()
+        self.update_selected_ldfs(last_column=index.column())
 
-    def recalculate_factors(self) -> None:
+    def update_selected_ldfs(
+            self,
+            last_column: int
+    ) -> None:
         """
-        Method to update the view and LDFs as the user strikes out link ratios.
+        Updates the display after the selected LDFs up to and including last_column have changed. Only the CDFs of
+        the columns up to last_column, and the ultimates of the origin periods they apply to, are recalculated and
+        written into the display data. dataChanged is emitted for those cells alone.
         """
-        drop_list = []
-        for i in range(self.link_frame.shape[0]):
-            for j in range(self.link_frame.shape[1]):
 
-                exclude = self.excl_frame.iloc[[i], [j]].squeeze()
+        n_columns = self.link_frame.shape[1]
+        columns = slice(0, last_column + 1)
+
+        selected = self.selected_row.iloc[0].to_numpy()
 
-                if exclude:
+        # The CDF row is shown blank while no LDFs are selected, so it all changes when that starts or stops.
+        cdf_row_was_blank = self._data.iloc[self.selected_row_num, :n_columns].isnull().all()
+        cdf_row_is_blank = np.isnan(selected).all()
 
-                    row_drop = str(self.link_frame.iloc[i].name)
-                    col_drop = int(str(self.link_frame.columns[j]).split('-')[0])
+        if last_column + 1 < n_columns:
+            tail = self.cdf_row.iloc[0, last_column + 1]
+        else:
+            tail = 1.0
 
-                    drop_list.append((row_drop, col_drop))
+        cdfs = self.cdf_row.iloc[0].to_numpy().copy()
+        cdfs[columns] = self.ldf_engine.cdfs(
+            ldfs=selected[columns],
+            tail=tail
+        )
 
-                else:
+        self.cdf_row.iloc[0, columns] = cdfs[columns]
+
+        # Origin periods whose latest value is developed by one of the changed CDFs.
+        origins = np.nonzero(self.ldf_engine.latest_index <= last_column)[0]
+
+        self._data.iloc[self.selected_row_num, columns] = selected[columns]
+        self._data.iloc[self.cdf_row_num, columns] = cdfs[columns]
+        self._data.iloc[origins, self.ultimate_column] = self.ldf_engine.ultimates(cdfs=cdfs)[origins]
+
+        self.dataChanged.emit(  # noqa
+            self.index(self.selected_row_num, 0),
+            self.index(self.selected_row_num, last_column)
+        )
+
+        if cdf_row_was_blank != cdf_row_is_blank:
+            last_cdf_column = n_columns - 1
+        else:
+            last_cdf_column = last_column
+
+        self.dataChanged.emit(  # noqa
+            self.index(self.cdf_row_num, 0),
+            self.index(self.cdf_row_num, last_cdf_column)
+        )
+
+        if len(origins):
+            self.dataChanged.emit(  # noqa
+                self.index(origins.min(), self.ultimate_column),
+                self.index(origins.max(), self.ultimate_column)
+            )
+
+    def recalculate_factors(self) -> None:
+        """
+        Method to update the view and LDFs as the user strikes out link ratios.
+        """
 
-                    pass
+        if self.heatmap_checked:
+            self.update_heatmap(cmap=self.heatmap_cmap)
+            self.repaint_link_ratios()
 
-        self._data = self.get_display_data(drop_list=drop_list)
+        self.update_data(data=self.get_display_data())
 
-    def get_display_data(
+    def update_heatmap(
             self,
-            drop_list: list = None
-    ) -> DataFrame:
+            cmap: str = "coolwarm"
+    ) -> None:
         """
-        Concatenates the link ratio triangle and LDFs below it to be displayed in the GUI.
+        Sets the heatmap colors of the link ratios. Excluded link ratios are left out of the ranking and shown in the
+        exclusion color. The colors of recent colormaps and sets of exclusions are kept, so that switching back to
+        them does not recalculate them.
         """
-        ratios = self.link_frame.copy()
 
-        df_ldfs_to_calc = self.ldf_types[self.ldf_types["Selected"] == True]  # noqa e712
-        self.num_ldf_types = df_ldfs_to_calc.shape[0]
+        self.heatmap_cmap = cmap
 
-        factor_frame = pd.DataFrame()
+        key = (cmap, self.excl_array.tobytes())
 
-        for i in range(self.num_ldf_types):
-            ldf_name = df_ldfs_to_calc["Label"].iloc[i]
-            ldf_years = int(df_ldfs_to_calc["Number of Years"].iloc[i])
-            average = df_ldfs_to_calc['Type'].iloc[i]
+        if key in self.heatmap_cache:
+            self.heatmap_cache.move_to_end(key)
+        else:
 
-            development = cl.Development(
-                drop=drop_list,
-                n_periods=[ldf_years] * ratios.shape[1],
-                average=LDF_AVERAGES[average]
+            rgb = heatmap_rgb(
+                values=self.link_frame.to_numpy(),
+                cmap=cmap,
+                exclude=self.excl_array
             )
 
-            factors = development.fit(X=self.triangle)
+            # Create one QColor per distinct color and share it between the cells that use it.
+            codes, positions = np.unique(rgb, return_inverse=True)
+            palette = np.array([QColor(int(code)) for code in codes] + [EXCL_FACTOR_COLOR], dtype=object)
+            positions = positions.reshape(rgb.shape)
+            positions[self.excl_array] = len(codes)
 
-            # noinspection PyUnresolvedReferences
-            factor_row = factors.ldf_.to_frame(origin_as_datetime=False)
-            factor_row = factor_row.rename(index={'(All)': ldf_name})
+            self.heatmap_cache[key] = palette[positions]
 
-            if i == 0:
-                factor_frame = factor_row
-            else:
-                factor_frame = pd.concat([factor_frame, factor_row])
+            if len(self.heatmap_cache) > HEATMAP_CACHE_SIZE:
+                self.heatmap_cache.popitem(last=False)
+
+        self.heatmap_colors = self.heatmap_cache[key]
+
+    def get_drop_list(self) -> list:
+        """
+        Returns the excluded link ratios as (origin, development age) pairs, to be passed to cl.Development.
+        """
+        rows, columns = np.nonzero(self.excl_array)
+
+        return [
+            (self.origin_labels[i], self.development_ages[j]) for i, j in zip(rows, columns)
+        ]
+
+    def get_display_data(self) -> DataFrame:
+        """
+        Concatenates the link ratio triangle and LDFs below it to be displayed in the GUI.
+        """
+        ratios = self.link_frame.copy()
+
+        df_ldfs_to_calc = self.ldf_types[self.ldf_types["Selected"] == True]  # noqa e712
+        self.num_ldf_types = df_ldfs_to_calc.shape[0]
+
+        averages = [
+            (LDF_AVERAGES[average], int(ldf_years)) for average, ldf_years in zip(
+                df_ldfs_to_calc['Type'],
+                df_ldfs_to_calc['Number of Years']
+            )
+        ]
+
+        # All the selected averages are calculated at once, leaving out the excluded link ratios.
+        factor_frame = pd.DataFrame(
+            data=self.ldf_engine.ldfs(
+                averages=averages,
+                exclude=self.excl_array
+            ),
+            index=df_ldfs_to_calc['Label'].tolist(),
+            columns=ratios.columns
+        )
 
         self.factor_frame = factor_frame
 
@@ -364,22 +461,15 @@ class FactorModel(FAbstractTableModel):
             columns=ratios.columns
         )
 
-        # fit factors
-        patterns = {}
-        for i in range(ratios.shape[1]):
-            col = int(str(self.link_frame.columns[i]).split('-')[0])
-            patterns[col] = self.selected_row.iloc[[0], [i]].squeeze().copy()
+        # Develop the latest diagonal to ultimate with the selected factors.
+        cdfs = self.ldf_engine.cdfs(ldfs=self.selected_row.iloc[0].to_numpy())
 
-        selected_dev = cl.DevelopmentConstant(
-            patterns=patterns,
-            style="ldf"
-        ).fit_transform(self.triangle)
-
-        selected_model = cl.Chainladder().fit(selected_dev)
-        # noinspection PyUnresolvedReferences
-        ultimate_frame = selected_model.ultimate_.to_frame(origin_as_datetime=False)
+        ultimate_frame = pd.DataFrame(
+            data={"Ultimate Loss": self.ldf_engine.ultimates(cdfs=cdfs)},
+            index=self.origin_index
+        )
 
-        self.cdf_row.iloc[[0]] = selected_dev.cdf_.to_frame(origin_as_datetime=False).iloc[[0]]
+        self.cdf_row.iloc[0] = cdfs
 
         # ratios["To Ult"] = np.nan
         ratios[""] = np.nan
@@ -391,8 +481,6 @@ class FactorModel(FAbstractTableModel):
         self.selected_row_num = self.selected_spacer_row + 1
         self.cdf_row_num = self.selected_row_num + 1
 
-        index = QModelIndex()
-
         res = pd.concat([
             ratios,
             blank_row,
@@ -402,13 +490,13 @@ class FactorModel(FAbstractTableModel):
             self.cdf_row
         ])
 
-        # noinspection PyUnresolvedReferences
-        self.dataChanged.emit(
-            index,
-            index
+        # Hold the display data in a single array, so that update_selected_ldfs can write into its rows and
+        # columns in place.
+        res = pd.DataFrame(
+            data=res.to_numpy(dtype=float),
+            index=res.index,
+            columns=res.columns
         )
-        # noinspection PyUnresolvedReferences
-        self.layoutChanged.emit()
 
         return res
 
@@ -428,18 +516,10 @@ class FactorModel(FAbstractTableModel):
                 # return False
 
             self.selected_row.iloc[0, index.column()] = value
-            self.recalculate_factors()
-            self.get_display_data()
-            self.dataChanged.emit(index, index) # noqa
-            # noinspection PyUnresolvedReferences
-            self.layoutChanged.emit()
+            self.update_selected_ldfs(last_column=index.column())
             return True
         elif refresh:
             self.recalculate_factors()
-            self.get_display_data()
-            self.dataChanged.emit(index, index) # noqa
-            # noinspection PyUnresolvedReferences
-            self.layoutChanged.emit()
 
 
 class FactorView(FTableView):
@@ -557,7 +637,7 @@ class FactorView(FTableView):
 
         for index in selection:
             index.model().toggle_exclude(index=index)
-            index.model().recalculate_factors(index=index)
+            index.model().recalculate_factors()
 
     def custom_menu_event(
             self,
@@ -826,7 +906,6 @@ class LDFAverageBox(QDialog):
             ldf_dialog.exec()
 
     def accept_changes(self):
-        self.parent.get_display_data()
         index = QModelIndex()
         self.parent.setData(
             index=index,
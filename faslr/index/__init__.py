@@ -1,5 +1,6 @@
 from .index import (
     calculate_index_factors,
+    clear_index_cache,
     FIndex,
     FStandardIndexItem,
     IndexTableView,
@@ -13,7 +13,10 @@ from faslr.base_table import (
     FTableView
 )
 
-from faslr.connection import connect_db
+from faslr.connection import (
+    engine_registry,
+    session_scope
+)
 
 from faslr.common import FOKCancel
 
@@ -50,6 +53,8 @@ from PyQt6.QtWidgets import (
     QVBoxLayout
 )
 
+from sqlalchemy import event
+
 from typing import (
     List,
     TYPE_CHECKING
@@ -58,7 +63,62 @@ from typing import (
 if TYPE_CHECKING:  # pragma no coverage
     from faslr.model.index import IndexListView
     from pandas import DataFrame
-    from typing import Optional
+    from sqlalchemy.orm import ORMExecuteState
+    from typing import (
+        Iterable,
+        Optional
+    )
+
+# Index names, descriptions, origins, and changes loaded from the database, keyed by (database path, index id).
+# The cache is emptied by writes to the index tables through the ORM. Writes through Core bypass it, e.g.,
+# connection.execute(insert(IndexValuesTable)) or bulk_insert, which uses exec_driver_sql, so call clear_index_cache
+# after them.
+index_cache: dict = {}
+
+
+def clear_index_cache() -> None:
+    """
+    Empties the index cache, so that indexes are read from the database the next time they are loaded. Call after
+    writing to the index tables through Core rather than a session.
+    """
+    index_cache.clear()
+
+
+def clear_index_cache_on_flush(
+        mapper,
+        connection,
+        target
+) -> None:
+    """
+    Empties the index cache when an index or its values are inserted, updated, or deleted through a session.
+    """
+    clear_index_cache()
+
+
+for index_table in [IndexTable, IndexValuesTable]:
+    for flush_event in ['after_insert', 'after_update', 'after_delete']:
+        event.listen(index_table, flush_event, clear_index_cache_on_flush)
+
+
+def clear_index_cache_on_execute(orm_execute_state: ORMExecuteState) -> None:
+    """
+    Empties the index cache when an ORM-enabled insert, update, or delete statement is run against the index tables,
+    e.g., session.query(IndexValuesTable).filter(...).delete(), which does not trigger the flush events.
+    """
+    if orm_execute_state.is_select:
+        return
+
+    mapper = orm_execute_state.bind_mapper
+
+    if (mapper is not None) and (mapper.class_ in [IndexTable, IndexValuesTable]):
+        clear_index_cache()
+
+
+# Only sessions opened through the engine registry, e.g., by session_scope, are watched.
+engine_registry.listen_sessions(
+    identifier='do_orm_execute',
+    fn=clear_index_cache_on_execute
+)
 
 
 class FIndex:
@@ -92,6 +152,10 @@ class FIndex:
             The database path from which the index data is extracted, used in conjunction with from_id.
         """
 
+        # The relative factors behind matrix, and the origin and changes they were calculated from.
+        self.relative_factors: np.ndarray | None = None
+        self.relative_factors_key: tuple | None = None
+
         # Case when data are supplied to the arguments.
         if (origin is not None) and (changes is not None):
             self.name = name
@@ -129,33 +193,140 @@ class FIndex:
         :type db: str
         """
 
+        record = FIndex.load_records(ids=[id_no], db=db)[int(id_no)]
+
+        res = {
+            'Name': record['Name'],
+            'Description': record['Description'],
+            'Origin': record['Origin'].tolist(),
+            'Changes': record['Changes'].tolist()
+        }
+
+        return res
+
+    @staticmethod
+    def load_records(
+            ids: Iterable[int],
+            db: Optional[str] = None
+    ) -> dict:
+        """
+        Returns the name, description, origin, and changes of several indexes, keyed by index id. Indexes not yet in
+        the index cache are read with two queries, one for the names and descriptions and one for the values of all
+        of them, and are then added to the cache.
+
+        The origin and changes are read-only NumPy arrays shared with the cache, so they should be copied before
+        being modified.
+
+        Parameters
+        ----------
+        ids: Iterable[int]
+            The ids of the indexes.
+        db: Optional[str]
+            The database path from which the indexes are extracted. Defaults to the application database.
+        """
+
         # Use the application database if none is provided.
         if db is None:
             db = core.db
 
-        res = {} # Holds the result.
-        session, connection = connect_db(db_path=db)
+        ids = [int(id_no) for id_no in ids]
 
-        index_record = session.query(IndexTable).filter(IndexTable.index_id == id_no).one()
+        missing = [id_no for id_no in dict.fromkeys(ids) if (db, id_no) not in index_cache]
 
-        res['Name']: str = index_record.name
-        res['Description']: str = index_record.description
+        if missing:
+            with session_scope(db_path=db) as session:
 
-        values_query = (
-            session.query(IndexValuesTable)
-                .filter(IndexValuesTable.index_id == id_no)
-                .order_by(IndexValuesTable.year)
-        )
+                headers = (
+                    session.query(
+                        IndexTable.index_id,
+                        IndexTable.name,
+                        IndexTable.description
+                    )
+                    .filter(IndexTable.index_id.in_(missing))
+                    .all()
+                )
 
-        origin = [r.year for r in values_query]
-        changes = [r.change for r in values_query]
+                values = np.array(
+                    session.query(
+                        IndexValuesTable.index_id,
+                        IndexValuesTable.year,
+                        IndexValuesTable.change
+                    )
+                    .filter(IndexValuesTable.index_id.in_(missing))
+                    .order_by(
+                        IndexValuesTable.index_id,
+                        IndexValuesTable.year
+                    )
+                    .all(),
+                    dtype=float
+                ).reshape(-1, 3)
+
+            not_found = set(missing) - {header.index_id for header in headers}
+
+            if not_found:
+                raise ValueError("No index found with ID(s): " + ", ".join(str(x) for x in sorted(not_found)) + ".")
+
+            # The values are sorted by index id, so those of each index are a contiguous block of rows.
+            value_ids = values[:, 0].astype(int)
+
+            for header in headers:
+                start = np.searchsorted(value_ids, header.index_id, side='left')
+                stop = np.searchsorted(value_ids, header.index_id, side='right')
+
+                origin = values[start:stop, 1].astype(int)
+                changes = values[start:stop, 2].copy()
+
+                origin.flags.writeable = False
+                changes.flags.writeable = False
+
+                index_cache[(db, header.index_id)] = {
+                    'Name': header.name,
+                    'Description': header.description,
+                    'Origin': origin,
+                    'Changes': changes
+                }
+
+        return {id_no: index_cache[(db, id_no)] for id_no in ids}
+
+    @classmethod
+    def load_many(
+            cls,
+            ids: Iterable[int],
+            db: Optional[str] = None
+    ) -> list[FIndex]:
+        """
+        Initializes several indexes from the database at once. Equivalent to calling FIndex(from_id=id_no, db=db)
+        for each id, but reads all the indexes missing from the index cache in two queries.
 
-        res['Origin'] = origin
-        res['Changes'] = changes
+        Parameters
+        ----------
+        ids: Iterable[int]
+            The ids of the indexes, in the order in which the indexes are returned.
+        db: Optional[str]
+            The database path from which the indexes are extracted. Defaults to the application database.
+        """
 
-        connection.close()
+        ids = [int(id_no) for id_no in ids]
 
-        return res
+        records = cls.load_records(ids=ids, db=db)
+
+        indexes = []
+
+        for id_no in ids:
+            record = records[id_no]
+
+            findex = cls(
+                origin=record['Origin'].tolist(),
+                changes=record['Changes'].tolist(),
+                name=record['Name'],
+                description=record['Description']
+            )
+
+            findex.id = id_no
+
+            indexes.append(findex)
+
+        return indexes
 
 
     @staticmethod
@@ -223,24 +394,39 @@ class FIndex:
         """
         Matrix representation of the index. A matrix of factors that brings each year to the level of every other year.
         """
-        d: list = []  # holds the data used to initialize the resulting dataframe
-
-        incremental_factors = [x + 1.0 for x in self.changes]
-
-        for year in self.origin:
-            d += [self.relative_index(
-                base_yr=year,
-                years=self.origin,
-                index=incremental_factors
-            )]
 
         df_matrix: DataFrame = pd.DataFrame(
-            data=d,
-            index=self.origin
+            data=self.get_relative_factors(),
+            index=self.origin,
+            columns=[str(year) for year in self.origin],
+            copy=True
         )
 
         return df_matrix
 
+    def get_relative_factors(self) -> np.ndarray:
+        """
+        Returns an array of the factors that bring the year of each row to the level of the year of each column. The
+        factor from year i to year j is the product of 1 + change for the years after i up to and including j, which
+        is the ratio of the cumulative products of 1 + change at j and at i. The array is kept until the origin or
+        changes are modified.
+        """
+
+        key = (tuple(self.origin), tuple(self.changes))
+
+        if key != self.relative_factors_key:
+
+            # The change of the first year never applies, so it is left out of the cumulative product.
+            incremental_factors = np.asarray(self.changes, dtype=float) + 1.0
+            incremental_factors[:1] = 1.0
+
+            cumulative_factors = np.cumprod(incremental_factors)
+
+            self.relative_factors = cumulative_factors[None, :] / cumulative_factors[:, None]
+            self.relative_factors_key = key
+
+        return self.relative_factors
+
     @property
     def meta_dict(self) -> dict:
         """
@@ -263,9 +449,11 @@ class FIndex:
         :type values: list
         """
 
-        func = lambda x: np.asarray(x) * np.asarray(values)
-
-        res = self.matrix.apply(func)
+        res = pd.DataFrame(
+            data=self.get_relative_factors() * np.asarray(values, dtype=float)[:, None],
+            index=self.origin,
+            columns=[str(year) for year in self.origin]
+        )
 
         return res
 
@@ -336,6 +524,13 @@ class FStandardIndexItem(QStandardItem):
         self.setText(self.findex.name)
 
 class IndexTableModel(FAbstractTableModel):
+
+    column_formats = {
+        'Factor': RATIO_STYLE
+    }
+
+    default_format = PERCENT_STYLE
+
     def __init__(
             self,
             years: list = None
@@ -354,22 +549,6 @@ class IndexTableModel(FAbstractTableModel):
         else:
             self._data = pd.DataFrame(columns=['Change', 'Factor'])
 
-    def data(self, index: QModelIndex, role: int = ...) -> typing.Any:
-
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
-
-            if np.isnan(value):
-                return ""
-            else:
-                if col == "Factor":
-                    value = RATIO_STYLE.format(value)
-                else:
-                    value = PERCENT_STYLE.format(value)
-                return value
-
     def headerData(
             self,
             p_int: int,
@@ -474,15 +653,13 @@ class IndexInventory(QDialog):
             self.indexes: list = indexes
             self.validate_indexes()
         else:
-            # Get number of indexes in database.
-            session, connection = connect_db(db_path=core.db)
-            n_index = session.query(IndexTable).count()
-            connection.close()
+            # Get the ids of the indexes in the database, and load them all at once.
+            with session_scope(db_path=core.db) as session:
+                index_ids = [
+                    r.index_id for r in session.query(IndexTable.index_id).order_by(IndexTable.index_id)
+                ]
 
-            self.indexes = []
-            for i in range(n_index):
-                index_to_add = FIndex(from_id=i+1)
-                self.indexes += [index_to_add]
+            self.indexes = FIndex.load_many(ids=index_ids)
 
         self.layout = QVBoxLayout()
 
@@ -537,17 +714,15 @@ class IndexInventory(QDialog):
         else:
             selection = self.inventory_view.selectedIndexes()
 
-            for selected_idx in selection:
-                # Only want to execute on first column, the index ID.
-                if selected_idx.column() >= 1:
-                    continue
-
-                idx_id: int = self.inventory_model.data(
+            # Only want to execute on first column, the index ID.
+            idx_ids = [
+                self.inventory_model.data(
                     index=selected_idx,
                     role=Qt.ItemDataRole.DisplayRole
-                )
+                ) for selected_idx in selection if selected_idx.column() == 0
+            ]
 
-                findex = FIndex(from_id=idx_id)
+            for findex in FIndex.load_many(ids=idx_ids):
 
                 idx_item = FStandardIndexItem(findex=findex)
 
@@ -606,13 +781,6 @@ class IndexInventoryModel(FAbstractTableModel):
             df_idx = pd.DataFrame(idx_dict)
             self._data = pd.concat([self._data, df_idx])
 
-    def data(self, index: QModelIndex, role: int = ...) -> typing.Any:
-
-        if role == Qt.ItemDataRole.DisplayRole:
-            value = self._data.iloc[index.row(), index.column()]
-
-            return str(value)
-
     def headerData(
             self,
             p_int: int,
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import numpy as np
 import pandas as pd
 
 from faslr.base_table import (
@@ -33,6 +32,9 @@ if TYPE_CHECKING:
 
 
 class IndexMatrixModel(FAbstractTableModel):
+
+    default_format = RATIO_STYLE
+
     def __init__(
             self,
             matrix: DataFrame = None
@@ -47,18 +49,6 @@ class IndexMatrixModel(FAbstractTableModel):
 
             self._data = pd.DataFrame()
 
-    def data(self, index: QModelIndex, role: int = ...) -> typing.Any:
-
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
-
-            if np.isnan(value):
-                return ""
-            else:
-                return RATIO_STYLE.format(value)
-
     def headerData(
             self,
             p_int: int,
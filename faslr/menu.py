@@ -108,6 +108,10 @@ class MainMenuBar(QMenuBar):
         self.issues_action.setStatusTip("Open an issue on GitHub.")
         self.issues_action.triggered.connect(open_issue) # noqa
 
+        self.samples_action = QAction("&Sample Triangles", self)
+        self.samples_action.setStatusTip("Open the sample triangles in the analysis pane.")
+        self.samples_action.triggered.connect(self.open_sample_triangles) # noqa
+
         file_menu = QMenu("&File", self)
         self.addMenu(file_menu)
         self.addMenu("&Edit")
@@ -124,6 +128,7 @@ class MainMenuBar(QMenuBar):
         tools_menu.addAction(self.engine_action)
 
         help_menu.addAction(self.documentation_action)
+        help_menu.addAction(self.samples_action)
         help_menu.addSeparator()
         help_menu.addAction(self.github_action)
         help_menu.addAction(self.discussions_action)
@@ -162,6 +167,10 @@ class MainMenuBar(QMenuBar):
         )
         dlg.show()
 
+    def open_sample_triangles(self) -> None:
+
+        self.parent.open_sample_triangles()
+
     def toggle_project_actions(self) -> None:
         # disable project-based menu items until connection is established
 
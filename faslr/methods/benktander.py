@@ -33,6 +33,8 @@ from faslr.style.triangle import (
     VALUE_STYLE
 )
 
+from faslr.utilities import ReserveEngine
+
 from PyQt6.QtCore import (
     QModelIndex,
     Qt
@@ -339,6 +341,33 @@ class BenktanderAprioriWidget(QWidget):
         self.layout.addWidget(self.apriori_view)
 
 class BenktanderAprioriModel(FAbstractTableModel):
+
+    column_formats = {
+        'Selected Loss Ratio': PERCENT_STYLE,
+        '% Unreported': PERCENT_STYLE,
+        '% Unpaid': PERCENT_STYLE,
+        'Reported CDF': RATIO_STYLE,
+        'Paid CDF': RATIO_STYLE
+    }
+
+    default_format = VALUE_STYLE
+
+    estimate_columns = [
+        'Selected Loss Ratio',
+        'On-Level Earned Premium',
+        'Expected Claims',
+        'Reported CDF',
+        'Paid CDF',
+        '% Unreported',
+        '% Unpaid',
+        'Expected Unreported',
+        'Expected Unpaid',
+        'Reported Losses',
+        'Paid Losses',
+        'Ultimate BF Reported',
+        'Ultimate BF Paid'
+    ]
+
     def __init__(self, parent: Optional[BenktanderAprioriWidget]):
         super().__init__()
 
@@ -346,61 +375,34 @@ class BenktanderAprioriModel(FAbstractTableModel):
         self.parent_model = self.parent.parent.selection_tab.selection_model
         self._data: DataFrame = self.parent_model.selected_ratios_row.T
 
-        self._data['On-Level Earned Premium'] = self.parent.parent.apriori_tab.model._data['On-Level Earned Premium']
         self._data = self._data.rename(columns={'Selected Averages': 'Selected Loss Ratio'})
-        self._data['Expected Claims'] = self._data['Selected Loss Ratio'] * self._data['On-Level Earned Premium']
-        self._data['Reported CDF'] = np.maximum(1, self.parent.parent.apriori_tab.model._data['Reported CDF'])
-        self._data['Paid CDF'] = np.maximum(1, self.parent.parent.apriori_tab.model._data['Paid CDF'])
-        self._data['% Unreported'] = 1 - self._data['Reported CDF'] ** (-1)
-        self._data['% Unpaid'] = 1 - self._data['Paid CDF'] ** (-1)
-        self._data['Expected Unreported'] = self._data['% Unreported'] * self._data['Expected Claims']
-        self._data['Expected Unpaid'] = self._data['% Unpaid'] * self._data['Expected Claims']
-        self._data['Reported Losses'] = self.parent.parent.apriori_tab.model._data['Reported Losses']
-        self._data['Paid Losses'] = self.parent.parent.apriori_tab.model._data['Paid Losses']
-        self._data['Ultimate BF Reported'] = self._data['Expected Unreported'] + self._data['Reported Losses']
-        self._data['Ultimate BF Paid'] = self._data['Expected Unpaid'] + self._data['Paid Losses']
-
-    def data(self, index, role = ...) -> Any:
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
-
-            if np.isnan(value):
-                return ""
-            elif col in [
-                'Selected Loss Ratio',
-                '% Unreported',
-                '% Unpaid'
-            ]:
-                return PERCENT_STYLE.format(value)
-            elif col in [
-                'Reported CDF',
-                'Paid CDF'
-            ]:
-                return RATIO_STYLE.format(value)
-            else:
-                return VALUE_STYLE.format(value)
+
+        self.update_estimates()
 
     def setData(self, index, value, role = ...) -> bool:
 
         if role == Qt.ItemDataRole.EditRole:
-            self._data['Selected Loss Ratio'] = self.parent_model.selected_ratios_row.T['Selected Averages']
-            self._data['Expected Claims'] = self._data['Selected Loss Ratio'] * self._data['On-Level Earned Premium']
-            self._data['Expected Unreported'] = self._data['% Unreported'] * self._data['Expected Claims']
-            self._data['Expected Unpaid'] = self._data['% Unpaid'] * self._data['Expected Claims']
-            self._data['Ultimate BF Reported'] = self._data['Expected Unreported'] + self._data['Reported Losses']
-            self._data['Ultimate BF Paid'] = self._data['Expected Unpaid'] + self._data['Paid Losses']
-            self._data['BF Reported IBNR'] = self._data['Ultimate BF Reported'] - self._data['Reported Losses']
-            self._data['BF Paid IBNR'] = self._data['Ultimate BF Paid'] - self._data['Reported Losses']
-            self._data['BF Reported Unpaid Claims'] = self._data['Ultimate BF Reported'] - self._data['Paid Losses']
-            self._data['BF Paid Unpaid Claims'] = self._data['Ultimate BF Paid'] - self._data['Paid Losses']
-
-            self.dataChanged.emit(index, index)
-            self.layoutChanged.emit()
+            previous = self._data.copy()
+
+            self.update_estimates()
+
+            self.emit_changes(previous=previous)
 
         return True
 
+    def update_estimates(self) -> None:
+        """
+        Recalculates the Bornhuetter-Ferguson ultimates used as the a priori of the Benktander method.
+        """
+
+        inputs = self.parent.parent.apriori_tab.model._data.assign(
+            **{'Selected Loss Ratio': self.parent_model.selected_ratios_row.T['Selected Averages']}
+        )
+
+        estimates = ReserveEngine.from_frame(data=inputs).estimates()
+
+        for column in self.estimate_columns:
+            self._data[column] = estimates[column]
 
 
 class BenktanderIBNRWidget(FIBNRWidget):
@@ -601,6 +603,29 @@ class BenktanderIBNRWidget(FIBNRWidget):
 
 
 class BenktanderIBNRModel(FIBNRModel):
+
+    column_formats = {
+        '% Unreported': PERCENT_STYLE,
+        '% Unpaid': PERCENT_STYLE,
+        'Reported CDF': RATIO_STYLE,
+        'Paid CDF': RATIO_STYLE
+    }
+
+    estimate_columns = [
+        'Ultimate BF Reported',
+        'Ultimate BF Paid',
+        'Reported Losses',
+        'Paid Losses',
+        'Reported CDF',
+        'Paid CDF',
+        '% Unreported',
+        '% Unpaid',
+        'Ultimate GB Reported',
+        'Ultimate GB Paid',
+        'GB Reported IBNR',
+        'GB Paid IBNR'
+    ]
+
     def __init__(self, parent: BenktanderIBNRWidget):
         super().__init__(parent=parent)
 
@@ -613,82 +638,50 @@ class BenktanderIBNRModel(FIBNRModel):
             index=apriori_model._data.index
         )
 
-        self._data['Ultimate BF Reported'] = apriori_model._data['Ultimate BF Reported']
-        self._data['Ultimate BF Paid'] = apriori_model._data['Ultimate BF Paid']
-        self._data['Reported Losses'] = apriori_model._data['Reported Losses']
-        self._data['Paid Losses'] = apriori_model._data['Paid Losses']
-        self._data['Reported CDF'] = apriori_model._data['Reported CDF']
-        self._data['Paid CDF'] = apriori_model._data['Paid CDF']
-        self._data['% Unreported'] = apriori_model._data['% Unreported']
-        self._data['% Unpaid'] = apriori_model._data['% Unpaid']
-        self._data['Ultimate GB Reported'] = self._data['Reported Losses'] + self._data['Ultimate BF Reported'] * self._data['% Unreported']
-        self._data['Ultimate GB Paid'] = self._data['Paid Losses'] + self._data['Ultimate BF Paid'] * \
-                                             self._data['% Unpaid']
-        self._data['GB Reported IBNR'] = self._data['Ultimate GB Reported'] - self._data['Reported Losses']
-        self._data['GB Paid IBNR'] = self._data['Ultimate GB Paid'] - self._data['Reported Losses']
-
-    def data(self, index, role=...) -> Any:
-
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
-
-            if np.isnan(value):
-                return ""
-            elif col in [
-                '% Unreported',
-                '% Unpaid'
-            ]:
-                return PERCENT_STYLE.format(value)
-            elif col in [
-                'Reported CDF',
-                'Paid CDF'
-            ]:
-                return RATIO_STYLE.format(value)
-            else:
-                return VALUE_STYLE.format(value)
-
+        self.update_estimates(iterations=1)
 
     def setData(self, index, value, role = ...) -> bool:
 
         if role == Qt.ItemDataRole.EditRole:
 
-            iterations = self.parent.toolbox.iterations_spinbox.value()
-
-            apriori_model = self.parent.parent.bf_tab.apriori_model
-
+            previous = self._data.copy()
 
-            self._data['Ultimate BF Reported'] = apriori_model._data['Ultimate BF Reported']
-            self._data['Ultimate BF Paid'] = apriori_model._data['Ultimate BF Paid']
-            self._data['Ultimate GB Reported'] = self._data['Reported Losses'] + self._data['Ultimate BF Reported'] * \
-                                                 self._data['% Unreported']
-            self._data['Ultimate GB Paid'] = self._data['Paid Losses'] + self._data['Ultimate BF Paid'] * \
-                                             self._data['% Unpaid']
-            self._data['GB Reported IBNR'] = self._data['Ultimate GB Reported'] - self._data['Reported Losses']
-            self._data['GB Paid IBNR'] = self._data['Ultimate GB Paid'] - self._data['Reported Losses']
+            self.update_estimates(iterations=self.parent.toolbox.iterations_spinbox.value())
 
-            i = 1
+            self.emit_changes(previous=previous)
 
-            while i < iterations:
-
-                self._data['Ultimate BF Reported'] = self._data['Ultimate GB Reported']
-                self._data['Ultimate BF Paid'] = self._data['Ultimate GB Paid']
-                self._data['Ultimate GB Reported'] = self._data['Reported Losses'] + self._data[
-                    'Ultimate BF Reported'] * \
-                                                     self._data['% Unreported']
-                self._data['Ultimate GB Paid'] = self._data['Paid Losses'] + self._data['Ultimate BF Paid'] * \
-                                                 self._data['% Unpaid']
-                self._data['GB Reported IBNR'] = self._data['Ultimate GB Reported'] - self._data['Reported Losses']
-                self._data['GB Paid IBNR'] = self._data['Ultimate GB Paid'] - self._data['Reported Losses']
+        return True
 
-                i += 1
+    def estimate_inputs(self) -> DataFrame:
 
+        return self.parent.parent.bf_tab.apriori_model._data
 
-        self.dataChanged.emit(index, index)
-        self.layoutChanged.emit()
+    def update_estimates(
+            self,
+            iterations: int = 1
+    ) -> None:
+        """
+        Recalculates the Benktander estimates after a number of iterations.
+
+        Parameters
+        ----------
+        iterations: int
+            The number of Benktander iterations. The BF columns hold the ultimates of the second-to-last iteration,
+            which the last one develops from, i.e., the Bornhuetter-Ferguson ultimates for a single iteration.
+        """
+
+        estimates = ReserveEngine.from_frame(data=self.estimate_inputs()).estimates(
+            iterations=np.array([iterations - 1, iterations])
+        )
+
+        for column in self.estimate_columns:
+            if column.startswith('Ultimate BF'):
+                self._data[column] = estimates[column.replace('BF', 'GB')][0]
+            elif 'GB' in column:
+                self._data[column] = estimates[column][1]
+            else:
+                self._data[column] = estimates[column]
 
-        return True
 
 class BenktanderIBNRToolbox(QWidget):
     def __init__(
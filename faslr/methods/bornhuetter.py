@@ -3,8 +3,6 @@ Widgets for the Bornhuetter-Ferguson technique.
 """
 from __future__ import annotations
 
-import numpy as np
-
 from faslr.grid_header import GridTableView
 
 from faslr.model import (
@@ -403,68 +401,52 @@ class BornhuetterIBNRModel(FIBNRModel):
     parent: Optional[BornhuetterIBNRWidget]
         The parent BornhuetterIBNRWidget.
     """
+
+    column_formats = {
+        'Selected Loss Ratio': PERCENT_STYLE,
+        '% Unreported': PERCENT_STYLE,
+        '% Unpaid': PERCENT_STYLE,
+        'Reported CDF': RATIO_STYLE,
+        'Paid CDF': RATIO_STYLE
+    }
+
+    estimate_columns = [
+        'Selected Loss Ratio',
+        'On-Level Earned Premium',
+        'Expected Claims',
+        'Reported CDF',
+        'Paid CDF',
+        '% Unreported',
+        '% Unpaid',
+        'Expected Unreported',
+        'Expected Unpaid',
+        'Reported Losses',
+        'Paid Losses',
+        'Ultimate BF Reported',
+        'Ultimate BF Paid',
+        'Case Outstanding',
+        'BF Reported IBNR',
+        'BF Paid IBNR',
+        'BF Reported Unpaid Claims',
+        'BF Paid Unpaid Claims'
+    ]
+
     def __init__(
             self,
             parent: Optional[BornhuetterIBNRWidget] = None
     ):
         super().__init__(parent=parent)
-        self._data['On-Level Earned Premium'] = self.parent.parent.apriori_tab.model._data['On-Level Earned Premium']
         self._data = self._data.rename(columns={'Selected Averages': 'Selected Loss Ratio'})
-        self._data['Expected Claims'] = self._data['Selected Loss Ratio'] * self._data['On-Level Earned Premium']
-        self._data['Reported CDF'] = np.maximum(1, self.parent.parent.apriori_tab.model._data['Reported CDF'])
-        self._data['Paid CDF'] = np.maximum(1, self.parent.parent.apriori_tab.model._data['Paid CDF'])
-        self._data['% Unreported'] = 1 - self._data['Reported CDF'] ** (-1)
-        self._data['% Unpaid'] = 1 - self._data['Paid CDF'] ** (-1)
-        self._data['Expected Unreported'] = self._data['% Unreported'] * self._data['Expected Claims']
-        self._data['Expected Unpaid'] = self._data['% Unpaid'] * self._data['Expected Claims']
-        self._data['Reported Losses'] = self.parent.parent.apriori_tab.model._data['Reported Losses']
-        self._data['Paid Losses'] = self.parent.parent.apriori_tab.model._data['Paid Losses']
-        self._data['Ultimate BF Reported'] = self._data['Expected Unreported'] + self._data['Reported Losses']
-        self._data['Ultimate BF Paid'] = self._data['Expected Unpaid'] + self._data['Paid Losses']
-        self._data['Case Outstanding'] = self._data['Reported Losses'] - self._data['Paid Losses']
-        self._data['BF Reported IBNR'] = self._data['Ultimate BF Reported'] - self._data['Reported Losses']
-        self._data['BF Paid IBNR'] = self._data['Ultimate BF Paid'] - self._data['Reported Losses']
-        self._data['BF Reported Unpaid Claims'] = self._data['Ultimate BF Reported'] - self._data['Paid Losses']
-        self._data['BF Paid Unpaid Claims'] = self._data['Ultimate BF Paid'] - self._data['Paid Losses']
-
-
-    def data(self, index, role = ...) -> Any:
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
-
-            if np.isnan(value):
-                return ""
-            elif col in [
-                'Selected Loss Ratio',
-                '% Unreported',
-                '% Unpaid'
-            ]:
-                return PERCENT_STYLE.format(value)
-            elif col in [
-                'Reported CDF',
-                'Paid CDF'
-            ]:
-                return RATIO_STYLE.format(value)
-            else:
-                return VALUE_STYLE.format(value)
+
+        self.update_estimates()
 
     def setData(self, index, value, role = ...) -> bool:
 
         if role == Qt.ItemDataRole.EditRole:
-            self._data['Selected Loss Ratio'] = self.parent_model.selected_ratios_row.T['Selected Averages']
-            self._data['Expected Claims'] = self._data['Selected Loss Ratio'] * self._data['On-Level Earned Premium']
-            self._data['Expected Unreported'] = self._data['% Unreported'] * self._data['Expected Claims']
-            self._data['Expected Unpaid'] = self._data['% Unpaid'] * self._data['Expected Claims']
-            self._data['Ultimate BF Reported'] = self._data['Expected Unreported'] + self._data['Reported Losses']
-            self._data['Ultimate BF Paid'] = self._data['Expected Unpaid'] + self._data['Paid Losses']
-            self._data['BF Reported IBNR'] = self._data['Ultimate BF Reported'] - self._data['Reported Losses']
-            self._data['BF Paid IBNR'] = self._data['Ultimate BF Paid'] - self._data['Reported Losses']
-            self._data['BF Reported Unpaid Claims'] = self._data['Ultimate BF Reported'] - self._data['Paid Losses']
-            self._data['BF Paid Unpaid Claims'] = self._data['Ultimate BF Paid'] - self._data['Paid Losses']
-
-            self.dataChanged.emit(index, index)
-            self.layoutChanged.emit()
+            previous = self._data.copy()
+
+            self.update_estimates()
+
+            self.emit_changes(previous=previous)
 
         return True
\ No newline at end of file
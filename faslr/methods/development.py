@@ -6,8 +6,6 @@ from faslr.factor import (
     FactorView
 )
 
-from faslr.utilities.style_parser import parse_styler
-
 from PyQt6.QtCore import Qt
 
 from PyQt6.QtWidgets import (
@@ -91,11 +89,8 @@ class DevelopmentTab(QWidget):
     def toggle_heatmap(self):
         if self.check_heatmap.isChecked():
             self.factor_model.heatmap_checked = True
-            self.factor_model.heatmap_frame = parse_styler(
-                self.factor_model.triangle,
-                cmap="coolwarm"
-            )
-            self.factor_model.layoutChanged.emit() # noqa
+            self.factor_model.update_heatmap(cmap="coolwarm")
         else:
             self.factor_model.heatmap_checked = False
-            self.factor_model.layoutChanged.emit() # noqa
+
+        self.factor_model.repaint_link_ratios()
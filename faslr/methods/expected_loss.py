@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import typing
-
 import numpy as np
 import pandas as pd
 
+from collections import OrderedDict
+
 from faslr.base_table import (
     FAbstractTableModel,
     FTableView
@@ -16,7 +16,10 @@ from faslr.common.model import (
     FSelectionModel
 )
 
-from faslr.constants import UpdateIndexRole
+from faslr.constants import (
+    TREND_CACHE_SIZE,
+    UpdateIndexRole
+)
 
 from faslr.grid_header import GridTableView
 
@@ -82,6 +85,18 @@ class ExpectedLossAprioriModel(FAbstractTableModel):
     triangles: Optional[List[Chainladder]]
         List of paid and incurred losses, with ldfs already chosen.
     """
+
+    column_formats = {
+        'Reported Losses': VALUE_STYLE,
+        'Paid Losses': VALUE_STYLE,
+        'Reported CDF': RATIO_STYLE,
+        'Paid CDF': RATIO_STYLE,
+        'Reported Ultimate': VALUE_STYLE,
+        'Paid Ultimate': VALUE_STYLE,
+        'Initial Selected': VALUE_STYLE,
+        'On-Level Earned Premium': VALUE_STYLE
+    }
+
     def __init__(
             self,
             triangles: Optional[List[Chainladder]] = None,
@@ -125,37 +140,6 @@ class ExpectedLossAprioriModel(FAbstractTableModel):
         else:
             self._data['On-Level Earned Premium'] = None
 
-    def data(self, index: QModelIndex, role: int = ...) -> Any:
-
-        colname = self._data.columns[index.column()]
-
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-
-            if colname in [
-                'Reported Losses',
-                'Paid Losses',
-                'Reported Ultimate',
-                'Paid Ultimate',
-                'Initial Selected',
-                'On-Level Earned Premium'
-            ]:
-
-                display_value = VALUE_STYLE.format(value)
-
-            elif colname in [
-                    'Reported CDF',
-                    'Paid CDF'
-            ]:
-
-                display_value = RATIO_STYLE.format(value)
-
-            else:
-                display_value = str(value)
-
-            return display_value
-
     def headerData(
             self,
             p_int,
@@ -507,6 +491,13 @@ class ExpectedLossRatioModel(FSelectionModel):
     premium_indexes: Optional[list[FIndex]]
         The premium indexes to be applied to the premiums, overrides database values.
     """
+
+    default_format = PERCENT_STYLE
+
+    # Composed trends in order of use, shared by all models so that switching between index selections, or
+    # several models using the same indexes, reuses the composed index along with its cached factor matrix.
+    trend_cache: OrderedDict = OrderedDict()
+
     def __init__(
             self,
             parent: ExpectedLossRatioWidget,
@@ -550,24 +541,25 @@ class ExpectedLossRatioModel(FSelectionModel):
         self._data = adj_loss_ratios
         self.setData(index=QModelIndex(), value=None)
 
-    def data(self, index: QModelIndex, role: int = ...) -> typing.Any:
-
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
+    @property
+    def ratio_weights(self) -> np.ndarray | None:
+        """
+        The on-level premium behind each adjusted loss ratio, used for volume-weighted averages.
+        """
+        if self.comp_prem_trend is None:
+            return None
 
-            if np.isnan(value):
-                return ""
-            else:
-                return PERCENT_STYLE.format(value)
+        return self.comp_prem_trend.apply_matrix(values=self.premium).to_numpy()
 
-    @staticmethod
+    @classmethod
     def compose_trend(
+            cls,
             origin: list,
             indexes: list
     ) -> FIndex:
         """
-        Combines multiple indexes into a single index.
+        Combines multiple indexes into a single index. Composed indexes are kept in trend_cache, keyed by the origin
+        and the changes of the indexes, so composing the same indexes again, in any order, returns the cached index.
 
         Parameters
         ----------
@@ -576,15 +568,34 @@ class ExpectedLossRatioModel(FSelectionModel):
         indexes: list
             The indexes to be combined.
         """
-        # No indexes supplied, return default index of just 1 for all factors.
+        # Single index, leave as-is.
+        if (indexes is not None) and len(indexes) == 1:
+            return indexes[0]
+
         if (indexes is None) or len(indexes) == 0:
+            key = (tuple(origin), ())
+        else:
+            # Composition is multiplicative, so the order of the indexes does not matter.
+            key = (
+                tuple(indexes[0].origin),
+                tuple(sorted(tuple(index.changes) for index in indexes))
+            )
+
+        if key in cls.trend_cache:
+            cls.trend_cache.move_to_end(key)
+            return cls.trend_cache[key]
+
+        # No indexes supplied, return default index of just 1 for all factors.
+        if len(key[1]) == 0:
             comp_index = FIndex(origin=origin, changes=[0] * len(origin))
         # Multiple indexes, compose them together.
-        elif len(indexes) > 1:
-            comp_index = indexes[0].compose(indexes[1:])
-        # Single index, leave as-is.
         else:
-            comp_index = indexes[0]
+            comp_index = indexes[0].compose(indexes[1:])
+
+        cls.trend_cache[key] = comp_index
+
+        if len(cls.trend_cache) > TREND_CACHE_SIZE:
+            cls.trend_cache.popitem(last=False)
 
         return comp_index
 
@@ -695,29 +706,32 @@ class ExpectedLossIBNRModel(FIBNRModel):
     parent: ExpectedLossIBNRWidget
         The containing ExpectedLossIBNRWidget.
     """
+    estimate_columns = [
+        'Selected Loss Ratio',
+        'On-Level Earned Premium',
+        'Paid Losses',
+        'Reported Losses',
+        'Ultimate Loss',
+        'IBNR',
+        'Unpaid Claims'
+    ]
+
     def __init__(
             self,
             parent: ExpectedLossIBNRWidget
     ):
         super().__init__(parent=parent)
-
-        self._data['On-Level Earned Premium'] = self.parent.parent.apriori_tab.model._data['On-Level Earned Premium']
-        self._data['Paid Losses'] = self.parent.parent.apriori_tab.model._data['Paid Losses']
-        self._data['Reported Losses'] = self.parent.parent.apriori_tab.model._data['Reported Losses']
         self._data = self._data.rename(columns={'Selected Averages': 'Selected Loss Ratio'})
-        self._data['Ultimate Loss'] = self._data['On-Level Earned Premium'] * self._data['Selected Loss Ratio']
-        self._data['IBNR'] = self._data['Ultimate Loss'] - self._data['Reported Losses']
-        self._data['Unpaid Claims'] = self._data['Ultimate Loss'] - self._data['Paid Losses']
+
+        self.update_estimates()
 
     def setData(self, index, value, role = ...) -> bool:
 
         if role == Qt.ItemDataRole.EditRole:
-            self._data['Selected Loss Ratio'] = self.parent_model.selected_ratios_row.T['Selected Averages']
-            self._data['Ultimate Loss'] = self._data['On-Level Earned Premium'] * self._data['Selected Loss Ratio']
-            self._data['IBNR'] = self._data['Ultimate Loss'] - self._data['Reported Losses']
-            self._data['Unpaid Claims'] = self._data['Ultimate Loss'] - self._data['Paid Losses']
+            previous = self._data.copy()
+
+            self.update_estimates()
 
-        self.dataChanged.emit(index, index)
-        self.layoutChanged.emit()
+            self.emit_changes(previous=previous)
 
         return True
\ No newline at end of file
@@ -3,8 +3,6 @@ Module containing widget used to display ultimate losses and IBNR.
 """
 from __future__ import annotations
 
-import numpy as np
-
 from faslr.base_table import FAbstractTableModel, FTableView
 
 from faslr.style.triangle import (
@@ -12,6 +10,8 @@ from faslr.style.triangle import (
     VALUE_STYLE
 )
 
+from faslr.utilities import ReserveEngine
+
 from PyQt6.QtCore import Qt
 
 from PyQt6.QtWidgets import (
@@ -74,6 +74,16 @@ class FIBNRModel(FAbstractTableModel):
     parent: FIBNRWidget
         The containing FIBNRWidget.
     """
+
+    column_formats = {
+        'Selected Loss Ratio': PERCENT_STYLE
+    }
+
+    default_format = VALUE_STYLE
+
+    # The columns of ReserveEngine.estimates displayed by the model, in order.
+    estimate_columns: list = []
+
     def __init__(
             self,
             parent: FIBNRWidget
@@ -85,20 +95,6 @@ class FIBNRModel(FAbstractTableModel):
 
         self._data: DataFrame = self.parent_model.selected_ratios_row.T
 
-    def data(self, index, role = ...) -> Any:
-
-        if role == Qt.ItemDataRole.DisplayRole:
-
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
-
-            if np.isnan(value):
-                return ""
-            elif col == 'Selected Loss Ratio':
-                return PERCENT_STYLE.format(value)
-            else:
-                return VALUE_STYLE.format(value)
-
     def headerData(
             self,
             p_int: int,
@@ -117,9 +113,26 @@ class FIBNRModel(FAbstractTableModel):
     def setData(self, index, value, role = ...) -> bool:
 
         if role == Qt.ItemDataRole.EditRole:
-            self._data = self.parent_model.selected_ratios_row.T
+            self.update_data(data=self.parent_model.selected_ratios_row.T)
+
+        return True
+
+    def estimate_inputs(self) -> DataFrame:
+        """
+        Returns the inputs of the reserve estimates, i.e., the a priori data of the loss model along with the selected
+        loss ratios.
+        """
+
+        return self.parent.parent.apriori_tab.model._data.assign(
+            **{'Selected Loss Ratio': self.parent_model.selected_ratios_row.T['Selected Averages']}
+        )
+
+    def update_estimates(self) -> None:
+        """
+        Recalculates the columns in estimate_columns with a ReserveEngine.
+        """
 
-        self.dataChanged.emit(index, index)
-        self.layoutChanged.emit()
+        estimates = ReserveEngine.from_frame(data=self.estimate_inputs()).estimates()
 
-        return True
\ No newline at end of file
+        for column in self.estimate_columns:
+            self._data[column] = estimates[column]
@@ -5,14 +5,25 @@ from __future__ import annotations
 
 import faslr.core as core
 
-from faslr.connection import connect_db
-
-from faslr.country import CountryTab
+from collections import OrderedDict
+
+from faslr.connection import (
+    build_lob_rows,
+    build_state_rows,
+    count_project_segments,
+    populate_project_model,
+    query_lobs,
+    query_states,
+    session_scope
+)
 
-from faslr.data import (
-    DataPane
+from faslr.constants import (
+    PROJECT_TREE_CACHE_SIZE,
+    PROJECT_TREE_EAGER_LIMIT
 )
 
+from faslr.country import CountryTab
+
 from faslr.schema import (
     CountryTable,
     LOBTable,
@@ -27,12 +38,13 @@ from faslr.utilities import open_item_tab
 
 from PyQt6.QtCore import (
     Qt,
-    QModelIndex
+    QModelIndex,
+    QTimer
 )
 
 from PyQt6.QtGui import (
     QAction,
-    QColor,
+    QGuiApplication,
     QKeySequence,
     QStandardItem,
     QStandardItemModel
@@ -48,7 +60,10 @@ from PyQt6.QtWidgets import (
     QTreeView
 )
 
-from typing import TYPE_CHECKING
+from typing import (
+    Optional,
+    TYPE_CHECKING
+)
 from uuid import uuid4
 
 if TYPE_CHECKING:  # pragma: no coverage
@@ -117,155 +132,99 @@ class ProjectDialog(QDialog):
     ) -> None:
 
         # connect to the database
-        session, connection = connect_db(db_path=core.db)
-
-        # Take values from the form
-        country_text = self.country_edit.text()
-        state_text = self.state_edit.text()
-        lob_text = self.lob_edit.text()
-
-        # Create an entries for the project tree
-        country = ProjectItem(
-            text=country_text,
-            segment_level="country",
-            set_bold=True
-        )
-
-        state = ProjectItem(
-            text=state_text,
-            segment_level="state"
-        )
-
-        lob = ProjectItem(
-            text=lob_text,
-            segment_level="lob"
-        )
-
-        # Check if the country is already in the database
-        country_query = session.query(CountryTable).filter(CountryTable.country_name == country_text)
-
-        # new_project = ProjectTable()
-
-        # If the country is not already in the database, create a new entry for it
-        if country_query.first() is None:
-
-            # Generate project UUIDs for each of the three fields
-            country_uuid = str(uuid4())
-            state_uuid = str(uuid4())
-            lob_uuid = str(uuid4())
-
-            # Create location ids for country and state
-            new_country_location = LocationTable(hierarchy="country")
-
-            new_state_location = LocationTable(hierarchy="state")
-
-            session.add(new_country_location)
-            session.add(new_state_location)
-
-            # flush the session to get the newly created location ids
-            session.flush()
-
-            # Create state and country db entries
-            new_country = CountryTable(
-                country_name=country_text,
-                project_id=country_uuid,
-                location_id=new_country_location.location_id
-            )
-
-            new_state = StateTable(
-                state_name=state_text,
-                project_id=state_uuid,
-                location_id=new_state_location.location_id
+        with session_scope(db_path=core.db) as session:
+
+            # Take values from the form
+            country_text = self.country_edit.text()
+            state_text = self.state_edit.text()
+            lob_text = self.lob_edit.text()
+
+            # Create an entries for the project tree
+            country = ProjectItem(
+                text=country_text,
+                segment_level="country",
+                set_bold=True
             )
 
-            # Create corresponding projects
-            new_country_project = ProjectTable(
-                project_id=country_uuid
+            state = ProjectItem(
+                text=state_text,
+                segment_level="state"
             )
 
-            new_state_project = ProjectTable(
-                project_id=state_uuid
+            lob = ProjectItem(
+                text=lob_text,
+                segment_level="lob"
             )
 
-            # fill out object hierarchy
-            new_country.state = [new_state]
-            new_country_project.country = [new_country]
-            new_state_project.state = [new_state]
+            # Check if the country is already in the database
+            country_query = session.query(CountryTable).filter(CountryTable.country_name == country_text)
 
-            # Add entries into the project tree
-            country.appendRow([state, QStandardItem(state_uuid)])
-            state.appendRow([lob, QStandardItem(lob_uuid)])
+            # new_project = ProjectTable()
 
-            main_window.project_model.project_root.appendRow([
-                country,
-                QStandardItem(country_uuid)
-            ])
+            # If the country is not already in the database, create a new entry for it
+            if country_query.first() is None:
 
-            # Add entries to the database session
-            session.add(new_country_project)
-            session.add(new_state_project)
-
-            # define lob entry, we need to do this after state and country because we depend on the ids
-            new_lob_project = ProjectTable(
-                project_id=lob_uuid
-            )
-
-            lob_location = new_state_location.location_id
-
-            new_lob = LOBTable(
-                lob_type=lob_text,
-                project_id=lob_uuid,
-                location_id=lob_location
-            )
-
-            new_lob.country = new_country
-            new_lob.state = new_state
-            new_lob_project.lob = [new_lob]
-
-            session.add(new_lob_project)
-
-        # Otherwise, check if the state is already in the database
-        else:
-
-            existing_country = country_query.first()
-            country_id = existing_country.country_id
-            country_uuid = existing_country.project_id
-
-            # If the state is in the database, this query should return it
-            state_query = session.query(StateTable).filter(
-                StateTable.state_name == state_text
-            ).filter(
-                StateTable.country_id == country_id
-            )
-
-            # If the state isn't already in the database, create an entry for it
-            if state_query.first() is None:
-
-                # create project ids for state and lob only, since country uuid already exists
+                # Generate project UUIDs for each of the three fields
+                country_uuid = str(uuid4())
                 state_uuid = str(uuid4())
                 lob_uuid = str(uuid4())
 
+                # Create location ids for country and state
+                new_country_location = LocationTable(hierarchy="country")
+
                 new_state_location = LocationTable(hierarchy="state")
+
+                session.add(new_country_location)
                 session.add(new_state_location)
-                # flush the session to get the newly created location id
+
+                # flush the session to get the newly created location ids
                 session.flush()
 
-                # Create database entry for the state and its associated project
+                # Create state and country db entries
+                new_country = CountryTable(
+                    country_name=country_text,
+                    project_id=country_uuid,
+                    location_id=new_country_location.location_id
+                )
+
                 new_state = StateTable(
                     state_name=state_text,
                     project_id=state_uuid,
                     location_id=new_state_location.location_id
                 )
 
+                # Create corresponding projects
+                new_country_project = ProjectTable(
+                    project_id=country_uuid
+                )
+
                 new_state_project = ProjectTable(
                     project_id=state_uuid
                 )
 
-                new_state.country = existing_country
+                # fill out object hierarchy
+                new_country.state = [new_state]
+                new_country_project.country = [new_country]
+                new_state_project.state = [new_state]
+
+                # Add entries into the project tree
+                country.appendRow([state, QStandardItem(state_uuid)])
+                state.appendRow([lob, QStandardItem(lob_uuid)])
 
+                main_window.project_model.project_root.appendRow([
+                    country,
+                    QStandardItem(country_uuid)
+                ])
+
+                # Add entries to the database session
+                session.add(new_country_project)
                 session.add(new_state_project)
 
-                # Define the new LOB
+                # define lob entry, we need to do this after state and country because we depend on the ids
+                new_lob_project = ProjectTable(
+                    project_id=lob_uuid
+                )
+
                 lob_location = new_state_location.location_id
 
                 new_lob = LOBTable(
@@ -274,70 +233,125 @@ class ProjectDialog(QDialog):
                     location_id=lob_location
                 )
 
-                new_lob_project = ProjectTable(
-                    project_id=lob_uuid
-                )
-
-                new_lob.country = existing_country
+                new_lob.country = new_country
                 new_lob.state = new_state
                 new_lob_project.lob = [new_lob]
 
                 session.add(new_lob_project)
 
-                # populate the project tree
-                # find the existing country and append the new state to it
-                country_tree_item = main_window.project_model.findItems(
-                    country_uuid,
-                    Qt.MatchFlag.MatchExactly,
-                    1
+            # Otherwise, check if the state is already in the database
+            else:
+
+                existing_country = country_query.first()
+                country_id = existing_country.country_id
+                country_uuid = existing_country.project_id
+
+                # If the state is in the database, this query should return it
+                state_query = session.query(StateTable).filter(
+                    StateTable.state_name == state_text
+                ).filter(
+                    StateTable.country_id == country_id
                 )
 
-                if country_tree_item:
-                    ix = main_window.project_model.indexFromItem(country_tree_item[0])
-                    ix_col_0 = main_window.project_model.sibling(ix.row(), 0, ix)
-                    it_col_0 = main_window.project_model.itemFromIndex(ix_col_0)
-                    it_col_0.appendRow([state, QStandardItem(state_uuid)])
-                    state.appendRow([lob, QStandardItem(lob_uuid)])
+                # If the state isn't already in the database, create an entry for it
+                if state_query.first() is None:
 
-            # If the state already exists append the LOB to it
-            else:
-                existing_state = state_query.first()
-                state_uuid = existing_state.project_id
-                lob_uuid = str(uuid4())
+                    # create project ids for state and lob only, since country uuid already exists
+                    state_uuid = str(uuid4())
+                    lob_uuid = str(uuid4())
 
-                lob_location = existing_state.location_id
+                    new_state_location = LocationTable(hierarchy="state")
+                    session.add(new_state_location)
+                    # flush the session to get the newly created location id
+                    session.flush()
 
-                new_lob = LOBTable(
-                    lob_type=lob_text,
-                    project_id=lob_uuid,
-                    location_id=lob_location
-                )
+                    # Create database entry for the state and its associated project
+                    new_state = StateTable(
+                        state_name=state_text,
+                        project_id=state_uuid,
+                        location_id=new_state_location.location_id
+                    )
 
-                new_lob.country = existing_country
-                new_lob.state = existing_state
+                    new_state_project = ProjectTable(
+                        project_id=state_uuid
+                    )
 
-                new_lob_project = ProjectTable(
-                    project_id=lob_uuid
-                )
+                    new_state.country = existing_country
 
-                session.add(new_lob)
-                session.add(new_lob_project)
+                    session.add(new_state_project)
 
-                state_tree_item = main_window.project_model.findItems(
-                    state_uuid,
-                    Qt.MatchFlag.MatchRecursive,
-                    1
-                )
-                # state_tree_item = country_tree_item.findItems(state_uuid, Qt.MatchExactly, 1)
-                if state_tree_item:
-                    ix = main_window.project_model.indexFromItem(state_tree_item[0])
-                    ix_col_0 = main_window.project_model.sibling(ix.row(), 0, ix)
-                    it_col_0 = main_window.project_model.itemFromIndex(ix_col_0)
-                    it_col_0.appendRow([lob, QStandardItem(lob_uuid)])
+                    # Define the new LOB
+                    lob_location = new_state_location.location_id
+
+                    new_lob = LOBTable(
+                        lob_type=lob_text,
+                        project_id=lob_uuid,
+                        location_id=lob_location
+                    )
+
+                    new_lob_project = ProjectTable(
+                        project_id=lob_uuid
+                    )
+
+                    new_lob.country = existing_country
+                    new_lob.state = new_state
+                    new_lob_project.lob = [new_lob]
 
-        session.commit()
+                    session.add(new_lob_project)
 
-        connection.close()
+                    # populate the project tree
+                    # find the existing country and append the new state to it
+                    country_tree_item = main_window.project_model.findItems(
+                        country_uuid,
+                        Qt.MatchFlag.MatchExactly,
+                        1
+                    )
+
+                    if country_tree_item:
+                        ix = main_window.project_model.indexFromItem(country_tree_item[0])
+                        ix_col_0 = main_window.project_model.sibling(ix.row(), 0, ix)
+                        it_col_0 = main_window.project_model.itemFromIndex(ix_col_0)
+                        # Children that have not been fetched yet will include the new state once they are.
+                        if it_col_0.children_fetched:
+                            it_col_0.appendRow([state, QStandardItem(state_uuid)])
+                            state.appendRow([lob, QStandardItem(lob_uuid)])
+
+                # If the state already exists append the LOB to it
+                else:
+                    existing_state = state_query.first()
+                    state_uuid = existing_state.project_id
+                    lob_uuid = str(uuid4())
+
+                    lob_location = existing_state.location_id
+
+                    new_lob = LOBTable(
+                        lob_type=lob_text,
+                        project_id=lob_uuid,
+                        location_id=lob_location
+                    )
+
+                    new_lob.country = existing_country
+                    new_lob.state = existing_state
+
+                    new_lob_project = ProjectTable(
+                        project_id=lob_uuid
+                    )
+
+                    session.add(new_lob)
+                    session.add(new_lob_project)
+
+                    state_tree_item = main_window.project_model.findItems(
+                        state_uuid,
+                        Qt.MatchFlag.MatchRecursive,
+                        1
+                    )
+                    # state_tree_item = country_tree_item.findItems(state_uuid, Qt.MatchExactly, 1)
+                    if state_tree_item:
+                        ix = main_window.project_model.indexFromItem(state_tree_item[0])
+                        ix_col_0 = main_window.project_model.sibling(ix.row(), 0, ix)
+                        it_col_0 = main_window.project_model.itemFromIndex(ix_col_0)
+                        if it_col_0.children_fetched:
+                            it_col_0.appendRow([lob, QStandardItem(lob_uuid)])
 
         # main_window.project_pane.expandAll()
 
@@ -372,6 +386,9 @@ class ProjectTreeView(QTreeView):
 
         self.doubleClicked.connect(self.get_value) # noqa
 
+        self.expanded.connect(self.track_expanded) # noqa
+        self.collapsed.connect(self.track_collapsed) # noqa
+
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.contextMenuEvent)  # noqa
 
@@ -400,6 +417,9 @@ class ProjectTreeView(QTreeView):
             )
             project_id = ix_col_1.data()
 
+        # Imported when first needed, as the data pane imports chainladder, which would slow down startup.
+        from faslr.data import DataPane
+
         open_item_tab(
             title=title,
             tab_widget=self.parent.analysis_pane,
@@ -454,6 +474,32 @@ class ProjectTreeView(QTreeView):
             print("UUID: " + uuid)
             self.parent.analysis_pane.addTab(country_tab, "USA")
 
+    def expand_project_tree(self) -> None:
+        """
+        Expands the whole tree if it has been loaded in full. A lazily loaded tree is left collapsed, since expanding
+        it would fetch every segment in the database.
+        """
+        if not self.model().lazy:
+            self.expandAll()
+
+    def track_expanded(self, index: QModelIndex) -> None:
+        """
+        Tells the model which subtrees are on screen, so that they are not evicted from its cache.
+        """
+        if isinstance(self.model(), ProjectModel):
+            self.model().set_expanded(
+                index=index,
+                expanded=True
+            )
+
+    def track_collapsed(self, index: QModelIndex) -> None:
+
+        if isinstance(self.model(), ProjectModel):
+            self.model().set_expanded(
+                index=index,
+                expanded=False
+            )
+
     def get_uuid(self) -> str:
         """
         Obtains the UUID of the current selection of the project tree.
@@ -473,118 +519,257 @@ class ProjectTreeView(QTreeView):
         uuid: str = self.get_uuid()
         current_item: ProjectItem = self.get_project_item()
         # connect to the database
-        session, connection = connect_db(db_path=core.db)
-        
-        # delete the item from the database with uuid
+        with session_scope(db_path=core.db) as session:
 
-        # Case when selection is a country.
-        if current_item.segment_level == 'country':
+            # delete the item from the database with uuid
 
-            country = session.query(CountryTable).filter(CountryTable.project_id == uuid)
-            country_first = country.first()
-            location_id = country_first.location_id
-            location = session.query(LocationTable).filter(LocationTable.location_id == location_id).one()
-            session.delete(location)
-        else:
-            # Case when selection is an LOB.
-            if current_item.segment_level == 'lob':
-                lob = session.query(LOBTable).filter(LOBTable.project_id == uuid).one()
-                session.delete(lob)
+            # Case when selection is a country.
+            if current_item.segment_level == 'country':
 
-            # Case when selection is a state
-            else:
-                state = session.query(StateTable).filter(StateTable.project_id == uuid)
-                state_first = state.first()
-                location_id = state_first.location_id
+                country = session.query(CountryTable).filter(CountryTable.project_id == uuid)
+                country_first = country.first()
+                location_id = country_first.location_id
                 location = session.query(LocationTable).filter(LocationTable.location_id == location_id).one()
                 session.delete(location)
+            else:
+                # Case when selection is an LOB.
+                if current_item.segment_level == 'lob':
+                    lob = session.query(LOBTable).filter(LOBTable.project_id == uuid).one()
+                    session.delete(lob)
 
-        session.commit()
-        
-        "remove all rows from qtreeview and refresh"
-        self.model().removeRows(0, self.model().rowCount())
-        """
-    Upon connection to an existing database, populates the project tree in the left-hand pane of the
-    main window based on what projects have been saved to the database.
+                # Case when selection is a state
+                else:
+                    state = session.query(StateTable).filter(StateTable.project_id == uuid)
+                    state_first = state.first()
+                    location_id = state_first.location_id
+                    location = session.query(LocationTable).filter(LocationTable.location_id == location_id).one()
+                    session.delete(location)
+
+            session.commit()
+
+        # Rebuild the project tree from the database.
+        self.parent.project_model.reload()
+        self.parent.project_pane.expand_project_tree()
+
+
+class ProjectModel(QStandardItemModel):
     """
+    Holds the country/state/LOB hierarchy shown in the project tree.
+
+    Small databases are loaded in full. For databases with more than eager_limit segments, only the countries are
+    loaded up front; the states of a country and the LOBs of a state are queried when the country or state is
+    expanded, through the canFetchMore/fetchMore protocol of QAbstractItemModel. The most recently used cache_size
+    fetched subtrees are kept, and older ones that are collapsed are released and fetched again if needed.
+
+    Parameters
+    ----------
+    cache_size: int
+        The number of fetched subtrees to keep in a lazily loaded tree.
+    eager_limit: int
+        The largest number of segments for which the whole tree is loaded at once.
+    """
+    def __init__(
+            self,
+            cache_size: int = PROJECT_TREE_CACHE_SIZE,
+            eager_limit: int = PROJECT_TREE_EAGER_LIMIT
+    ):
+        super().__init__()
 
-    # Open up the connection to the database
-        
-        # Query all the countries
-        countries = session.query(
-            CountryTable.country_id,
-            CountryTable.country_name,
-            CountryTable.project_id
-        ).all()
+        self.cache_size = cache_size
+        self.eager_limit = eager_limit
 
-        # Append each row one at a time, brute force method. For each country, add state rows, and
-        # for each state, add LOB rows.
+        self.db_path: Optional[str] = None
+        self.name_filter: Optional[str] = None
+        self.lazy: bool = False
 
-        for country_id, country, country_uuid in countries:
+        # Fetched subtrees in order of use, keyed by (segment_level, segment_id), and those currently expanded.
+        self.fetched: OrderedDict = OrderedDict()
+        self.expanded: set = set()
 
-            country_item = ProjectItem(
-                text=country,
-                set_bold=True,
-                segment_level='country',
-            )
+        self.setHorizontalHeaderLabels(["Project", "Project_UUID"])
+
+        self.project_root = self.invisibleRootItem()
+
+        QGuiApplication.styleHints().colorSchemeChanged.connect(self.toggle_light_dark_text)  # noqa
+
+    def load(
+            self,
+            db_path: str,
+            name_filter: Optional[str] = None
+    ) -> None:
+        """
+        Replaces the contents of the model with the projects stored in the database.
+
+        :param db_path: The path to the project database.
+        :param name_filter: If given, only show segments whose name, or the name of an ancestor or descendant,
+            contains this text. The filter is applied in the database queries.
+        """
+        self.db_path = db_path
+        self.name_filter = name_filter or None
+
+        self.fetched.clear()
+        self.expanded.clear()
+
+        with session_scope(db_path=db_path) as session:
+
+            self.lazy = count_project_segments(session=session) > self.eager_limit
 
-            country_row = [
-                country_item,
-                QStandardItem(country_uuid)
-            ]
-
-            states = session.query(
-                StateTable.state_id,
-                StateTable.state_name,
-                StateTable.project_id
-            ).filter(
-                StateTable.country_id == country_id
+            populate_project_model(
+                session=session,
+                project_model=self,
+                name_filter=self.name_filter,
+                lazy=self.lazy
             )
 
-            for state_id, state, state_uuid in states:
+    def reload(self) -> None:
+        """
+        Reloads the model from its database, keeping the current name filter.
+        """
+        self.load(
+            db_path=self.db_path,
+            name_filter=self.name_filter
+        )
 
-                state_item = ProjectItem(
-                    state,
-                    segment_level='state'
-                )
+    def set_name_filter(self, name_filter: Optional[str]) -> None:
 
-                state_row = [state_item, QStandardItem(state_uuid)]
+        self.load(
+            db_path=self.db_path,
+            name_filter=name_filter
+        )
 
-                lobs = session.query(
-                    LOBTable.lob_type, LOBTable.project_id
-                ).join(
-                    LocationTable
-                ).join(
-                    StateTable
-                ).filter(
-                    StateTable.country_id == country_id
-                ).filter(
-                    StateTable.state_id == state_id
+    def _unfetched_item(self, parent: QModelIndex) -> Optional[ProjectItem]:
+        """
+        Returns the item at parent if it is a country or state whose children have yet to be fetched.
+        """
+        if not parent.isValid() or parent.column() != 0:
+            return None
+
+        item = self.itemFromIndex(parent)
+
+        if isinstance(item, ProjectItem) and not item.children_fetched:
+            return item
+        else:
+            return None
+
+    def hasChildren(
+            self,
+            parent: QModelIndex = QModelIndex()
+    ) -> bool:
+
+        # Assume an unfetched country or state has children so that the view offers to expand it.
+        if self._unfetched_item(parent) is not None:
+            return True
+
+        return super().hasChildren(parent)
+
+    def canFetchMore(
+            self,
+            parent: QModelIndex
+    ) -> bool:
+
+        return self._unfetched_item(parent) is not None
+
+    def fetchMore(
+            self,
+            parent: QModelIndex
+    ) -> None:
+
+        item = self._unfetched_item(parent)
+
+        if item is None:
+            return
+
+        with session_scope(db_path=self.db_path) as session:
+
+            if item.segment_level == 'country':
+                rows = build_state_rows(
+                    states=[
+                        (state_id, state_name, state_uuid) for _, state_id, state_name, state_uuid in query_states(
+                            session=session,
+                            country_id=item.segment_id,
+                            name_filter=self.name_filter
+                        )
+                    ],
+                    lobs={},
+                    fetched=False
+                )
+            else:
+                rows = build_lob_rows(
+                    lobs=[
+                        (lob_type, lob_uuid) for _, lob_type, lob_uuid in query_lobs(
+                            session=session,
+                            state_id=item.segment_id,
+                            name_filter=self.name_filter
+                        )
+                    ]
                 )
 
-                for lob, lob_uuid in lobs:
-                    lob_item = ProjectItem(
-                        lob,
-                        text_color=QColor(0, 77, 122)
-                    )
+        item.children_fetched = True
 
-                    lob_row = [lob_item, QStandardItem(lob_uuid)]
+        for row in rows:
+            item.appendRow(row)
 
-                    state_item.appendRow(lob_row)
+        key = (item.segment_level, item.segment_id)
+        self.fetched[key] = item
 
-                country_item.appendRow(state_row)
+        # Trim the cache once the view has finished laying out the fetched rows.
+        if len(self.fetched) > self.cache_size:
+            QTimer.singleShot(0, self.evict)
 
-            self.parent.project_model.project_root.appendRow(country_row)
+    def set_expanded(
+            self,
+            index: QModelIndex,
+            expanded: bool
+    ) -> None:
+        """
+        Records whether a subtree is expanded in the view. Expanding a subtree also marks it as recently used.
+        """
+        item = self.itemFromIndex(index.siblingAtColumn(0))
 
-        self.parent.project_pane.expandAll()
+        if not isinstance(item, ProjectItem) or item.segment_id is None:
+            return
 
-        connection.close()
+        key = (item.segment_level, item.segment_id)
 
+        if expanded:
+            self.expanded.add(key)
+            if key in self.fetched:
+                self.fetched.move_to_end(key)
+        else:
+            self.expanded.discard(key)
 
-class ProjectModel(QStandardItemModel):
-    def __init__(self):
-        super().__init__()
+    def evict(self) -> None:
+        """
+        Releases the least recently used collapsed subtrees until at most cache_size remain.
+        """
+        for key in list(self.fetched.keys()):
 
-        self.setHorizontalHeaderLabels(["Project", "Project_UUID"])
+            if len(self.fetched) <= self.cache_size:
+                break
 
-        self.project_root = self.invisibleRootItem()
+            if key in self.expanded or key not in self.fetched:
+                continue
+
+            item = self.fetched.pop(key)
+
+            # The states of an evicted country go with it.
+            for row in range(item.rowCount()):
+                child = item.child(row, 0)
+                child_key = (child.segment_level, child.segment_id)
+                self.fetched.pop(child_key, None)
+                self.expanded.discard(child_key)
+
+            item.removeRows(0, item.rowCount())
+            item.children_fetched = False
+
+    def toggle_light_dark_text(self, theme: Qt.ColorScheme) -> None:
+        """
+        Recolors the items that were built without their own connection to theme changes.
+        """
+        items = [self.project_root.child(row, 0) for row in range(self.project_root.rowCount())]
+
+        while items:
+            item = items.pop()
+            if isinstance(item, ProjectItem) and not item.follow_theme:
+                item.toggle_light_dark_text(theme)
+            items.extend(item.child(row, 0) for row in range(item.rowCount()))
@@ -14,6 +14,14 @@ from PyQt6.QtGui import (
 )
 
 
+def get_project_text_color() -> QColor:
+    """
+    Returns the default text color of project items for the current light/dark theme.
+    """
+    theme = QGuiApplication.styleHints().colorScheme()  # noqa
+    return PROJECT_ITEM_TEXT_DARK if theme == Qt.ColorScheme.Dark else PROJECT_ITEM_TEXT_LIGHT
+
+
 class ProjectItem(QStandardItem):
     """
     Represents a row in the project tree. Can be nested within other project items.
@@ -31,6 +39,14 @@ class ProjectItem(QStandardItem):
     :type set_bold: bool
     :param text_color: The color of the text label.
     :type text_color: QColor
+    :param follow_theme: Whether the item connects itself to theme changes. Items built in bulk pass False and leave
+        this to the ProjectModel, since one connection per item is slow for large trees.
+    :type follow_theme: bool
+    :param segment_id: The database id of the country or state the item represents, used to fetch its children.
+    :type segment_id: int
+    :param children_fetched: Whether the item's children have been loaded. False for countries and states of a
+        lazily loaded tree whose children will be fetched when they are expanded.
+    :type children_fetched: bool
 
     """
     def __init__(
@@ -39,7 +55,10 @@ class ProjectItem(QStandardItem):
             segment_level: str,
             font_size: int = 12,
             set_bold: bool = False,
-            text_color: QColor = None
+            text_color: QColor = None,
+            follow_theme: bool = True,
+            segment_id: int = None,
+            children_fetched: bool = True
     ):
         super().__init__()
 
@@ -51,18 +70,21 @@ class ProjectItem(QStandardItem):
 
         # Set the text color based on theme.
         if not text_color:
-            theme = QGuiApplication.styleHints().colorScheme()  # noqa
-            self.text_color = PROJECT_ITEM_TEXT_DARK if theme == Qt.ColorScheme.Dark else PROJECT_ITEM_TEXT_LIGHT
+            self.text_color = get_project_text_color()
         else:
             self.text_color = text_color
 
         self.segment_level: str = segment_level
+        self.follow_theme: bool = follow_theme
+        self.segment_id: int = segment_id
+        self.children_fetched: bool = children_fetched
         self.text_color = self.text_color
         self.setForeground(self.text_color)
         self.setFont(project_font)
         self.setText(text)
 
-        QGuiApplication.styleHints().colorSchemeChanged.connect(self.toggle_light_dark_text)  # noqa
+        if follow_theme:
+            QGuiApplication.styleHints().colorSchemeChanged.connect(self.toggle_light_dark_text)  # noqa
 
     def toggle_light_dark_text(self, theme: Qt.ColorScheme) -> None:
         color = QColor(255, 255, 255) if theme == Qt.ColorScheme.Dark else QColor(0, 0, 0)
@@ -478,3 +478,138 @@ class IndexValuesTable(Base):
                    self.year,
                    self.change
                )
+
+
+class BatchRunTable(Base):
+    __tablename__ = 'batch_run'
+
+    run_id = Column(
+        Integer,
+        primary_key=True
+    )
+
+    started = Column(
+        DateTime,
+        default=datetime.now
+    )
+
+    finished = Column(
+        DateTime
+    )
+
+    iterations = Column(
+        Integer
+    )
+
+    def __repr__(self):
+        return "BatchRunTable(" \
+               "started='%s', " \
+               "finished='%s', " \
+               "iterations='%s'" \
+               ")>" % (
+                   self.started,
+                   self.finished,
+                   self.iterations
+               )
+
+
+class BatchResultTable(Base):
+    __tablename__ = 'batch_result'
+
+    result_id = Column(
+        Integer,
+        primary_key=True
+    )
+
+    run_id = Column(
+        Integer,
+        ForeignKey('batch_run.run_id')
+    )
+
+    view_id = Column(
+        Integer,
+        ForeignKey('project_view.view_id')
+    )
+
+    seconds = Column(
+        Float
+    )
+
+    error = Column(
+        String
+    )
+
+    def __repr__(self):
+        return "BatchResultTable(" \
+               "run_id='%s', " \
+               "view_id='%s', " \
+               "seconds='%s', " \
+               "error='%s'" \
+               ")>" % (
+                   self.run_id,
+                   self.view_id,
+                   self.seconds,
+                   self.error
+               )
+
+
+class BatchResultData(Base):
+    __tablename__ = 'batch_result_data'
+
+    record_id = Column(
+        Integer,
+        primary_key=True
+    )
+
+    result_id = Column(
+        Integer,
+        ForeignKey('batch_result.result_id')
+    )
+
+    accident_year = Column(
+        Integer
+    )
+
+    reported_loss = Column(
+        Float
+    )
+
+    paid_loss = Column(
+        Float
+    )
+
+    reported_cdf = Column(
+        Float
+    )
+
+    paid_cdf = Column(
+        Float
+    )
+
+    chainladder_reported = Column(
+        Float
+    )
+
+    chainladder_paid = Column(
+        Float
+    )
+
+    expected_loss = Column(
+        Float
+    )
+
+    bornhuetter_reported = Column(
+        Float
+    )
+
+    bornhuetter_paid = Column(
+        Float
+    )
+
+    benktander_reported = Column(
+        Float
+    )
+
+    benktander_paid = Column(
+        Float
+    )
@@ -5,6 +5,7 @@ Module containing classes pertaining to application settings.
 from __future__ import annotations
 
 import configparser
+import faslr.core as core
 import logging
 import os
 
@@ -15,6 +16,11 @@ from faslr.constants import (
     SETTINGS_LIST
 )
 
+from faslr.utilities.fit_cache import (
+    configure_fit_cache,
+    fit_cache
+)
+
 from PyQt6.QtCore import (
     QAbstractListModel,
     QCoreApplication,
@@ -29,10 +35,12 @@ from PyQt6.QtGui import (
 
 from PyQt6.QtWidgets import (
     QButtonGroup,
+    QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
     QFileDialog,
+    QFormLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
@@ -139,19 +147,22 @@ class SettingsDialog(QDialog):
         self.user_container = QWidget()
         self.plot_container = QWidget()
         self.display_container = QWidget()
+        self.cache_container = QWidget()
 
         self.startup_unconnected_layout()
         self.startup_connected_layout()
         self.user_layout()
         self.plot_layout()
         self.display_layout()
+        self.cache_layout()
 
         for widget in [
             self.startup_connected_container,
             self.startup_unconnected_container,
             self.user_container,
             self.plot_container,
-            self.display_container
+            self.display_container,
+            self.cache_container
         ]:
 
             self.configuration_layout.addWidget(widget)
@@ -194,6 +205,9 @@ class SettingsDialog(QDialog):
             self.configuration_layout.setCurrentIndex(3)
         elif index.data() == "Display":
             self.configuration_layout.setCurrentIndex(4)
+        elif index.data() == "Cache":
+            self.update_cache_stats()
+            self.configuration_layout.setCurrentIndex(5)
 
     def startup_unconnected_layout(self) -> None:
         """
@@ -288,6 +302,97 @@ class SettingsDialog(QDialog):
 
         self.display_container.setLayout(theme_layout)
 
+    def cache_layout(self) -> None:
+        """
+        Layout that shows how often fitted models have been loaded from the fit cache rather than refitted, and lets
+        the user save the fits next to the database or clear them.
+        """
+
+        layout = QVBoxLayout()
+        stats_layout = QFormLayout()
+
+        stats_groupbox = QGroupBox("Fitted Model Cache")
+        stats_groupbox.setLayout(stats_layout)
+
+        self.cache_labels = {
+            name: QLabel() for name in [
+                "Fitted models",
+                "Memory used",
+                "Hits",
+                "Disk hits",
+                "Misses",
+                "Evictions"
+            ]
+        }
+
+        for name, label in self.cache_labels.items():
+            stats_layout.addRow(name + ": ", label)
+
+        self.persist_cache_checkbox = QCheckBox("Save fitted models next to the database")
+        self.persist_cache_checkbox.setChecked(core.fit_cache_persist)
+        self.persist_cache_checkbox.toggled.connect(self.set_cache_persist)  # noqa
+
+        self.clear_cache_button = QPushButton("Clear Cache")
+        self.clear_cache_button.setStatusTip("Remove the fitted models from memory and from disk.")
+        self.clear_cache_button.clicked.connect(self.clear_cache)  # noqa
+
+        layout.addWidget(stats_groupbox)
+        layout.addWidget(self.persist_cache_checkbox)
+        layout.addWidget(self.clear_cache_button)
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        self.update_cache_stats()
+
+        self.cache_container.setLayout(layout)
+
+    def update_cache_stats(self) -> None:
+        """
+        Refreshes the fit cache statistics shown in the cache layout.
+        """
+
+        self.cache_labels["Fitted models"].setText(str(fit_cache.n_entries))
+        self.cache_labels["Memory used"].setText(
+            "{:.1f} of {:.0f} MB".format(
+                fit_cache.n_bytes / 1024 ** 2,
+                fit_cache.max_bytes / 1024 ** 2
+            )
+        )
+        self.cache_labels["Hits"].setText(str(fit_cache.stats['hits']))
+        self.cache_labels["Disk hits"].setText(str(fit_cache.stats['disk_hits']))
+        self.cache_labels["Misses"].setText(str(fit_cache.stats['misses']))
+        self.cache_labels["Evictions"].setText(str(fit_cache.stats['evictions']))
+
+    def set_cache_persist(
+            self,
+            checked: bool
+    ) -> None:
+        """
+        Saves whether fitted models are saved next to the database, and applies it to the current connection.
+        """
+
+        core.fit_cache_persist = checked
+
+        configure_fit_cache(
+            db_path=core.db,
+            persist=checked
+        )
+
+        if not self.config.has_section('FIT_CACHE'):
+            self.config.add_section('FIT_CACHE')
+
+        self.config['FIT_CACHE']['persist'] = str(checked)
+        with open(self.config_path, 'w') as configfile:
+            self.config.write(configfile)
+
+    def clear_cache(self) -> None:
+        """
+        Removes every fitted model from the fit cache, including those saved next to the database.
+        """
+
+        fit_cache.clear(disk=True)
+        fit_cache.reset_stats()
+        self.update_cache_stats()
+
 
     def reset_connection(self) -> None:
         """
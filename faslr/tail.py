@@ -31,6 +31,8 @@ from faslr.style.plot.xkcd import (
     draw_stick_figure
 )
 
+from faslr.utilities.fit_cache import fit_cache
+
 from functools import partial
 
 from matplotlib.backends.backend_qt5agg import (
@@ -208,12 +210,15 @@ class TailPane(QWidget):
                     attach: int = tail_params.constant_config.sb_attach.spin_box.value()
                     projection: int = tail_params.constant_config.sb_projection.spin_box.value()
 
-                    tc = cl.TailConstant(
-                        tail=tail_constant,
-                        decay=decay,
-                        attachment_age=attach,
-                        projection_period=projection
-                    ).fit_transform(self.triangle)
+                    tc = fit_cache.fit(
+                        estimator=cl.TailConstant(
+                            tail=tail_constant,
+                            decay=decay,
+                            attachment_age=attach,
+                            projection_period=projection
+                        ),
+                        triangle=self.triangle
+                    )
 
                 elif gb_tail_type.curve_btn.isChecked():
 
@@ -227,33 +232,23 @@ class TailPane(QWidget):
                     attachment_age: int = curve_config.attachment_age.spin_box.value()
                     projection_period: int = curve_config.projection.spin_box.value()
 
-                    tc = cl.TailCurve(
-                        curve=curve,
-                        fit_period=(
-                            fit_from,
-                            fit_to
+                    # The fitted curve provides both the tail and the slope and intercept of the diagnostic plot.
+                    tc = fit_cache.fit(
+                        estimator=cl.TailCurve(
+                            curve=curve,
+                            fit_period=(
+                                fit_from,
+                                fit_to
+                            ),
+                            extrap_periods=extrap_periods,
+                            errors=errors,
+                            attachment_age=attachment_age,
+                            projection_period=projection_period
                         ),
-                        extrap_periods=extrap_periods,
-                        errors=errors,
-                        attachment_age=attachment_age,
-                        projection_period=projection_period
-
-                    ).fit_transform(self.triangle)
-
-                    tcd = cl.TailCurve(
-                        curve=curve,
-                        fit_period=(
-                            fit_from,
-                            fit_to
-                        ),
-                        extrap_periods=extrap_periods,
-                        errors=errors,
-                        attachment_age=attachment_age,
-                        projection_period=projection_period
-
-                    ).fit(self.triangle)
+                        triangle=self.triangle
+                    )
 
-                    tcds.append(tcd)
+                    tcds.append(tc)
 
                 elif gb_tail_type.bondy_btn.isChecked():
 
@@ -262,11 +257,14 @@ class TailPane(QWidget):
                     attachment_age: int = bondy.attachment_age.spin_box.value()
                     projection_period: int = bondy.projection.spin_box.value()
 
-                    tc = cl.TailBondy(
-                        earliest_age=earliest_age,
-                        attachment_age=attachment_age,
-                        projection_period=projection_period
-                    ).fit_transform(self.triangle)
+                    tc = fit_cache.fit(
+                        estimator=cl.TailBondy(
+                            earliest_age=earliest_age,
+                            attachment_age=attachment_age,
+                            projection_period=projection_period
+                        ),
+                        triangle=self.triangle
+                    )
 
                 elif gb_tail_type.clark_btn.isChecked():
 
@@ -277,12 +275,15 @@ class TailPane(QWidget):
                     attachment_age: int = clark.attachment_age.spin_box.value()
                     projection_period: int = clark.projection.spin_box.value()
 
-                    tc = cl.TailClark(
-                        growth=growth,
-                        truncation_age=truncation_age,
-                        attachment_age=attachment_age,
-                        projection_period=projection_period
-                    ).fit_transform(self.triangle)
+                    tc = fit_cache.fit(
+                        estimator=cl.TailClark(
+                            growth=growth,
+                            truncation_age=truncation_age,
+                            attachment_age=attachment_age,
+                            projection_period=projection_period
+                        ),
+                        triangle=self.triangle
+                    )
 
                 else:
                     raise Exception("Invalid tail type selected.")
@@ -404,7 +405,10 @@ class TailPane(QWidget):
 
                 # base
 
-                tcb = cl.Development().fit_transform(self.triangle)
+                tcb = fit_cache.fit(
+                    estimator=cl.Development(),
+                    triangle=self.triangle
+                )
                 obs = (tcb.ldf_ - 1).T.iloc[:, 0]
                 obs[obs < 0] = np.nan
                 ax = np.log(obs).rename('Selected LDF')
@@ -2,6 +2,8 @@ import os
 import pytest
 import shutil
 
+from faslr.connection import engine_registry
+
 from faslr.constants import (
     CONFIG_TEMPLATES_PATH,
     DEFAULT_DIALOG_PATH
@@ -43,4 +45,7 @@ def sample_db() -> str:
     shutil.copy(db_filename, test_db_filename)
     yield test_db_filename
 
+    # Close pooled connections so that the next copy is not read through connections to this one.
+    engine_registry.dispose(db_path=test_db_filename)
+
     os.remove(test_db_filename)
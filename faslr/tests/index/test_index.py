@@ -5,12 +5,23 @@ import pandas as pd
 import pytest
 
 import faslr.core as core
+from faslr.connection import session_scope
+
 from faslr.index import (
     calculate_index_factors,
+    clear_index_cache,
+    FIndex,
     IndexInventory
 )
 
+from faslr.index.index import index_cache
+
+from faslr.schema import IndexValuesTable
+
+from faslr.constants import TREND_CACHE_SIZE
+
 from faslr.methods.expected_loss import (
+    ExpectedLossRatioModel,
     ExpectedLossWidget
 )
 
@@ -181,6 +192,123 @@ def test_calculate_index_factors(
     )
 
 
+def test_index_matrix() -> None:
+    """
+    Test that the index matrix brings each year to the level of every other year, and that it is recalculated when
+    the changes are modified.
+    """
+
+    index = FIndex(
+        origin=[2020, 2021, 2022],
+        changes=[.5, .1, .2],
+        name='Test Index',
+        description='Test index.'
+    )
+
+    matrix = pd.DataFrame(
+        data=[
+            [1, 1.1, 1.32],
+            [1 / 1.1, 1, 1.2],
+            [1 / 1.32, 1 / 1.2, 1]
+        ],
+        index=[2020, 2021, 2022],
+        columns=['2020', '2021', '2022']
+    )
+
+    pd.testing.assert_frame_equal(
+        left=index.matrix,
+        right=matrix
+    )
+
+    pd.testing.assert_frame_equal(
+        left=index.apply_matrix(values=[100, 200, 300]),
+        right=matrix.mul([100, 200, 300], axis=0)
+    )
+
+    index.changes[2] = .3
+
+    assert index.matrix.loc[2020, '2022'] == pytest.approx(1.43)
+
+
+def test_load_many(f_core) -> None:
+    """
+    Test that indexes loaded together match those loaded one at a time, that they are cached, and that the cache is
+    emptied when index values are written.
+    """
+
+    clear_index_cache()
+
+    indexes = FIndex.load_many(ids=[3, 1, 2])
+
+    assert [index.id for index in indexes] == [3, 1, 2]
+    assert len(index_cache) == 3
+
+    for index in indexes:
+        expected = FIndex(from_id=index.id)
+
+        assert index.name == expected.name
+        assert index.description == expected.description
+        assert index.origin == expected.origin
+        assert index.changes == expected.changes
+
+    # Modifying a loaded index leaves the cached values alone.
+    indexes[0].changes[0] = 10
+
+    assert FIndex(from_id=3).changes[0] != 10
+
+    with pytest.raises(ValueError):
+        FIndex.load_many(ids=[1, 10000])
+
+    with session_scope(db_path=core.db) as session:
+        value = session.query(IndexValuesTable).filter(IndexValuesTable.index_id == 1).first()
+        value.change = .5
+
+    assert len(index_cache) == 0
+    assert .5 in FIndex(from_id=1).changes
+
+    with session_scope(db_path=core.db) as session:
+        session.query(IndexValuesTable).filter(IndexValuesTable.index_id == 1).delete()
+
+    assert len(index_cache) == 0
+    assert FIndex(from_id=1).changes == []
+
+    clear_index_cache()
+
+
+def test_compose_trend() -> None:
+    """
+    Test that composed trends are cached regardless of the order of the indexes, and that the cache is bounded.
+    """
+
+    origin = [2020, 2021, 2022]
+
+    first = FIndex(origin=origin, changes=[0, .1, .2])
+    second = FIndex(origin=origin, changes=[0, .05, -.1])
+
+    ExpectedLossRatioModel.trend_cache.clear()
+
+    composed = ExpectedLossRatioModel.compose_trend(origin=origin, indexes=[first, second])
+
+    assert composed.changes == pytest.approx([0, .155, .08])
+
+    assert ExpectedLossRatioModel.compose_trend(origin=origin, indexes=[second, first]) is composed
+
+    # A single index is used as-is, while no indexes give a flat trend.
+    assert ExpectedLossRatioModel.compose_trend(origin=origin, indexes=[first]) is first
+    assert ExpectedLossRatioModel.compose_trend(origin=origin, indexes=[]).changes == [0, 0, 0]
+
+    for i in range(TREND_CACHE_SIZE):
+        ExpectedLossRatioModel.compose_trend(
+            origin=origin,
+            indexes=[first, FIndex(origin=origin, changes=[0, 0, i / 100])]
+        )
+
+    assert len(ExpectedLossRatioModel.trend_cache) == TREND_CACHE_SIZE
+    assert ExpectedLossRatioModel.compose_trend(origin=origin, indexes=[first, second]) is not composed
+
+    ExpectedLossRatioModel.trend_cache.clear()
+
+
 # def test_add_indexes(
 #         qtbot: QtBot,
 #         expected_loss: ExpectedLossWidget
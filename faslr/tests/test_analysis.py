@@ -1,12 +1,15 @@
+import pytest
 import sys
 
 from faslr.analysis import (
     AnalysisTab,
     MackCriticalSpinBox,
+    MackTestResults,
     MackValuationModel
 )
 
 from faslr.constants import (
+    MACK_DEVELOPMENT_CRITICAL,
     MACK_VALUATION_CRITICAL
 )
 
@@ -15,7 +18,10 @@ from PyQt6.QtWidgets import (
     QDoubleSpinBox
 )
 from PyQt6.QtCore import QSize, Qt
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import (
+    QApplication,
+    QLabel
+)
 
 app = QApplication(sys.argv)
 
@@ -60,6 +66,137 @@ def test_analysis_single_column(qtbot) -> None:
     )
 
 
+def test_analysis_set_triangle(qtbot) -> None:
+
+    auto = load_sample('us_industry_auto')
+    auto_tab = AnalysisTab(
+        triangle=auto
+    )
+
+    # Diagnostics are built when first shown.
+    assert auto_tab.diagnostic_widgets == {}
+
+    auto_tab.value_box.setCurrentText("Diagnostics")
+    assert list(auto_tab.diagnostic_widgets) == auto_tab.column_list
+
+    # A triangle with the same columns reuses the views, and its diagnostics replace the old ones.
+    paid_view = auto_tab.triangle_views['Paid Claims']
+    auto_tab.set_triangle(triangle=auto.incr_to_cum())
+
+    assert auto_tab.triangle_views['Paid Claims'] is paid_view
+    assert list(auto_tab.diagnostic_widgets) == auto_tab.column_list
+
+    # A triangle with different columns rebuilds the column tabs.
+    auto_tab.value_box.setCurrentText("Values")
+    auto_tab.set_triangle(triangle=auto['Paid Claims'])
+
+    assert auto_tab.column_list == ['Paid Claims']
+    assert auto_tab.column_tab.count() == 1
+    assert auto_tab.diagnostic_widgets == {}
+
+
+def test_analysis_diagnostics(qtbot) -> None:
+
+    auto = load_sample('us_industry_auto')
+    auto_tab = AnalysisTab(
+        triangle=auto
+    )
+
+    # The tests run on the thread pool, and the group boxes are built when they finish.
+    auto_tab.value_box.setCurrentText("Diagnostics")
+
+    assert auto_tab.mack_valuation_groupboxes == {}
+
+    qtbot.waitUntil(
+        lambda: len(auto_tab.mack_development_groupboxes) == 2,
+        timeout=30000
+    )
+
+    results = auto_tab.mack_results['Paid Claims']
+    groupbox = auto_tab.mack_development_groupboxes['Paid Claims']
+
+    assert groupbox.test_result_label.test_bool == results.calculate(
+        test_type="development correlation",
+        critical=MACK_DEVELOPMENT_CRITICAL
+    )
+
+    # Each critical value is tested once.
+    n_results = len(results.results)
+
+    groupbox.spin_box.setValue(.3)
+    groupbox.spin_box.setValue(MACK_DEVELOPMENT_CRITICAL)
+    groupbox.spin_box.setValue(.3)
+
+    assert len(results.results) == n_results + 1
+
+    # Results of a triangle that has been replaced are not shown.
+    auto_tab.set_triangle(triangle=auto.incr_to_cum())
+    auto_tab.fill_diagnostics(outcome=('Paid Claims', results))
+
+    assert auto_tab.mack_development_groupboxes == {}
+
+
+def test_analysis_diagnostics_error(
+        qtbot,
+        monkeypatch
+) -> None:
+
+    auto = load_sample('us_industry_auto')['Paid Claims']
+    auto_tab = AnalysisTab(
+        triangle=auto
+    )
+
+    def fail(self) -> None:
+        raise ValueError("Not enough data.")
+
+    monkeypatch.setattr(MackTestResults, 'calculate_defaults', fail)
+
+    auto_tab.value_box.setCurrentText("Diagnostics")
+
+    container = auto_tab.analysis_containers['Paid Claims']
+
+    # The error replaces the placeholder, and the column is forgotten so that the calculation can be retried.
+    qtbot.waitUntil(
+        lambda: 'Paid Claims' not in auto_tab.diagnostic_widgets,
+        timeout=30000
+    )
+
+    assert "Not enough data." in container.widget(1).findChild(QLabel).text()
+
+    monkeypatch.undo()
+
+    auto_tab.value_box.setCurrentText("Values")
+    auto_tab.value_box.setCurrentText("Diagnostics")
+
+    qtbot.waitUntil(
+        lambda: 'Paid Claims' in auto_tab.mack_development_groupboxes,
+        timeout=30000
+    )
+
+    assert container.count() == 2
+
+
+def test_mack_test_results() -> None:
+
+    auto = load_sample('us_industry_auto')['Paid Claims']
+
+    results = MackTestResults(triangle=auto)
+    results.calculate_defaults()
+
+    assert len(results.results) == 3
+
+    assert results.calculate(
+        test_type="valuation correlation",
+        critical=MACK_VALUATION_CRITICAL
+    ) == auto.valuation_correlation(p_critical=MACK_VALUATION_CRITICAL, total=True).z_critical.values[0][0]
+
+    with pytest.raises(ValueError):
+        results.calculate(
+            test_type="unknown",
+            critical=.1
+        )
+
+
 def test_mack_valuation_model(qtbot) -> None:
     auto = load_sample('us_industry_auto')
     sb = MackCriticalSpinBox(
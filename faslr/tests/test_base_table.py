@@ -1,8 +1,16 @@
+import numpy as np
+import pandas as pd
+
 from faslr.base_table import (
     FAbstractTableModel,
     FTableView
 )
 
+from faslr.style.triangle import (
+    PERCENT_STYLE,
+    VALUE_STYLE
+)
+
 from pytestqt.qtbot import QtBot
 
 from PyQt6.QtCore import Qt
@@ -21,6 +29,106 @@ def test_f_abstract_table_model(qtbot: QtBot) -> None:
     assert column_count_test == 0
 
 
+class FormattedTableModel(FAbstractTableModel):
+
+    column_formats = {
+        'Loss Ratio': PERCENT_STYLE
+    }
+
+    default_format = VALUE_STYLE
+
+    def __init__(self):
+        super().__init__()
+
+        self._data = pd.DataFrame(
+            data={
+                'Losses': [1000.0, np.nan, 3000.0],
+                'Loss Ratio': [0.5, 0.75, np.nan]
+            }
+        )
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+
+        self._data.iloc[index.row(), index.column()] = value
+
+        self.dataChanged.emit(index, index)  # noqa
+
+        return True
+
+
+def test_f_abstract_table_model_display(qtbot: QtBot) -> None:
+
+    table_model = FormattedTableModel()
+
+    def display(row: int, column: int) -> str:
+        return table_model.data(
+            table_model.index(row, column),
+            Qt.ItemDataRole.DisplayRole
+        )
+
+    assert [display(row, 0) for row in range(3)] == ['1,000', '', '3,000']
+    assert [display(row, 1) for row in range(3)] == ['50.0%', '75.0%', '']
+
+    # Roles without a handler return nothing.
+    assert table_model.data(table_model.index(0, 0), Qt.ItemDataRole.ToolTipRole) is None
+
+    # Edits made through setData are reflected in the loaded columns.
+    table_model.setData(table_model.index(1, 0), 2000.0)
+
+    assert display(1, 0) == '2,000'
+
+    # Assigning new data discards the loaded columns.
+    table_model._data = pd.DataFrame(data={'Losses': [5.0]})
+
+    assert table_model.column_values is None
+    assert display(0, 0) == '5'
+
+
+def test_f_abstract_table_model_update_data(qtbot: QtBot) -> None:
+
+    table_model = FormattedTableModel()
+
+    changes = []
+
+    table_model.dataChanged.connect(  # noqa
+        lambda top_left, bottom_right, roles: changes.append(
+            (top_left.row(), bottom_right.row(), top_left.column(), bottom_right.column())
+        )
+    )
+
+    data = table_model._data.copy()
+    data.iloc[2, 0] = 4000.0
+
+    # Only the changed cell is updated.
+    with qtbot.assertNotEmitted(table_model.layoutChanged):
+        table_model.update_data(data=data)
+
+    assert changes == [(2, 2, 0, 0)]
+    assert table_model.repaint_requests == 1
+    assert table_model.repainted_cells == 1
+
+    # Nothing is emitted when the data are the same.
+    table_model.update_data(data=data.copy())
+
+    assert table_model.repaint_requests == 1
+
+    # Changes made in place are found by comparing against a copy.
+    previous = table_model._data.copy()
+    table_model._data.iloc[0, 0] = np.nan
+    table_model._data.iloc[1, 1] = 0.25
+    table_model.emit_changes(previous=previous)
+
+    assert changes[1:] == [(0, 1, 0, 1)]
+    assert table_model.data(table_model.index(1, 1), Qt.ItemDataRole.DisplayRole) == '25.0%'
+
+    # A change of shape changes the layout.
+    with qtbot.waitSignal(table_model.layoutChanged):
+        table_model.update_data(data=data.iloc[:2])
+
+    assert table_model.repaint_requests == 3
+    assert table_model.repainted_cells == 1 + 4 + 4
+
+
 # def test_f_table_view_horizontal(qtbot: QtBot) -> None:
 #
 #     table_view = FTableView()
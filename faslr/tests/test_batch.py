@@ -0,0 +1,74 @@
+import numpy as np
+import os
+import pandas as pd
+import shutil
+import sqlite3
+
+from faslr.batch import (
+    format_report,
+    main,
+    run_batch
+)
+
+from faslr.connection import session_scope
+
+from faslr.schema import ProjectViewTable
+
+from faslr.utilities.fit_cache import fit_cache_directory
+
+
+def test_run_batch(sample_db: str) -> None:
+
+    # A view without any data, which cannot be made into a triangle.
+    with session_scope(db_path=sample_db) as session:
+        empty_view = ProjectViewTable(name="Empty")
+        session.add(empty_view)
+        session.flush()
+        empty_id = empty_view.view_id
+
+    report = run_batch(
+        db_path=sample_db,
+        max_workers=2,
+        iterations=2
+    )
+
+    assert [outcome['view_id'] for outcome in report['views']] == [1, empty_id]
+
+    ok, failed = report['views']
+
+    assert ok['error'] is None
+    assert failed['error']
+
+    assert "1 failed" in format_report(report=report)
+
+    with sqlite3.connect(sample_db) as connection:
+        results = pd.read_sql(
+            "SELECT * FROM batch_result_data JOIN batch_result USING (result_id) WHERE run_id = ?",
+            con=connection,
+            params=(report['run_id'],)
+        )
+
+    assert (results['view_id'] == 1).all()
+    assert results['accident_year'].tolist() == list(range(1999, 2009))
+
+    # The methods agree for fully developed accident years.
+    mature = results[results['reported_cdf'] == 1]
+
+    assert len(mature)
+
+    for column in ['chainladder_reported', 'bornhuetter_reported', 'benktander_reported']:
+        np.testing.assert_allclose(
+            mature[column],
+            mature['reported_loss']
+        )
+
+    # Only the view that failed makes the command's exit status nonzero.
+    assert main([sample_db, '--workers', '1', '--views', '1']) == 0
+    assert main([sample_db, '--workers', '1']) == 1
+
+    # Fits are only saved next to the database when asked for.
+    assert not os.path.isdir(fit_cache_directory(db_path=sample_db))
+    assert main([sample_db, '--workers', '1', '--views', '1', '--cache']) == 0
+    assert os.listdir(fit_cache_directory(db_path=sample_db))
+
+    shutil.rmtree(fit_cache_directory(db_path=sample_db))
@@ -3,8 +3,12 @@ import pytest
 
 from faslr.connection import (
     ConnectionDialog,
+    EngineRegistry,
     FaslrConnection,
-    connect_db
+    engine_registry,
+    populate_project_model,
+    query_project_tree,
+    session_scope
 )
 
 from faslr.constants import (
@@ -13,10 +17,19 @@ from faslr.constants import (
 
 from faslr.core import get_startup_db_path
 
+from faslr.project import ProjectModel
+
+from faslr.schema import (
+    CountryTable,
+    LOBTable,
+    StateTable
+)
+
 from faslr.constants import DEFAULT_DIALOG_PATH
 
 from faslr.__main__ import MainWindow
 
+from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm.session import Session
@@ -31,6 +44,8 @@ from pynput.keyboard import (
 
 from PyQt6.QtCore import QTimer, Qt
 
+from PyQt6.QtGui import QColor
+
 from PyQt6.QtWidgets import QApplication
 
 from pytestqt.qtbot import QtBot
@@ -256,15 +271,18 @@ def test_faslr_connection() -> None:
     :return: None
     """
 
-    faslr_connection = FaslrConnection(
+    with FaslrConnection(
         db_path=sample_db_path
-    )
+    ) as faslr_connection:
 
-    assert isinstance(faslr_connection.engine, Engine)
-    assert isinstance(faslr_connection.session, Session)
-    assert isinstance(faslr_connection.connection, Connection)
+        assert isinstance(faslr_connection.engine, Engine)
+        assert isinstance(faslr_connection.session, Session)
+        assert isinstance(faslr_connection.connection, Connection)
 
-    faslr_connection.session.close()
+        checked_out = faslr_connection.engine.pool.checkedout()
+
+    # Leaving the block returns the connections to the pool.
+    assert faslr_connection.engine.pool.checkedout() == checked_out - 2
 
     with pytest.raises(FileNotFoundError) as excinfo:
 
@@ -275,33 +293,179 @@ def test_faslr_connection() -> None:
     assert DB_NOT_FOUND_TEXT in str(excinfo.value)
 
 
-def test_connect_db() -> None:
+def test_get_startup_db_path(
+        setup_config: str
+) -> None:
+
+    startup_db = get_startup_db_path(config_path=setup_config)
+
+    assert startup_db == 'None'
+
+
+def test_engine_registry(sample_db: str) -> None:
     """
-    Test function to connect to a database.
+    Test that repeated requests for the same database reuse one engine and that the counters are updated.
 
     :return: None
     """
 
-    session_test, connection_test = connect_db(sample_db_path)
+    registry = EngineRegistry()
 
-    assert isinstance(session_test, Session)
-    assert isinstance(connection_test, Connection)
+    engine = registry.get_engine(db_path=sample_db)
 
-    session_test.close()
+    assert registry.get_engine(db_path=sample_db) is engine
+    assert registry.stats['engines_created'] == 1
 
-    with pytest.raises(FileNotFoundError) as excinfo:
+    with registry.session_scope(db_path=sample_db) as session:
+        n_country = session.query(CountryTable).count()
 
-        connect_db(
-            db_path='blahblahblah.db'
-        )
+    with registry.session_scope(db_path=sample_db) as session:
+        assert session.query(CountryTable).count() == n_country
+
+    assert registry.stats['engines_created'] == 1
+    assert registry.stats['checkouts'] == 2
+    assert registry.stats['wait_time'] >= 0
+
+    # The pool should have all of its connections back.
+    assert engine.pool.checkedout() == 0
+
+    assert registry.get_scoped_session(db_path=sample_db)() is registry.get_scoped_session(db_path=sample_db)()
+
+    registry.dispose()
+
+    assert registry.get_engine(db_path=sample_db) is not engine
+    assert registry.stats['engines_created'] == 2
+
+    registry.dispose()
+
+
+def test_session_listeners(sample_db: str) -> None:
+    """
+    Test that session listeners apply to sessions from the registry, including those of sessionmakers created after the
+    listener, and not to other sessions.
+
+    :return: None
+    """
+
+    registry = EngineRegistry()
+
+    executed = []
+
+    registry.get_session_factory(db_path=sample_db)
+
+    registry.listen_sessions(
+        identifier='do_orm_execute',
+        fn=lambda orm_execute_state: executed.append(orm_execute_state)
+    )
+
+    with registry.session_scope(db_path=sample_db) as session:
+        session.query(CountryTable).count()
+
+    assert len(executed) == 1
+
+    with Session(bind=registry.get_engine(db_path=sample_db)) as session:
+        session.query(CountryTable).count()
+
+    assert len(executed) == 1
+
+    registry.dispose()
+
+    with registry.session_scope(db_path=sample_db) as session:
+        session.query(CountryTable).count()
+
+    assert len(executed) == 2
+
+    registry.dispose()
+
+
+def test_session_scope_rollback(sample_db: str) -> None:
+    """
+    Test that a unit of work is rolled back if it raises, and that a missing database is not silently created.
+
+    :return: None
+    """
+
+    with pytest.raises(ValueError):
+        with session_scope(db_path=sample_db) as session:
+            session.query(CountryTable).delete()
+            raise ValueError("Abort the unit of work.")
+
+    with session_scope(db_path=sample_db) as session:
+        assert session.query(CountryTable).count() > 0
+
+    with pytest.raises(FileNotFoundError) as excinfo:
+        with session_scope(db_path='blahblahblah.db'):
+            pass
 
     assert DB_NOT_FOUND_TEXT in str(excinfo.value)
+    assert not os.path.isfile('blahblahblah.db')
 
+    engine_registry.dispose(db_path=sample_db)
 
-def test_get_startup_db_path(
-        setup_config: str
+
+def test_populate_project_model(
+        qtbot: QtBot,
+        sample_db: str
 ) -> None:
+    """
+    Test that the project tree is loaded with a fixed number of queries and matches the database.
 
-    startup_db = get_startup_db_path(config_path=setup_config)
+    :return: None
+    """
 
-    assert startup_db == 'None'
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):  # noqa
+        statements.append(statement)
+
+    engine = engine_registry.get_engine(db_path=sample_db)
+    event.listen(engine, 'before_cursor_execute', count_statement)
+
+    project_model = ProjectModel()
+
+    with session_scope(db_path=sample_db) as session:
+        populate_project_model(
+            session=session,
+            project_model=project_model
+        )
+
+        n_country = session.query(CountryTable).count()
+        n_state = session.query(StateTable).count()
+        n_lob = session.query(LOBTable).count()
+
+        countries, states, lobs = query_project_tree(session=session)
+
+    event.remove(engine, 'before_cursor_execute', count_statement)
+
+    # One query per hierarchy level, plus the three counts and the second load above.
+    assert len(statements) == 9
+
+    assert project_model.rowCount() == n_country
+    assert sum(len(rows) for rows in states.values()) == n_state
+    assert sum(len(rows) for rows in lobs.values()) == n_lob
+
+    country_item = project_model.item(0, 0)
+    state_item = country_item.child(0, 0)
+    lob_item = state_item.child(0, 0)
+
+    assert country_item.text() == countries[0][1]
+    assert country_item.segment_level == 'country'
+    assert state_item.segment_level == 'state'
+    assert lob_item.segment_level == 'lob'
+    assert project_model.item(0, 1).text() == countries[0][2]
+
+    # Bulk-built items are recolored by the model when the theme changes.
+    assert not lob_item.follow_theme
+    project_model.toggle_light_dark_text(Qt.ColorScheme.Dark)
+    assert lob_item.foreground().color() == QColor(255, 255, 255)
+
+    # Reloading replaces the tree instead of appending to it.
+    with session_scope(db_path=sample_db) as session:
+        populate_project_model(
+            session=session,
+            project_model=project_model
+        )
+
+    assert project_model.rowCount() == n_country
+
+    engine_registry.dispose(db_path=sample_db)
@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from faslr.__main__ import (
@@ -5,6 +6,13 @@ from faslr.__main__ import (
 )
 
 import faslr.core as core
+
+from faslr.constants import (
+    CSV_PREVIEW_ROWS,
+    CSV_SAMPLE_ROWS,
+    SAMPLE_DIALOG_PATH
+)
+
 from faslr.data import (
     DataPane,
     DataImportWizard
@@ -21,7 +29,7 @@ from PyQt6.QtCore import (
     QPoint
 )
 
-from PyQt6.QtWidgets import QApplication, QTabWidget
+from PyQt6.QtWidgets import QApplication, QMessageBox, QTabWidget
 
 from pytestqt.qtbot import QtBot
 
@@ -219,15 +227,22 @@ def test_data_pane_w_accept(
     # Trigger the triangle preview.
     wizard.tab_container.setCurrentIndex(1)
 
-    # Return to arguments tab and click OK.
+    # Return to arguments tab, map paid and reported claims, and click OK.
     wizard.tab_container.setCurrentIndex(0)
 
+    wizard.args_tab.add_values_row(form=wizard.args_tab.mapping_layout)
+    wizard.args_tab.dropdowns['values_1'].setCurrentText('Paid Claims')
+    wizard.args_tab.dropdowns['values_2'].setCurrentText('Reported Claims')
+
     qtbot.mouseClick(
         wizard.button_box.button(wizard.ok_btn),
         Qt.MouseButton.LeftButton,
         delay=1
     )
 
+    # The wizard closes once the data are saved.
+    qtbot.waitUntil(lambda: not wizard.isVisible())
+
 
 def test_data_pane_w_no_name(
         qtbot: QtBot,
@@ -405,3 +420,176 @@ def test_data_view_w_model(
     data_pane.data_view.customContextMenuRequested.emit(position)
 
     data_pane.data_view.doubleClicked.emit(idx)
+
+
+def test_project_data_model_dates(data_pane: DataPane) -> None:
+    """
+    Test that the dates of the project views are displayed as pandas prints them, not in ISO form.
+
+    :param data_pane: The data_pane fixture.
+    :return: None
+    """
+
+    data_model = data_pane.data_model
+
+    for column in ['Created', 'Modified']:
+        position = data_model._data.columns.get_loc(column)
+
+        display = data_model.data(
+            index=data_model.index(0, position),
+            role=Qt.ItemDataRole.DisplayRole
+        )
+
+        assert display == str(data_model._data[column].iloc[0])
+        assert 'T' not in display
+
+
+def test_import_small_file(
+        qtbot: QtBot,
+        monkeypatch,
+        data_pane_w_main: [DataPane, QTabWidget]
+) -> None:
+    """
+    Test importing a file small enough to be held entirely in the sample, which needs no background read.
+
+    :param qtbot: The QtBot fixture.
+    :param monkeypatch: The monkeypatch fixture.
+    :param data_pane_w_main: The data_pane_w_main fixture.
+    :return: None
+    """
+
+    data_pane, parent_tab = data_pane_w_main
+
+    data_pane.start_wizard()
+    wizard = data_pane.wizard
+    qtbot.addWidget(wizard)
+
+    wizard.args_tab.open_file(file_path=SAMPLE_DIALOG_PATH + 'friedland_us_auto_steady_state.csv')
+
+    assert wizard.args_tab.sample_complete
+    assert wizard.args_tab.upload_sample_model.rowCount() == CSV_PREVIEW_ROWS
+
+    # The preview is built in the background once the tab has been shown for a moment.
+    preview_tab = wizard.preview_tab
+    wizard.tab_container.setCurrentIndex(1)
+
+    assert preview_tab.rebuild_timer.isActive()
+    assert preview_tab.analysis_tab is None
+
+    qtbot.waitUntil(lambda: preview_tab.analysis_tab is not None)
+    assert list(wizard.args_tab.data.columns) == wizard.args_tab.mapped_columns()
+
+    # Diagnostics are not built until they are shown.
+    analysis_tab = preview_tab.analysis_tab
+    assert analysis_tab.diagnostic_widgets == {}
+
+    # The uploaded data are aggregated once per mapping, and rebuilding with the same mapping reuses the result.
+    assert len(preview_tab.aggregate_cache) == 1
+    assert preview_tab.timings['cells'] <= preview_tab.timings['rows']
+
+    preview_tab.generate_triangle()
+    assert len(preview_tab.aggregate_cache) == 1
+
+    # Changing the arguments rebuilds the preview in the existing analysis tab.
+    wizard.tab_container.setCurrentIndex(0)
+    wizard.args_tab.incremental_btn.setChecked(True)
+    wizard.tab_container.setCurrentIndex(1)
+
+    qtbot.waitUntil(lambda: preview_tab.preview_key[3] is False)
+    assert preview_tab.analysis_tab is analysis_tab
+    assert len(preview_tab.aggregate_cache) == 2
+
+    wizard.args_tab.cumulative_btn.setChecked(True)
+
+    wizard.tab_container.setCurrentIndex(0)
+
+    # A data view stores paid and reported loss, so the import is refused while only one value column is mapped.
+    warnings = []
+    monkeypatch.setattr(
+        QMessageBox,
+        'warning',
+        lambda *args: warnings.append(args[2])
+    )
+
+    wizard.accept_import()
+
+    assert len(warnings) == 1
+    assert not wizard.saving
+    assert data_pane.save_worker is None
+
+    wizard.args_tab.add_values_row(form=wizard.args_tab.mapping_layout)
+    wizard.args_tab.dropdowns['values_1'].setCurrentText('Paid Claims')
+    wizard.args_tab.dropdowns['values_2'].setCurrentText('Reported Claims')
+
+    wizard.accept_import()
+
+    # The data are saved in the background, and the wizard cannot be changed or closed until the save finishes.
+    assert wizard.saving
+    assert not wizard.button_box.isEnabled()
+    assert not wizard.tab_container.isEnabled()
+
+    wizard.close()
+    assert wizard.isVisible()
+
+    qtbot.waitUntil(lambda: data_pane.data_model.rowCount() == 2)
+
+    assert not wizard.saving
+    assert not wizard.isVisible()
+    assert data_pane.save_worker is None
+
+
+def test_import_large_file(
+        qtbot: QtBot,
+        tmp_path,
+        data_pane_w_main: [DataPane, QTabWidget]
+) -> None:
+    """
+    Test importing a file larger than the sample, which is read in the background.
+
+    :param qtbot: The QtBot fixture.
+    :param tmp_path: The tmp_path fixture.
+    :param data_pane_w_main: The data_pane_w_main fixture.
+    :return: None
+    """
+
+    data_pane, parent_tab = data_pane_w_main
+
+    file_path = str(tmp_path / 'claims.csv')
+    n_rows = 3 * CSV_SAMPLE_ROWS
+
+    pd.DataFrame(
+        data={
+            'Accident Year': [2000 + i % 10 for i in range(n_rows)],
+            'Calendar Year': [2000 + i % 10 + (i // 10) % 10 for i in range(n_rows)],
+            'Claim Number': ['C' + str(i) for i in range(n_rows)],
+            'Paid Claims': [float(i) for i in range(n_rows)]
+        }
+    ).to_csv(file_path, index=False)
+
+    data_pane.start_wizard()
+    wizard = data_pane.wizard
+    qtbot.addWidget(wizard)
+    args_tab = wizard.args_tab
+
+    args_tab.open_file(file_path=file_path)
+
+    assert not args_tab.sample_complete
+    assert len(args_tab.sample) == CSV_SAMPLE_ROWS
+    assert args_tab.data is None
+
+    # Cancelling the read drops the action waiting on it.
+    calls = []
+    args_tab.request_data(callback=lambda: calls.append('cancelled'))
+    args_tab.cancel_read()
+
+    args_tab.request_data(callback=lambda: calls.append('done'))
+    qtbot.waitUntil(lambda: calls == ['done'], timeout=10000)
+
+    # Only the mapped columns are read.
+    assert len(args_tab.data) == n_rows
+    assert list(args_tab.data.columns) == ['Accident Year', 'Calendar Year', 'Paid Claims']
+    assert not args_tab.read_progress_container.isVisible()
+
+    # The data are reused until the mapping changes.
+    args_tab.request_data(callback=lambda: calls.append('again'))
+    assert calls == ['done', 'again']
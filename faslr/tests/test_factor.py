@@ -1,5 +1,6 @@
 import sys
 
+import pandas as pd
 import pytest
 
 from faslr.factor import AddLDFDialog
@@ -10,6 +11,7 @@ from faslr.style.triangle import (
     MAIN_TRIANGLE_COLOR
 )
 from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QApplication
 from faslr.utilities.sample import load_sample
 
@@ -110,6 +112,128 @@ def test_factor_data(development_tab):
     assert first_back == MAIN_TRIANGLE_COLOR
 
 
+def test_exclude_factors(development_tab):
+
+    factor_model = development_tab.factor_model
+
+    first_ldf = factor_model._data.iloc[factor_model.ldf_row, 0]
+
+    # Strike out the first link ratio of the first two accident years.
+    for row in [0, 1]:
+        factor_model.toggle_exclude(index=factor_model.index(row, 0))
+
+    factor_model.toggle_exclude(index=factor_model.index(3, 2))
+    factor_model.toggle_exclude(index=factor_model.index(3, 2))
+
+    assert factor_model.get_drop_list() == [('1998', 12), ('1999', 12)]
+
+    factor_model.recalculate_factors()
+
+    idx = factor_model.index(0, 0)
+
+    assert factor_model.data(index=idx, role=Qt.ItemDataRole.BackgroundRole) == EXCL_FACTOR_COLOR
+    assert factor_model.data(index=idx, role=Qt.ItemDataRole.FontRole).strikeOut()
+    assert factor_model._data.iloc[factor_model.ldf_row, 0] != first_ldf
+
+
+def test_edit_selected_ldf(development_tab):
+
+    factor_model = development_tab.factor_model
+
+    changes = []
+    layout_changes = []
+
+    factor_model.dataChanged.connect(  # noqa
+        lambda top_left, bottom_right: changes.append(
+            ((top_left.row(), top_left.column()), (bottom_right.row(), bottom_right.column()))
+        )
+    )
+    factor_model.layoutChanged.connect(lambda: layout_changes.append(True))  # noqa
+
+    # Select the all-year average in every column, then change the third one.
+    factor_model.select_ldf_row(index=factor_model.index(factor_model.ldf_row, 0))
+    changes.clear()
+
+    factor_model.setData(
+        index=factor_model.index(factor_model.selected_row_num, 2),
+        value='1.5',
+        role=Qt.ItemDataRole.EditRole
+    )
+
+    # Only the selected LDFs and CDFs up to the edited column, and the ultimates of the three latest accident years,
+    # are updated.
+    assert layout_changes == []
+    assert changes == [
+        ((factor_model.selected_row_num, 0), (factor_model.selected_row_num, 2)),
+        ((factor_model.cdf_row_num, 0), (factor_model.cdf_row_num, 2)),
+        ((7, 10), (9, 10))
+    ]
+
+    # The incremental update gives the same display as rebuilding it.
+    updated = factor_model._data.copy()
+    factor_model.recalculate_factors()
+
+    pd.testing.assert_frame_equal(updated, factor_model._data)
+
+
+def test_heatmap_colors(development_tab):
+
+    factor_model = development_tab.factor_model
+
+    development_tab.check_heatmap.setChecked(True)
+
+    def background(row: int, column: int) -> QColor:
+        return factor_model.data(
+            index=factor_model.index(row, column),
+            role=Qt.ItemDataRole.BackgroundRole
+        )
+
+    # The first accident year has the highest 12-24 link ratio, the 2005 accident year the lowest.
+    assert background(0, 0) == QColor('#b40426')
+    assert background(7, 0) == QColor('#3b4cc0')
+
+    colors = factor_model.heatmap_colors
+
+    # Excluded link ratios are shown in the exclusion color, and the remaining ones are ranked without them.
+    factor_model.toggle_exclude(index=factor_model.index(0, 0))
+    factor_model.recalculate_factors()
+
+    assert background(0, 0) == EXCL_FACTOR_COLOR
+    assert background(1, 0) == QColor('#b40426')
+
+    # Restoring the link ratio reuses the colors calculated before.
+    factor_model.toggle_exclude(index=factor_model.index(0, 0))
+    factor_model.recalculate_factors()
+
+    assert factor_model.heatmap_colors is colors
+
+    development_tab.check_heatmap.setChecked(False)
+
+    assert background(0, 0) == MAIN_TRIANGLE_COLOR
+
+
+def test_heatmap_cache(development_tab, monkeypatch):
+
+    factor_model = development_tab.factor_model
+
+    monkeypatch.setattr('faslr.factor.HEATMAP_CACHE_SIZE', 2)
+
+    factor_model.update_heatmap(cmap='coolwarm')
+    factor_model.update_heatmap(cmap='viridis')
+
+    # A hit makes the colormap the most recently used, so the other one is evicted first.
+    colors = factor_model.heatmap_colors
+    factor_model.update_heatmap(cmap='coolwarm')
+    factor_model.update_heatmap(cmap='plasma')
+
+    assert [key[0] for key in factor_model.heatmap_cache] == ['coolwarm', 'plasma']
+
+    factor_model.update_heatmap(cmap='viridis')
+
+    assert factor_model.heatmap_colors is not colors
+    assert [key[0] for key in factor_model.heatmap_cache] == ['plasma', 'viridis']
+
+
 # def test_add_vol_wtd(qtbot: QtBot, development_tab: DevelopmentTab) -> None:
 #     """
 #     Opens the ldf average box and adds the three-ear vol wtd. average.
@@ -177,6 +177,20 @@ def test_toggle_project_actions(
     main_window.menu_bar.toggle_project_actions()
 
 
+def test_open_sample_triangles(main_window: MainWindow) -> None:
+    """
+    Test opening the sample triangles, which are no longer opened at startup.
+
+    :param main_window: The main_window fixture.
+    """
+
+    assert main_window.analysis_pane.count() == 0
+
+    main_window.menu_bar.samples_action.trigger()
+
+    assert [main_window.analysis_pane.tabText(i) for i in range(2)] == ["Auto", "XYZ"]
+
+
 def test_open_documentation(mock_browser: MockFixture) -> None:
     """
     Test opening the documentation website.
@@ -4,12 +4,18 @@ from faslr.__main__ import (
     MainWindow
 )
 
-from faslr.connection import populate_project_tree
+from faslr.benchmarks.utilities import generate_project_db
+
+from faslr.connection import (
+    engine_registry,
+    populate_project_tree
+)
 
 import faslr.core as core
 
 from faslr.project import (
     ProjectDialog,
+    ProjectModel,
     ProjectTreeView
 )
 
@@ -317,3 +323,98 @@ def test_project_tree_view() -> None:
     :return: None
     """
     ProjectTreeView()
+
+
+def test_project_model_lazy(
+        qtbot: QtBot,
+        tmp_path
+) -> None:
+    """
+    Test that a large project tree is fetched as it is expanded, that old subtrees are evicted, and that the name
+    filter is applied.
+
+    :param qtbot: The QtBot fixture.
+    :param tmp_path: The tmp_path fixture.
+    :return: None
+    """
+
+    db_path = str(tmp_path / 'lazy.db')
+
+    generate_project_db(
+        db_path=db_path,
+        n_countries=3,
+        n_states=4,
+        n_lobs=2
+    )
+
+    project_model = ProjectModel(
+        cache_size=2,
+        eager_limit=10
+    )
+
+    project_tree_view = ProjectTreeView()
+    qtbot.addWidget(project_tree_view)
+    project_tree_view.setModel(project_model)
+    project_tree_view.show()
+
+    project_model.load(db_path=db_path)
+
+    # Only the countries are loaded up front.
+    assert project_model.lazy
+    assert project_model.rowCount() == 3
+
+    country_idx = project_model.index(0, 0)
+    country_item = project_model.itemFromIndex(country_idx)
+
+    assert country_item.rowCount() == 0
+    assert project_model.hasChildren(country_idx)
+    assert project_model.canFetchMore(country_idx)
+
+    # Expanding the country fetches its states, but not their LOBs.
+    project_tree_view.expand(country_idx)
+
+    qtbot.waitUntil(lambda: not project_model.canFetchMore(country_idx))
+    assert country_item.rowCount() == 4
+    assert country_item.child(0, 0).rowCount() == 0
+
+    state_idx = project_model.index(0, 0, country_idx)
+    project_model.fetchMore(state_idx)
+
+    assert country_item.child(0, 0).rowCount() == 2
+    assert country_item.child(0, 0).child(0, 0).segment_level == 'lob'
+
+    # The expanded country is kept when the cache overflows; the collapsed countries are released.
+    for row in [1, 2]:
+        project_model.fetchMore(project_model.index(row, 0))
+
+    project_model.evict()
+
+    assert len(project_model.fetched) <= 2
+    assert ('country', country_item.segment_id) in project_model.fetched
+    assert country_item.rowCount() == 4
+    assert project_model.canFetchMore(project_model.index(1, 0))
+
+    # The filter keeps matching segments along with their ancestors.
+    project_model.set_name_filter("State 6")
+
+    assert project_model.rowCount() == 1
+    assert project_model.item(0, 0).text() == "Country 2"
+
+    project_model.fetchMore(project_model.index(0, 0))
+
+    assert project_model.item(0, 0).rowCount() == 1
+    assert project_model.item(0, 0).child(0, 0).text() == "State 6"
+
+    project_model.set_name_filter("LOB 2")
+
+    assert project_model.rowCount() == 3
+
+    # Small databases are loaded in full.
+    project_model.eager_limit = 1000
+    project_model.set_name_filter(None)
+
+    assert not project_model.lazy
+    assert project_model.item(0, 0).rowCount() == 4
+    assert project_model.item(0, 0).child(0, 0).rowCount() == 2
+
+    engine_registry.dispose(db_path=db_path)
@@ -22,6 +22,9 @@
 # connection.close()
 
 from faslr.schema import (
+    BatchResultData,
+    BatchResultTable,
+    BatchRunTable,
     CountryTable,
     LocationTable,
     StateTable,
@@ -90,3 +93,8 @@ def test_index_values_table() -> None:
     index_values_table = IndexValuesTable()
 
     repr(index_values_table)
+
+def test_batch_tables() -> None:
+
+    for table in [BatchRunTable, BatchResultTable, BatchResultData]:
+        repr(table())
@@ -0,0 +1,24 @@
+from faslr.benchmarks.startup import (
+    DEFERRED_PACKAGES,
+    import_times,
+    MAIN_MODULE,
+    time_to_first_paint
+)
+
+
+def test_startup_imports() -> None:
+
+    times = import_times()
+
+    assert times[MAIN_MODULE] > 0
+
+    # These are imported when a triangle is first opened, not at startup.
+    for package in DEFERRED_PACKAGES:
+        assert package not in times
+
+
+def test_time_to_first_paint(monkeypatch) -> None:
+
+    monkeypatch.setenv('QT_QPA_PLATFORM', 'offscreen')
+
+    assert time_to_first_paint() > 0
@@ -29,6 +29,10 @@ from PyQt6.QtGui import (
     QGuiApplication
 )
 
+from PyQt6.QtTest import (
+    QAbstractItemModelTester
+)
+
 from PyQt6.QtWidgets import (
     QApplication
 )
@@ -202,6 +206,49 @@ def test_triangle_model_ratio(
     assert ratio_test == ratio_expectation
 
 
+def test_triangle_model_cache(
+        xyz: Triangle,
+        triangle_model: TriangleModel
+) -> None:
+    """
+    Check that display strings are cached once formatted, that painting does not modify the model, and that the
+    model stays consistent when it is given a different triangle.
+
+    :param xyz: The xyz fixture.
+    :param triangle_model: The TriangleModel fixture.
+    :return: None
+    """
+
+    tester = QAbstractItemModelTester(
+        triangle_model,
+        QAbstractItemModelTester.FailureReportingMode.Fatal
+    )
+
+    changes = []
+    triangle_model.dataChanged.connect(lambda *args: changes.append(args))  # noqa
+
+    idx = triangle_model.index(0, 5)
+
+    assert triangle_model.data(idx, role=Qt.ItemDataRole.DisplayRole) == value_expectation
+    assert triangle_model.display_strings[0, 5] == value_expectation
+    assert triangle_model.display_strings[0, 6] is None
+    assert changes == []
+
+    triangle_model.set_triangle(
+        triangle=xyz.link_ratio,
+        value_type='ratio'
+    )
+
+    # The strings formatted for the previous triangle are dropped.
+    assert triangle_model.display_strings[0, 5] is None
+    assert triangle_model.data(
+        triangle_model.index(0, 2),
+        role=Qt.ItemDataRole.DisplayRole
+    ) == ratio_expectation
+
+    del tester
+
+
 def test_strikeout(qtbot: QtBot) -> None:
     """
     Check whether double-clicking a link ratio strikes it out.
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from faslr.utilities.benktander import benktander_ultimates
+
+LOSSES = np.array([700_000, 760_000, 690_000, 450_000])
+
+# Includes a fully reported origin period and one with nothing reported.
+UNREPORTED = np.array([0, .1, .4, 1])
+
+APRIORI = np.array([710_000, 800_000, 1_100_000, 1_300_000])
+
+
+def test_benktander_ultimates() -> None:
+
+    ultimate = APRIORI.astype(float)
+
+    for k in range(1, 25):
+
+        ultimate = LOSSES + UNREPORTED * ultimate
+
+        np.testing.assert_allclose(
+            benktander_ultimates(
+                losses=LOSSES,
+                unreported=UNREPORTED,
+                apriori=APRIORI,
+                iterations=k
+            ),
+            ultimate,
+            rtol=1e-12
+        )
+
+    # Zero iterations leave the a priori ultimates unchanged.
+    np.testing.assert_allclose(
+        benktander_ultimates(
+            losses=LOSSES,
+            unreported=UNREPORTED,
+            apriori=APRIORI,
+            iterations=0
+        ),
+        APRIORI
+    )
+
+    with pytest.raises(ValueError):
+        benktander_ultimates(
+            losses=LOSSES,
+            unreported=UNREPORTED,
+            apriori=APRIORI,
+            iterations=-1
+        )
+
+
+def test_benktander_ultimates_path() -> None:
+
+    path = benktander_ultimates(
+        losses=LOSSES,
+        unreported=UNREPORTED,
+        apriori=APRIORI,
+        iterations=np.arange(101)
+    )
+
+    assert path.shape == (101, 4)
+
+    for k in [0, 1, 50, 100]:
+        np.testing.assert_allclose(
+            path[k],
+            benktander_ultimates(
+                losses=LOSSES,
+                unreported=UNREPORTED,
+                apriori=APRIORI,
+                iterations=k
+            )
+        )
+
+    # The ultimates converge to the chainladder ultimates, losses / (1 - unreported).
+    np.testing.assert_allclose(
+        path[-1, :3],
+        LOSSES[:3] / (1 - UNREPORTED[:3])
+    )
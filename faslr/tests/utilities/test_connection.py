@@ -6,11 +6,11 @@ from faslr.utilities import set_sqlite_pragma
 
 def test_fk_pragma():
 
-    fconn = FaslrConnection(
+    with FaslrConnection(
         db_path=DEFAULT_DIALOG_PATH + '/sample.db'
-    )
+    ) as fconn:
 
-    set_sqlite_pragma(
-        dbapi_connection=fconn.raw_connection,
-        connection_record=None
-    )
+        set_sqlite_pragma(
+            dbapi_connection=fconn.raw_connection,
+            connection_record=None
+        )
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from faslr.utilities.csv_reader import (
+    ReadCancelled,
+    has_pyarrow,
+    infer_dtypes,
+    read_csv_chunked,
+    sample_csv
+)
+
+
+@pytest.fixture()
+def claims_csv(tmp_path) -> str:
+    """
+    A claim-level csv file with 1,000 rows.
+    """
+
+    file_path = str(tmp_path / 'claims.csv')
+
+    pd.DataFrame(
+        data={
+            'Accident Year': np.repeat(np.arange(2000, 2010), 100),
+            'Calendar Year': np.tile(np.arange(2000, 2100), 10),
+            'Claim Number': ['C' + str(i) for i in range(1000)],
+            'Paid Claims': np.arange(1000) * 1.5,
+            'Reported Claims': np.arange(1000) * 2.0
+        }
+    ).to_csv(file_path, index=False)
+
+    return file_path
+
+
+def test_sample_csv(claims_csv: str) -> None:
+
+    sample = sample_csv(
+        file_path=claims_csv,
+        n_rows=10
+    )
+
+    assert len(sample) == 10
+    assert list(sample.columns) == ['Accident Year', 'Calendar Year', 'Claim Number', 'Paid Claims', 'Reported Claims']
+
+    assert infer_dtypes(sample=sample) == {
+        'Accident Year': 'int64',
+        'Calendar Year': 'int64',
+        'Paid Claims': 'float64',
+        'Reported Claims': 'float64'
+    }
+
+
+def test_read_csv_chunked(claims_csv: str) -> None:
+
+    progress = []
+    usecols = ['Accident Year', 'Calendar Year', 'Paid Claims']
+
+    data = read_csv_chunked(
+        file_path=claims_csv,
+        usecols=usecols,
+        dtype=infer_dtypes(sample_csv(claims_csv, n_rows=10)),
+        chunk_size=300,
+        progress_callback=progress.append
+    )
+
+    assert list(data.columns) == usecols
+    assert len(data) == 1000
+    assert data['Paid Claims'].iloc[-1] == 999 * 1.5
+
+    assert len(progress) == 4
+    assert progress == sorted(progress)
+    assert progress[-1] == 100
+
+    expected = pd.read_csv(claims_csv, usecols=usecols)
+    pd.testing.assert_frame_equal(data, expected)
+
+
+def test_read_csv_chunked_cancel(claims_csv: str) -> None:
+
+    with pytest.raises(ReadCancelled):
+        read_csv_chunked(
+            file_path=claims_csv,
+            chunk_size=100,
+            is_cancelled=lambda: True
+        )
+
+
+def test_read_csv_chunked_dtype_fallback(tmp_path) -> None:
+    """
+    An integer column that has missing values after the sample is read as float rather than failing.
+    """
+
+    file_path = str(tmp_path / 'missing.csv')
+
+    pd.DataFrame(
+        data={
+            'Accident Year': [2000, 2001, 2002, None],
+            'Paid Claims': [1.0, 2.0, 3.0, 4.0]
+        }
+    ).to_csv(file_path, index=False, float_format='%.0f')
+
+    dtype = infer_dtypes(sample_csv(file_path, n_rows=2))
+
+    assert dtype['Accident Year'] == 'int64'
+
+    data = read_csv_chunked(
+        file_path=file_path,
+        dtype=dtype,
+        chunk_size=2
+    )
+
+    assert len(data) == 4
+    assert data['Accident Year'].isna().sum() == 1
+
+
+def test_read_csv_chunked_pyarrow(claims_csv: str) -> None:
+
+    if not has_pyarrow():
+        pytest.skip("pyarrow is not installed.")
+
+    progress = []
+
+    data = read_csv_chunked(
+        file_path=claims_csv,
+        usecols=['Accident Year', 'Paid Claims'],
+        engine='pyarrow',
+        progress_callback=progress.append
+    )
+
+    assert len(data) == 1000
+    assert progress == [100]
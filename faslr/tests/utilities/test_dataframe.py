@@ -0,0 +1,95 @@
+import chainladder as cl
+import numpy as np
+import pandas as pd
+
+from faslr.utilities.dataframe import (
+    aggregate_triangle_data,
+    changed_blocks
+)
+
+
+def test_aggregate_triangle_data() -> None:
+
+    n_rows = 1000
+
+    data = pd.DataFrame(
+        data={
+            'accident_year': [2000 + i % 5 for i in range(n_rows)],
+            'calendar_year': [2000 + i % 5 + (i // 5) % 5 for i in range(n_rows)],
+            'paid_loss': [float(i) for i in range(n_rows)],
+            'reported_loss': [np.nan if i % 5 == 0 else float(2 * i) for i in range(n_rows)]
+        }
+    )
+
+    columns = ['paid_loss', 'reported_loss']
+
+    aggregated = aggregate_triangle_data(
+        data=data,
+        origin='accident_year',
+        development='calendar_year',
+        columns=columns
+    )
+
+    expected = data.groupby(['accident_year', 'calendar_year'])[columns].sum(min_count=1)
+
+    # One row per cell, with the same totals and key types as grouping the raw data.
+    assert len(aggregated) == 25
+    assert aggregated['accident_year'].dtype == data['accident_year'].dtype
+    assert aggregated['calendar_year'].dtype == data['calendar_year'].dtype
+
+    pd.testing.assert_frame_equal(
+        aggregated.set_index(['accident_year', 'calendar_year']).sort_index(),
+        expected
+    )
+
+    # Cells with no reported values stay missing.
+    assert aggregated.loc[aggregated['accident_year'] == 2000, 'reported_loss'].isna().all()
+
+    # The triangle built from the aggregate matches the one built from the raw data.
+    raw_triangle = cl.Triangle(
+        data=data,
+        origin='accident_year',
+        development='calendar_year',
+        columns=columns,
+        cumulative=True
+    )
+
+    aggregated_triangle = cl.Triangle(
+        data=aggregated,
+        origin='accident_year',
+        development='calendar_year',
+        columns=columns,
+        cumulative=True
+    )
+
+    assert raw_triangle == aggregated_triangle
+
+
+def test_changed_blocks() -> None:
+
+    previous = pd.DataFrame(
+        data={
+            'a': [1.0, 2.0, np.nan, 4.0],
+            'b': [1.0, 2.0, 3.0, 4.0],
+            'c': [1.0, 2.0, 3.0, 4.0],
+            'd': [1.0, 2.0, 3.0, 4.0]
+        }
+    )
+
+    current = previous.copy()
+
+    assert changed_blocks(previous=previous, current=current) == []
+
+    current.iloc[0, 0] = 5.0
+    current.iloc[3, 1] = np.nan
+    current.iloc[1, 3] = 6.0
+
+    # Adjacent changed columns share a block.
+    assert changed_blocks(previous=previous, current=current) == [(0, 3, 0, 1), (1, 1, 3, 3)]
+
+    # Columns that are not numeric are compared one at a time.
+    previous['e'] = ['x', None, 'y', 'z']
+    current['e'] = ['x', None, 'w', 'z']
+
+    assert changed_blocks(previous=previous, current=current) == [(0, 3, 0, 1), (1, 2, 3, 4)]
+
@@ -0,0 +1,109 @@
+import chainladder as cl
+import numpy as np
+import os
+import pickle
+
+from faslr.utilities.fit_cache import (
+    fit_cache_directory,
+    FitCache
+)
+
+
+def test_fit_cache(tmp_path) -> None:
+
+    triangle = cl.load_sample('genins')
+
+    cache = FitCache()
+
+    fitted = cache.fit(
+        estimator=cl.TailCurve(curve='exponential'),
+        triangle=triangle
+    )
+
+    cached = cache.fit(
+        estimator=cl.TailCurve(curve='exponential'),
+        triangle=triangle
+    )
+
+    assert cached is not fitted
+
+    np.testing.assert_allclose(
+        cached.cdf_.values,
+        cl.TailCurve(curve='exponential').fit(triangle).cdf_.values
+    )
+
+    assert cache.stats['hits'] == 1
+    assert cache.stats['misses'] == 1
+    assert cache.n_entries == 1
+
+    # A change to the parameters or to the triangle is a different fit.
+    keys = {
+        cache.key(estimator=cl.TailCurve(curve='exponential'), triangle=triangle),
+        cache.key(estimator=cl.TailCurve(curve='inverse_power'), triangle=triangle),
+        cache.key(estimator=cl.TailCurve(curve='exponential'), triangle=triangle * 2),
+        cache.key(estimator=cl.TailCurve(curve='exponential'), triangle=cl.Development().fit_transform(triangle)),
+        cache.key(
+            estimator=cl.TailCurve(curve='exponential'),
+            triangle=cl.Development(n_periods=3).fit_transform(triangle)
+        )
+    }
+
+    assert len(keys) == 5
+
+    # Fits saved to disk are loaded by a new cache, e.g., after a restart.
+    directory = fit_cache_directory(db_path=str(tmp_path / 'project.db'))
+
+    cache.directory = directory
+    cache.fit(
+        estimator=cl.Development(average='simple'),
+        triangle=triangle
+    )
+
+    assert len(os.listdir(directory)) == 1
+
+    restarted = FitCache(directory=directory)
+
+    development = restarted.fit(
+        estimator=cl.Development(average='simple'),
+        triangle=triangle
+    )
+
+    assert restarted.stats['disk_hits'] == 1
+
+    np.testing.assert_allclose(
+        development.ldf_.values,
+        cl.Development(average='simple').fit(triangle).ldf_.values
+    )
+
+    cache.clear(disk=True)
+
+    assert cache.n_entries == 0
+    assert cache.n_bytes == 0
+    assert not os.listdir(directory)
+
+
+def test_fit_cache_eviction() -> None:
+
+    triangle = cl.load_sample('genins')
+
+    size = len(pickle.dumps(cl.Development(n_periods=2).fit(triangle), protocol=pickle.HIGHEST_PROTOCOL))
+
+    cache = FitCache(max_bytes=int(size * 2.5))
+
+    for n_periods in [2, 3, 4]:
+        cache.fit(
+            estimator=cl.Development(n_periods=n_periods),
+            triangle=triangle
+        )
+
+    # The least recently used fit is evicted to stay within the budget.
+    assert cache.stats['evictions'] == 1
+    assert cache.n_entries == 2
+    assert cache.n_bytes <= cache.max_bytes
+
+    cache.fit(
+        estimator=cl.Development(n_periods=2),
+        triangle=triangle
+    )
+
+    assert cache.stats['misses'] == 4
@@ -0,0 +1,37 @@
+import numpy as np
+
+from faslr.utilities.heatmap import heatmap_colors
+
+
+def test_heatmap_colors() -> None:
+
+    values = np.array([
+        [1.5, 1.2, 1.1],
+        [1.8, 1.3, np.nan],
+        [1.2, np.nan, np.nan]
+    ])
+
+    colors = heatmap_colors(
+        values=values,
+        cmap='coolwarm'
+    )
+
+    # Values are colored by their rank within their column, from blue for the lowest to red for the highest. Missing
+    # values and columns with a single value take the middle color.
+    assert colors.tolist() == [
+        ['#dddcdc', '#3b4cc0', '#dddcdc'],
+        ['#b40426', '#b40426', '#dddcdc'],
+        ['#3b4cc0', '#dddcdc', '#dddcdc']
+    ]
+
+    # Excluded values are left out of the ranking.
+    exclude = np.zeros(values.shape, dtype=bool)
+    exclude[1, 0] = True
+
+    colors = heatmap_colors(
+        values=values,
+        cmap='coolwarm',
+        exclude=exclude
+    )
+
+    assert colors[:, 0].tolist() == ['#b40426', '#dddcdc', '#3b4cc0']
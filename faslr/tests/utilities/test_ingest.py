@@ -0,0 +1,108 @@
+import pandas as pd
+import pytest
+
+from faslr.connection import session_scope
+
+from faslr.schema import (
+    ProjectViewData,
+    ProjectViewTable
+)
+
+from faslr.constants import SQLITE_BULK_PRAGMAS
+
+from faslr.utilities.ingest import bulk_insert
+
+
+def test_bulk_insert(sample_db: str) -> None:
+
+    data = pd.DataFrame(
+        data={
+            'accident_year': [2000 + i // 10 for i in range(100)],
+            'calendar_year': [2000 + i // 10 + i % 10 for i in range(100)],
+            'paid_loss': [float(i) for i in range(100)],
+            'reported_loss': [float(2 * i) for i in range(100)]
+        }
+    )
+
+    progress = []
+
+    with session_scope(
+        db_path=sample_db,
+        pragmas=SQLITE_BULK_PRAGMAS
+    ) as session:
+
+        project_view = ProjectViewTable(name="Bulk")
+        session.add(project_view)
+        session.flush()
+
+        data['view_id'] = project_view.view_id
+
+        n_rows = bulk_insert(
+            connection=session.connection(),
+            table=ProjectViewData.__table__,
+            data=data,
+            chunk_size=30,
+            progress_callback=lambda rows_written, total_rows: progress.append((rows_written, total_rows))
+        )
+
+        view_id = project_view.view_id
+
+    assert n_rows == 100
+    assert progress == [(30, 100), (60, 100), (90, 100), (100, 100)]
+
+    with session_scope(db_path=sample_db) as session:
+
+        rows = session.query(ProjectViewData).filter(ProjectViewData.view_id == view_id).all()
+
+        assert len(rows) == 100
+        assert rows[-1].reported_loss == 198.0
+
+        # The bulk load settings do not leak to the pooled connection.
+        assert session.connection().exec_driver_sql("PRAGMA journal_mode").scalar() == 'delete'
+        assert session.connection().exec_driver_sql("PRAGMA synchronous").scalar() == 2
+
+    with pytest.raises(ValueError):
+        bulk_insert(
+            connection=None, # noqa
+            table=ProjectViewData.__table__,
+            data=data,
+            chunk_size=0
+        )
+
+
+def test_bulk_insert_rollback(sample_db: str) -> None:
+
+    data = pd.DataFrame(
+        data={
+            'accident_year': [2000, 2001],
+            'calendar_year': [2000, 2001],
+            'paid_loss': [1.0, 2.0],
+            'reported_loss': [1.0, 2.0]
+        }
+    )
+
+    with session_scope(db_path=sample_db) as session:
+        n_rows = session.query(ProjectViewData).count()
+
+    # A failure during the unit of work discards the rows already written.
+    with pytest.raises(RuntimeError):
+        with session_scope(
+            db_path=sample_db,
+            pragmas=SQLITE_BULK_PRAGMAS
+        ) as session:
+            project_view = ProjectViewTable(name="Aborted")
+            session.add(project_view)
+            session.flush()
+
+            data['view_id'] = project_view.view_id
+
+            bulk_insert(
+                connection=session.connection(),
+                table=ProjectViewData.__table__,
+                data=data
+            )
+            raise RuntimeError("Abort the load.")
+
+    with session_scope(db_path=sample_db) as session:
+        assert session.query(ProjectViewTable).filter(ProjectViewTable.name == "Aborted").count() == 0
+        assert session.query(ProjectViewData).count() == n_rows
@@ -0,0 +1,68 @@
+import chainladder as cl
+import numpy as np
+import pytest
+
+from faslr.utilities.ldf import LDFEngine
+
+AVERAGES = [
+    (average, n_periods) for average in ['regression', 'simple', 'volume'] for n_periods in [-1, 1, 3, 5]
+]
+
+
+@pytest.mark.parametrize(
+    'sample, column',
+    [
+        ('raa', 'values'),
+        ('quarterly', 'paid')
+    ]
+)
+def test_ldf_engine(
+        sample: str,
+        column: str
+) -> None:
+
+    triangle = cl.load_sample(sample)[column]
+
+    # Leave out every fifth observed link ratio.
+    link_frame = triangle.link_ratio.to_frame(origin_as_datetime=False)
+    rows, columns = np.nonzero(link_frame.notna().to_numpy())
+    exclude = np.zeros(link_frame.shape, dtype=bool)
+    exclude[rows[::5], columns[::5]] = True
+
+    drop = [
+        (
+            str(link_frame.index[i]),
+            int(str(link_frame.columns[j]).split('-')[0])
+        ) for i, j in zip(rows[::5], columns[::5])
+    ]
+
+    ldfs = LDFEngine(triangle=triangle).ldfs(
+        averages=AVERAGES,
+        exclude=exclude
+    )
+
+    assert ldfs.shape == (len(AVERAGES), triangle.shape[3] - 1)
+
+    for row, (average, n_periods) in zip(ldfs, AVERAGES):
+
+        development = cl.Development(
+            average=average,
+            n_periods=n_periods,
+            drop=drop
+        ).fit(triangle)
+
+        np.testing.assert_allclose(
+            row,
+            development.ldf_.values[0, 0, 0],
+            rtol=1e-12
+        )
+
+
+def test_ldf_engine_errors() -> None:
+
+    with pytest.raises(ValueError):
+        LDFEngine(triangle=cl.load_sample('clrd'))
+
+    ldfs = LDFEngine(triangle=cl.load_sample('raa')).ldfs(averages=[])
+
+    assert ldfs.shape == (0, 9)
@@ -1,15 +1,40 @@
-from faslr.utilities.queries import delete_country
+from faslr.utilities.accessors import get_column
 
-from faslr.connection import FaslrConnection
+from faslr.utilities.queries import (
+    delete_country,
+    load_view_triangle
+)
+
+from faslr.connection import (
+    FaslrConnection,
+    session_scope
+)
 
 
 def test_delete_country(sample_db: str) -> None:
 
-    f_connection = FaslrConnection(
+    with FaslrConnection(
         db_path=sample_db
-    )
+    ) as f_connection:
+
+        delete_country(
+            country_id=1,
+            session=f_connection.session
+        )
+
+
+def test_load_view_triangle(sample_db: str) -> None:
+
+    with session_scope(db_path=sample_db) as session:
+        triangle = load_view_triangle(session=session)
+
+        single = load_view_triangle(
+            session=session,
+            view_ids=[1]
+        )
+
+    assert triangle.shape == (1, 2, 10, 10)
+    assert list(triangle.columns) == ['Paid Loss', 'Reported Loss']
+    assert triangle.index.values.tolist() == [[1, 'Texas', 'Auto']]
 
-    delete_country(
-        country_id=1,
-        session=f_connection.session
-    )
+    assert get_column(triangle=triangle, column='Paid Loss', lob='Auto', view=1) == single['Paid Loss']
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from faslr.utilities.ratio import RatioAverageEngine
+
+AVERAGES = [
+    (average, n_years) for average in ['Straight', 'Medial', 'Volume'] for n_years in [1, 2, 3, 5, 20]
+]
+
+
+def test_ratio_average_engine() -> None:
+
+    rng = np.random.default_rng(seed=0)
+
+    ratios = pd.DataFrame(rng.uniform(low=.4, high=1.2, size=(10, 4)))
+    weights = pd.DataFrame(rng.uniform(low=100, high=200, size=(10, 4)))
+
+    # Missing ratios, including a column that is missing entirely.
+    ratios.iloc[[2, 8], 1] = np.nan
+    ratios.iloc[:, 3] = np.nan
+
+    engine = RatioAverageEngine(
+        ratios=ratios.to_numpy(),
+        weights=weights.to_numpy()
+    )
+
+    result = engine.averages(averages=AVERAGES + [('Geometric', 3), ('Straight', 0)])
+
+    assert result.shape == (len(AVERAGES) + 2, 4)
+
+    for row, (average, n_years) in zip(result, AVERAGES):
+
+        window = ratios.tail(n_years)
+
+        if average == 'Straight':
+            expected = window.mean()
+        elif average == 'Medial':
+            expected = window.apply(
+                lambda column: column.dropna().sort_values().iloc[1:-1].mean() if column.count() >= 3 else np.nan
+            )
+        else:
+            window_weights = weights.tail(n_years).where(window.notna())
+            expected = (window * window_weights).sum(min_count=1) / window_weights.sum(min_count=1)
+
+        np.testing.assert_allclose(
+            row,
+            expected.to_numpy(),
+            rtol=1e-12
+        )
+
+    # Unknown averages and empty windows are missing.
+    assert np.isnan(result[-2:]).all()
+
+
+def test_ratio_average_engine_out() -> None:
+
+    ratios = np.array([
+        [.5, .6],
+        [.7, .8],
+        [.9, 1.0]
+    ])
+
+    block = np.zeros((4, 2))
+
+    RatioAverageEngine(ratios=ratios).averages(
+        averages=[
+            ('Straight', 2),
+            ('Volume', 3)
+        ],
+        out=block[1:3]
+    )
+
+    # Without weights, volume-weighted averages are straight averages.
+    np.testing.assert_allclose(block[1:3], [[.8, .9], [.7, .8]])
+
+    assert (block[[0, 3]] == 0).all()
+
+    assert np.isnan(RatioAverageEngine(ratios=np.empty((0, 2))).averages(averages=[('Straight', 3)])).all()
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+from faslr.utilities.benktander import benktander_ultimates
+from faslr.utilities.reserving import ReserveEngine
+
+DATA = pd.DataFrame(
+    {
+        'On-Level Earned Premium': [1_000_000, 1_050_000, 1_100_000],
+        'Selected Loss Ratio': [.7, .75, .8],
+        'Reported Losses': [700_000, 690_000, 450_000],
+        'Paid Losses': [690_000, 600_000, 200_000],
+        # A CDF below 1 is treated as 1.
+        'Reported CDF': [.99, 1.1, 1.5],
+        'Paid CDF': [1.0, 1.25, 2.5]
+    }
+)
+
+
+def test_reserve_engine() -> None:
+
+    estimates = ReserveEngine.from_frame(data=DATA).estimates(iterations=np.arange(3))
+
+    expected_claims = DATA['On-Level Earned Premium'] * DATA['Selected Loss Ratio']
+    unreported = 1 - 1 / np.maximum(1, DATA['Reported CDF'])
+    unpaid = 1 - 1 / DATA['Paid CDF']
+
+    ultimate_bf_reported = DATA['Reported Losses'] + unreported * expected_claims
+    ultimate_bf_paid = DATA['Paid Losses'] + unpaid * expected_claims
+
+    expected = {
+        'Expected Claims': expected_claims,
+        '% Unreported': unreported,
+        '% Unpaid': unpaid,
+        'Case Outstanding': DATA['Reported Losses'] - DATA['Paid Losses'],
+        'IBNR': expected_claims - DATA['Reported Losses'],
+        'Unpaid Claims': expected_claims - DATA['Paid Losses'],
+        'Ultimate BF Reported': ultimate_bf_reported,
+        'Ultimate BF Paid': ultimate_bf_paid,
+        'BF Reported IBNR': ultimate_bf_reported - DATA['Reported Losses'],
+        'BF Reported Unpaid Claims': ultimate_bf_reported - DATA['Paid Losses']
+    }
+
+    for column, values in expected.items():
+        np.testing.assert_allclose(
+            estimates[column],
+            values.to_numpy(),
+            err_msg=column
+        )
+
+    # Zero iterations of the Benktander method give the Bornhuetter-Ferguson ultimates.
+    assert estimates['Ultimate GB Reported'].shape == (3, 3)
+
+    np.testing.assert_allclose(estimates['Ultimate GB Reported'][0], ultimate_bf_reported)
+    np.testing.assert_allclose(estimates['Ultimate GB Paid'][0], ultimate_bf_paid)
+
+    np.testing.assert_allclose(
+        estimates['Ultimate GB Paid'][2],
+        benktander_ultimates(
+            losses=DATA['Paid Losses'],
+            unreported=unpaid,
+            apriori=ultimate_bf_paid,
+            iterations=2
+        )
+    )
+
+
+def test_reserve_engine_portfolio() -> None:
+
+    # Segments along the first axis share the premium of each origin period.
+    loss_ratios = np.array([[.6], [.7], [.8]]) * np.ones(3)
+
+    portfolio = ReserveEngine(
+        premium=DATA['On-Level Earned Premium'],
+        loss_ratio=loss_ratios,
+        reported_losses=DATA['Reported Losses'],
+        paid_losses=DATA['Paid Losses'],
+        reported_cdf=DATA['Reported CDF'],
+        paid_cdf=DATA['Paid CDF']
+    ).estimates()
+
+    assert portfolio['BF Paid Unpaid Claims'].shape == (3, 3)
+
+    for segment, loss_ratio in enumerate([.6, .7, .8]):
+
+        estimates = ReserveEngine.from_frame(data=DATA.assign(**{'Selected Loss Ratio': loss_ratio})).estimates()
+
+        for column in ['Ultimate BF Reported', 'BF Paid Unpaid Claims', 'Ultimate GB Paid']:
+            np.testing.assert_allclose(
+                portfolio[column][segment],
+                estimates[column]
+            )
+
+    # Without CDFs, the losses are fully developed.
+    estimates = ReserveEngine.from_frame(data=DATA.drop(columns=['Reported CDF', 'Paid CDF'])).estimates()
+
+    np.testing.assert_allclose(estimates['Ultimate BF Reported'], DATA['Reported Losses'])
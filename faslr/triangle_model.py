@@ -1,3 +1,5 @@
+import numpy as np
+
 from faslr.base_table import (
     FAbstractTableModel,
     FTableView
@@ -20,8 +22,7 @@ from faslr.utilities import (
 )
 
 from PyQt6.QtCore import (
-    Qt,
-    QVariant
+    Qt
 )
 
 from PyQt6.QtGui import (
@@ -56,6 +57,14 @@ class TriangleModel(FAbstractTableModel):
 
         self._data = triangle.to_frame(origin_as_datetime=False)
         self.value_type = value_type
+
+        # The values are held in an array with a mask of the blank cells, and display strings are formatted the
+        # first time a cell is painted and then reused until the values change. See reset_cache.
+        self.values = None
+        self.blank = None
+        self.display_strings = None
+        self.reset_cache()
+
         self.n_rows = self.rowCount()
         self.n_columns = self.columnCount()
         self.excl_frame = self._data.copy()
@@ -75,33 +84,17 @@ class TriangleModel(FAbstractTableModel):
 
         if role == Qt.ItemDataRole.DisplayRole:
 
-            value = self._data.iloc[index.row(), index.column()]
-
-            # Display blank when there are nans in the lower-right hand of the triangle.
-            if str(value) == "nan":
-
-                display_value = BLANK_TEXT
-            else:
-                # "value" means stuff like losses and premiums, should have 2 decimal places.
-                if self.value_type == "value":
+            row = index.row()
+            column = index.column()
 
-                    display_value = VALUE_STYLE.format(value)
+            display_value = self.display_strings[row, column]
 
-                # for "ratio", want to display 3 decimal places.
-                else:
-
-                    display_value = RATIO_STYLE.format(value)
-
-                display_value = str(display_value)
-
-            self.setData(
-                self.index(
-                    index.row(),
-                    index.column()
-                ),
-                QVariant(Qt.AlignmentFlag.AlignRight),
-                Qt.ItemDataRole.TextAlignmentRole
-            )
+            if display_value is None:
+                display_value = self.format_value(
+                    row=row,
+                    column=column
+                )
+                self.display_strings[row, column] = display_value
 
             return display_value
 
@@ -112,6 +105,62 @@ class TriangleModel(FAbstractTableModel):
 
             return self.lower_diag_color
 
+    def format_value(
+            self,
+            row: int,
+            column: int
+    ) -> str:
+        """
+        Formats the value of a cell for display.
+        """
+
+        # Display blank when there are nans in the lower-right hand of the triangle.
+        if self.blank[row, column]:
+            return BLANK_TEXT
+
+        # "value" means stuff like losses and premiums, should have 2 decimal places.
+        if self.value_type == "value":
+            return VALUE_STYLE.format(self.values[row, column])
+
+        # for "ratio", want to display 3 decimal places.
+        else:
+            return RATIO_STYLE.format(self.values[row, column])
+
+    def reset_cache(self) -> None:
+        """
+        Reads the values from _data and drops the formatted display strings. Call after _data has changed.
+        """
+
+        self.values = np.ascontiguousarray(self._data.to_numpy(dtype=float))
+        self.blank = np.isnan(self.values)
+        self.display_strings = np.full(
+            self.values.shape,
+            None,
+            dtype=object
+        )
+
+    def set_triangle(
+            self,
+            triangle: Triangle,
+            value_type: str
+    ) -> None:
+        """
+        Shows a different triangle, keeping the model.
+        """
+
+        self.beginResetModel()
+
+        self.triangle = triangle
+        self._data = triangle.to_frame(origin_as_datetime=False)
+        self.value_type = value_type
+        self.reset_cache()
+
+        self.n_rows = self.rowCount()
+        self.n_columns = self.columnCount()
+        self.excl_frame = df_set_false(df=self._data.copy())
+
+        self.endResetModel()
+
     def headerData(
             self,
             p_int,
@@ -1,31 +1,55 @@
-from faslr.utilities.gui import open_item_tab
+"""
+Helpers shared by the rest of FASLR. The names below are imported from their modules on first use, so that importing
+one utility module, e.g., while the main window starts, does not also import chainladder and pandas for all the
+others.
+"""
+import importlib
 
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 
-from faslr.utilities.chainladder import (
-    fetch_cdf,
-    fetch_latest_diagonal,
-    fetch_origin,
-    fetch_ultimate,
-    table_from_tri
-)
-
-from faslr.utilities.collections import (
-    subset_dict
-)
-
-from faslr.utilities.dataframe import (
-    df_set_false
-)
-
-from faslr.utilities.sample import (
-    auto_bi_olep,
-    load_sample,
-    tort_index,
-    ppa_loss_trend,
-    ppa_premium_trend
-)
+# The module of each name exported by faslr.utilities.
+UTILITY_MODULES = {
+    'benktander_ultimates': 'faslr.utilities.benktander',
+    'fetch_cdf': 'faslr.utilities.chainladder',
+    'fetch_latest_diagonal': 'faslr.utilities.chainladder',
+    'fetch_origin': 'faslr.utilities.chainladder',
+    'fetch_ultimate': 'faslr.utilities.chainladder',
+    'table_from_tri': 'faslr.utilities.chainladder',
+    'subset_dict': 'faslr.utilities.collections',
+    'aggregate_triangle_data': 'faslr.utilities.dataframe',
+    'changed_blocks': 'faslr.utilities.dataframe',
+    'df_set_false': 'faslr.utilities.dataframe',
+    'configure_fit_cache': 'faslr.utilities.fit_cache',
+    'fit_cache': 'faslr.utilities.fit_cache',
+    'fit_cache_directory': 'faslr.utilities.fit_cache',
+    'FitCache': 'faslr.utilities.fit_cache',
+    'open_item_tab': 'faslr.utilities.gui',
+    'bulk_insert': 'faslr.utilities.ingest',
+    'LDFEngine': 'faslr.utilities.ldf',
+    'RatioAverageEngine': 'faslr.utilities.ratio',
+    'ReserveEngine': 'faslr.utilities.reserving',
+    'auto_bi_olep': 'faslr.utilities.sample',
+    'load_sample': 'faslr.utilities.sample',
+    'tort_index': 'faslr.utilities.sample',
+    'ppa_loss_trend': 'faslr.utilities.sample',
+    'ppa_premium_trend': 'faslr.utilities.sample'
+}
+
+__all__ = list(UTILITY_MODULES) + ['set_sqlite_pragma']
+
+
+def __getattr__(name: str):
+
+    if name not in UTILITY_MODULES:
+        raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+
+    value = getattr(importlib.import_module(UTILITY_MODULES[name]), name)
+
+    # Later lookups find the name without calling __getattr__.
+    globals()[name] = value
+
+    return value
 
 
 @event.listens_for(Engine, "connect")
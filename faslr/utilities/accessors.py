@@ -17,18 +17,25 @@ from chainladder import Triangle
 def get_column(
         triangle: Triangle,
         column: str,
-        lob: [str, None]
+        lob: [str, None],
+        view: [int, None] = None
 ) -> Triangle:
     """
-    Extracts a single column from a Triangle class. Assumes the triangle has one company divided by LOBs.
+    Extracts a single column from a Triangle class. Assumes the triangle has one company divided by LOBs, or, for
+    triangles made by load_view_triangle, one segment per project view.
 
     :param triangle: A ChainLadder Triangle object.
     :param column: A triangle column (e.g., Paid Loss)
     :param lob: A line of business.
+    :param view: A project view id, for triangles indexed by view.
     :return: A ChainLadder Triangle, with a single column.
     """
-    if lob is None:
-        triangle_column = triangle[column]
-    else:
-        triangle_column = triangle[triangle['LOB'] == lob][column]
+    if lob is not None:
+        triangle = triangle[triangle['LOB'] == lob]
+
+    if view is not None:
+        triangle = triangle[triangle['View'] == view]
+
+    triangle_column = triangle[column]
+
     return triangle_column
@@ -0,0 +1,68 @@
+"""
+Calculates Benktander ultimates for any number of iterations in closed form.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy.typing import ArrayLike
+
+
+def benktander_ultimates(
+        losses: ArrayLike,
+        unreported: ArrayLike,
+        apriori: ArrayLike,
+        iterations: int | ArrayLike
+) -> np.ndarray:
+    """
+    Calculates the ultimates of the Benktander method after a number of iterations, each of which develops the
+    losses with the previous ultimate as the a priori: u_k = losses + unreported * u_(k - 1), with u_0 = apriori.
+
+    Unrolling the recursion gives u_k = losses * (1 + q + ... + q ** (k - 1)) + q ** k * apriori, where q is the
+    percent unreported, so the credibility given to the a priori decays geometrically with q, and the ultimate
+    approaches the chainladder ultimate, losses / (1 - q), as k grows. This is evaluated directly, so the cost does
+    not depend on the number of iterations.
+
+    Parameters
+    ----------
+    losses: ArrayLike
+        The latest losses of each origin period.
+    unreported: ArrayLike
+        The percent unreported, or unpaid, of each origin period, i.e., 1 - 1 / CDF.
+    apriori: ArrayLike
+        The ultimates the iterations start from, e.g., the Bornhuetter-Ferguson ultimates.
+    iterations: int | ArrayLike
+        The number of iterations. Passing an array of iteration counts, such as np.arange(n + 1), gives the ultimates
+        after each of them in one broadcast, i.e., the path of convergence.
+
+    Returns
+    -------
+    An array of ultimates by origin period, with a leading axis of iterations if iterations is an array.
+    """
+
+    losses = np.asarray(losses, dtype=float)
+    unreported = np.asarray(unreported, dtype=float)
+    apriori = np.asarray(apriori, dtype=float)
+
+    k = np.asarray(iterations)
+
+    if np.any(k < 0):
+        raise ValueError("The number of iterations must not be negative.")
+
+    if k.ndim:
+        k = k.reshape(-1, 1)
+
+    weight = unreported ** k
+
+    # The sum of the first k powers of q, which is k when q is 1.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        geometric_sum = np.where(
+            unreported == 1,
+            k,
+            (1 - weight) / (1 - unreported)
+        )
+
+    return losses * geometric_sum + weight * apriori
@@ -0,0 +1,194 @@
+"""
+Reads uploaded CSV files in two stages: a small sample used to set up the import, followed by a chunked read of
+only the columns that the import needs.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import pandas as pd
+
+from faslr.constants import (
+    CSV_CHUNK_SIZE,
+    CSV_SAMPLE_ROWS
+)
+
+from typing import (
+    Callable,
+    Optional,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pandas import DataFrame
+
+
+class ReadCancelled(Exception):
+    """
+    Raised by read_csv_chunked when it is asked to stop before the file has been read.
+    """
+
+
+def has_pyarrow() -> bool:
+    """
+    Whether the optional pyarrow package is installed, in which case it can be used as the CSV parsing engine.
+    """
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def sample_csv(
+        file_path: str,
+        n_rows: int = CSV_SAMPLE_ROWS
+) -> DataFrame:
+    """
+    Reads the first n_rows rows of a CSV file. If the result has fewer than n_rows rows, it holds the entire file.
+    """
+    return pd.read_csv(
+        file_path,
+        nrows=n_rows
+    )
+
+
+def infer_dtypes(sample: DataFrame) -> dict:
+    """
+    Infers the type of each column from a sample of the file, so that chunks of the remainder are parsed
+    consistently and without a second round of type inference.
+
+    Integer columns are only kept as integers if the sample has no missing values. Text columns are left for the
+    parser to decide.
+    """
+    dtypes = {}
+
+    for column, dtype in sample.dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            dtypes[column] = 'bool'
+        elif pd.api.types.is_integer_dtype(dtype):
+            dtypes[column] = 'int64'
+        elif pd.api.types.is_float_dtype(dtype):
+            dtypes[column] = 'float64'
+
+    return dtypes
+
+
+def read_csv_chunked(
+        file_path: str,
+        usecols: Optional[list] = None,
+        dtype: Optional[dict] = None,
+        chunk_size: int = CSV_CHUNK_SIZE,
+        engine: Optional[str] = None,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
+) -> DataFrame:
+    """
+    Reads a CSV file chunk by chunk, reporting progress and checking for cancellation between chunks.
+
+    Parameters
+    ----------
+    file_path: str
+        The file to read.
+    usecols: Optional[list]
+        The columns to read. Other columns are skipped by the parser. The returned columns keep the file's order.
+    dtype: Optional[dict]
+        Column types, usually from infer_dtypes. Types of columns not in usecols are ignored. If a chunk does not
+        conform to the types, e.g., because an integer column has missing values further down the file, the file is
+        read again with the types inferred by the parser.
+    chunk_size: int
+        The number of rows parsed at a time.
+    engine: Optional[str]
+        The pandas parsing engine. 'pyarrow' parses the whole file at once using multiple threads, so it reports
+        progress only when it finishes and cannot be cancelled part way. Falls back to the default engine if pyarrow
+        is not installed.
+    progress_callback: Optional[Callable[[int], None]]
+        Called with the percentage of the file read so far.
+    is_cancelled: Optional[Callable[[], bool]]
+        Polled between chunks. If it returns True, the read stops and ReadCancelled is raised.
+
+    Returns
+    -------
+    The file's contents.
+    """
+    if dtype is not None and usecols is not None:
+        dtype = {column: column_type for column, column_type in dtype.items() if column in usecols}
+
+    if engine == 'pyarrow' and has_pyarrow():
+
+        data = pd.read_csv(
+            file_path,
+            usecols=usecols,
+            dtype=dtype,
+            engine='pyarrow'
+        )
+
+        if progress_callback:
+            progress_callback(100)
+
+        return data
+
+    try:
+        return _read_chunks(
+            file_path=file_path,
+            usecols=usecols,
+            dtype=dtype,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            is_cancelled=is_cancelled
+        )
+    except (TypeError, ValueError):
+        if not dtype:
+            raise
+
+        return _read_chunks(
+            file_path=file_path,
+            usecols=usecols,
+            dtype=None,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            is_cancelled=is_cancelled
+        )
+
+
+def _read_chunks(
+        file_path: str,
+        usecols: Optional[list],
+        dtype: Optional[dict],
+        chunk_size: int,
+        progress_callback: Optional[Callable[[int], None]],
+        is_cancelled: Optional[Callable[[], bool]]
+) -> DataFrame:
+
+    file_size = max(os.path.getsize(file_path), 1)
+
+    chunks = []
+
+    with open(file_path, 'rb') as file:
+
+        reader = pd.read_csv(
+            file,
+            usecols=usecols,
+            dtype=dtype,
+            chunksize=chunk_size
+        )
+
+        with reader:
+            for chunk in reader:
+
+                if is_cancelled and is_cancelled():
+                    raise ReadCancelled()
+
+                chunks.append(chunk)
+
+                # The file position runs slightly ahead of the parser because of buffering, which is close enough.
+                if progress_callback:
+                    progress_callback(min(100, int(100 * file.tell() / file_size)))
+
+    if not chunks:
+        return pd.read_csv(
+            file_path,
+            usecols=usecols,
+            dtype=dtype
+        )
+
+    return pd.concat(
+        chunks,
+        ignore_index=True
+    )
@@ -3,11 +3,15 @@ Contains commonly-used DataFrame-related routines.
 """
 from __future__ import annotations
 
+import numpy as np
+import pandas as pd
+
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pandas import DataFrame
 
+
 def df_set_false(df: DataFrame) -> DataFrame:
     """
     Sets an entire DataFrame to False. Used in situations where we want a triangle of booleans where
@@ -18,4 +22,92 @@ def df_set_false(df: DataFrame) -> DataFrame:
     df = df.astype(bool)
     df.loc[:] = False
 
-    return df
\ No newline at end of file
+    return df
+
+
+def aggregate_triangle_data(
+        data: DataFrame,
+        origin: str,
+        development: str,
+        columns: list
+) -> DataFrame:
+    """
+    Sums the value columns over each origin/development pair, so that transaction-level data are reduced to one row
+    per triangle cell before being handed to a chainladder Triangle, which would otherwise do the grouping itself
+    every time the triangle is built.
+
+    The keys are grouped as categoricals, which is faster than grouping the raw values when there are many rows. A
+    cell whose values are all missing stays missing rather than becoming zero.
+
+    :param data: The uploaded data.
+    :param origin: The origin column.
+    :param development: The development column.
+    :param columns: The value columns.
+    :return: A DataFrame with the origin, development, and value columns, with one row per cell.
+    """
+
+    keys = [origin, development]
+
+    grouped = data[columns].groupby(
+        [data[key].astype('category') for key in keys],
+        observed=True,
+        sort=False
+    ).sum(min_count=1)
+
+    aggregated = grouped.reset_index()
+
+    # Restore the key types, since Triangle parses dates from them.
+    for key in keys:
+        aggregated[key] = aggregated[key].astype(data[key].dtype)
+
+    return aggregated
+
+
+def changed_blocks(
+        previous: DataFrame,
+        current: DataFrame
+) -> list[tuple[int, int, int, int]]:
+    """
+    Returns the blocks of cells whose values differ between two DataFrames of the same shape, as (top, bottom, left,
+    right) positions. There is one block per run of adjacent changed columns, spanning the rows changed in any of
+    them. Missing values are treated as equal to each other.
+    """
+
+    if previous.shape != current.shape:
+        raise ValueError("Changed blocks can only be found between DataFrames of the same shape.")
+
+    numeric = all(
+        pd.api.types.is_numeric_dtype(dtype) for dtype in list(previous.dtypes) + list(current.dtypes)
+    )
+
+    if numeric:
+        before = previous.to_numpy(dtype=float)
+        after = current.to_numpy(dtype=float)
+
+        changed = ~((before == after) | (np.isnan(before) & np.isnan(after)))
+    else:
+        changed = np.zeros(previous.shape, dtype=bool)
+
+        for i in range(previous.shape[1]):
+            before = previous.iloc[:, i].reset_index(drop=True)
+            after = current.iloc[:, i].reset_index(drop=True)
+
+            equal = before.eq(after).to_numpy(dtype=bool, na_value=False) | (before.isna() & after.isna()).to_numpy()
+
+            changed[:, i] = ~equal
+
+    columns = np.flatnonzero(changed.any(axis=0))
+
+    blocks = []
+
+    # Split the changed columns into runs of adjacent columns.
+    for run in np.split(columns, np.flatnonzero(np.diff(columns) > 1) + 1):
+
+        if not len(run):
+            continue
+
+        rows = np.flatnonzero(changed[:, run[0]:run[-1] + 1].any(axis=1))
+
+        blocks.append((int(rows[0]), int(rows[-1]), int(run[0]), int(run[-1])))
+
+    return blocks
@@ -0,0 +1,328 @@
+"""
+Caches fitted chainladder estimators so that fitting the same estimator to the same triangle again, e.g., when a tail
+pane is reopened or a batch is rerun, loads the earlier fit instead of repeating it.
+"""
+from __future__ import annotations
+
+import hashlib
+import numpy as np
+import os
+import pickle
+import tempfile
+import threading
+
+from collections import OrderedDict
+
+from faslr.constants import (
+    FIT_CACHE_DIRECTORY_SUFFIX,
+    FIT_CACHE_MAX_BYTES
+)
+
+from typing import (
+    Optional,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chainladder import Triangle
+
+# Triangles that have been through an estimator carry its fitted patterns, which later estimators depend on.
+TRIANGLE_PATTERNS = [
+    'ldf_',
+    'sigma_',
+    'std_err_'
+]
+
+
+def fit_cache_directory(db_path: str) -> str:
+    """
+    Returns the directory that fits are saved to for a database, which sits next to the database file.
+    """
+    return os.path.abspath(db_path) + FIT_CACHE_DIRECTORY_SUFFIX
+
+
+def hash_triangle(
+        triangle: Triangle,
+        digest: hashlib.sha256
+) -> None:
+    """
+    Feeds the values and labels of a triangle, and of any patterns it carries, into a digest.
+    """
+
+    values = triangle.values if triangle.array_backend == 'numpy' else triangle.set_backend('numpy').values
+    values = np.ascontiguousarray(values, dtype=float)
+
+    digest.update(str(values.shape).encode())
+    digest.update(values.tobytes())
+
+    labels = [
+        triangle.key_labels,
+        triangle.index.to_numpy().tolist(),
+        list(triangle.vdims),
+        triangle.odims.tolist(),
+        triangle.ddims.tolist(),
+        triangle.valuation_date,
+        triangle.origin_grain,
+        triangle.development_grain,
+        triangle.is_cumulative,
+        triangle.is_pattern
+    ]
+
+    digest.update(repr(labels).encode())
+
+    for pattern in TRIANGLE_PATTERNS:
+        if hasattr(triangle, pattern):
+            digest.update(pattern.encode())
+            hash_triangle(
+                triangle=getattr(triangle, pattern),
+                digest=digest
+            )
+
+
+class FitCache:
+    """
+    Content-addressed cache of fitted chainladder estimators. A fit is keyed by a hash of the triangle's values and
+    labels together with the estimator's class and parameters, e.g., its drop list, n_periods, and average, so that
+    a changed selection or a changed triangle is a new key rather than a stale hit.
+
+    Fits are kept pickled, in least recently used order, up to a budget of bytes. Each hit unpickles a new copy, so
+    callers are free to modify what they get back. If a directory is set, fits are also saved there and survive a
+    restart of the application.
+
+    Parameters
+    ----------
+    max_bytes: int
+        The most bytes of pickled fits kept in memory.
+    directory: Optional[str]
+        The directory fits are saved to and loaded from. Fits are only kept in memory if None.
+    """
+    def __init__(
+            self,
+            max_bytes: int = FIT_CACHE_MAX_BYTES,
+            directory: Optional[str] = None
+    ):
+
+        self.max_bytes = max_bytes
+        self.directory = directory
+
+        self._fits: OrderedDict[str, bytes] = OrderedDict()
+        self._n_bytes = 0
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+
+    @property
+    def n_bytes(self) -> int:
+        return self._n_bytes
+
+    @property
+    def n_entries(self) -> int:
+        return len(self._fits)
+
+    @staticmethod
+    def key(
+            estimator,
+            triangle: Triangle
+    ) -> str:
+        """
+        Returns the hex digest identifying the fit of an estimator to a triangle.
+        """
+
+        digest = hashlib.sha256()
+
+        estimator_class = type(estimator)
+
+        digest.update((estimator_class.__module__ + '.' + estimator_class.__qualname__).encode())
+        digest.update(repr(sorted(estimator.get_params().items())).encode())
+
+        hash_triangle(
+            triangle=triangle,
+            digest=digest
+        )
+
+        return digest.hexdigest()
+
+    def fit(
+            self,
+            estimator,
+            triangle: Triangle
+    ):
+        """
+        Fits an estimator to a triangle, or loads the fit if it has been done before. Use in place of
+        estimator.fit(triangle), e.g., fit_cache.fit(cl.TailCurve(curve='exponential'), triangle).
+
+        Returns
+        -------
+        The fitted estimator. On a hit, this is a copy of the cached fit rather than the estimator passed in.
+        """
+
+        key = self.key(
+            estimator=estimator,
+            triangle=triangle
+        )
+
+        data = self.get(key=key)
+
+        if data is not None:
+            return pickle.loads(data)
+
+        fitted = estimator.fit(triangle)
+
+        self.put(
+            key=key,
+            data=pickle.dumps(fitted, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+        return fitted
+
+    def get(
+            self,
+            key: str
+    ) -> Optional[bytes]:
+        """
+        Returns the pickled fit stored under a key, looking in memory first and then on disk, or None on a miss.
+        """
+
+        with self._lock:
+            data = self._fits.get(key)
+
+            if data is not None:
+                self._fits.move_to_end(key)
+                self.stats['hits'] += 1
+                return data
+
+        path = self.path(key=key)
+
+        if path is not None and os.path.isfile(path):
+            with open(path, 'rb') as file:
+                data = file.read()
+
+            self.remember(
+                key=key,
+                data=data
+            )
+
+            with self._lock:
+                self.stats['hits'] += 1
+                self.stats['disk_hits'] += 1
+
+            return data
+
+        with self._lock:
+            self.stats['misses'] += 1
+
+        return None
+
+    def put(
+            self,
+            key: str,
+            data: bytes
+    ) -> None:
+        """
+        Stores a pickled fit in memory and, if a directory is set, on disk.
+        """
+
+        self.remember(
+            key=key,
+            data=data
+        )
+
+        path = self.path(key=key)
+
+        if path is None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Written to a temporary file first so that other processes never read a partial fit.
+        handle, temporary_path = tempfile.mkstemp(dir=self.directory)
+
+        with os.fdopen(handle, 'wb') as file:
+            file.write(data)
+
+        os.replace(temporary_path, path)
+
+    def remember(
+            self,
+            key: str,
+            data: bytes
+    ) -> None:
+        """
+        Stores a pickled fit in memory, evicting the least recently used fits beyond the byte budget. Fits larger than
+        the whole budget are not kept.
+        """
+
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._fits.pop(key, None)
+
+            if previous is not None:
+                self._n_bytes -= len(previous)
+
+            self._fits[key] = data
+            self._n_bytes += len(data)
+
+            while self._n_bytes > self.max_bytes:
+                _, evicted = self._fits.popitem(last=False)
+                self._n_bytes -= len(evicted)
+                self.stats['evictions'] += 1
+
+    def path(
+            self,
+            key: str
+    ) -> Optional[str]:
+
+        if self.directory is None:
+            return None
+
+        return os.path.join(self.directory, key + '.pkl')
+
+    def clear(
+            self,
+            disk: bool = False
+    ) -> None:
+        """
+        Removes every fit from memory and, if disk is True, the saved fits from the directory as well.
+        """
+
+        with self._lock:
+            self._fits.clear()
+            self._n_bytes = 0
+
+        if disk and self.directory is not None and os.path.isdir(self.directory):
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith('.pkl'):
+                    os.remove(os.path.join(self.directory, file_name))
+
+    def reset_stats(self) -> None:
+
+        self.stats['hits'] = 0
+        self.stats['disk_hits'] = 0
+        self.stats['misses'] = 0
+        self.stats['evictions'] = 0
+
+
+# Shared by the whole application.
+fit_cache = FitCache()
+
+
+def configure_fit_cache(
+        db_path: Optional[str],
+        persist: bool
+) -> None:
+    """
+    Points the application's fit cache at the directory next to the connected database, or keeps fits in memory only
+    if persist is False or no database is connected.
+    """
+
+    if persist and db_path:
+        fit_cache.directory = fit_cache_directory(db_path=db_path)
+    else:
+        fit_cache.directory = None
@@ -0,0 +1,93 @@
+"""
+Calculates the background colors of link ratio heatmaps, matching those of chainladder's Triangle.heatmap without
+rendering the triangle to HTML.
+"""
+from __future__ import annotations
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from matplotlib.colors import Colormap
+
+
+def heatmap_rgb(
+        values: np.ndarray,
+        cmap: str | Colormap = "coolwarm",
+        exclude: np.ndarray = None
+) -> np.ndarray:
+    """
+    Colors each value by its rank within its column, as in Triangle.heatmap. The ranks of each column are scaled
+    to run from 1 to the number of rows, and the scaled ranks of the whole array are then mapped through the
+    colormap in one call. Missing values, and columns with a single value, take the color of the middle rank.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        A 2-dimensional array, such as the values of a link ratio triangle.
+    cmap: str | Colormap
+        The matplotlib colormap, or the name of one.
+    exclude: np.ndarray
+        A boolean array, shaped like values, that is True for values to leave out of the ranking. These are colored
+        as missing values.
+
+    Returns
+    -------
+    An array of colors as 0xRRGGBB integers, shaped like values.
+    """
+
+    values = np.array(values, dtype=float)
+
+    if exclude is not None:
+        values[exclude] = np.nan
+
+    n_rows = values.shape[0]
+
+    # Average ranks of ties, with missing values left unranked.
+    ranks = pd.DataFrame(values).rank(axis=0)
+    max_ranks = ranks.max(axis=0).to_numpy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gradient = (ranks.to_numpy() - 1) / (max_ranks - 1) * (n_rows - 1) + 1
+
+    gradient[np.isnan(gradient)] = (n_rows + 1) / 2
+
+    if isinstance(cmap, str):
+        cmap = matplotlib.colormaps[cmap]
+
+    low = gradient.min()
+    high = gradient.max()
+
+    if high > low:
+        scaled = (gradient - low) / (high - low)
+    else:
+        scaled = np.zeros(gradient.shape)
+
+    rgb = np.round(cmap(scaled)[..., :3] * 255).astype(int)
+
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+def heatmap_colors(
+        values: np.ndarray,
+        cmap: str | Colormap = "coolwarm",
+        exclude: np.ndarray = None
+) -> np.ndarray:
+    """
+    Returns the colors of heatmap_rgb as hex strings, e.g., '#b40426'.
+    """
+
+    rgb = heatmap_rgb(
+        values=values,
+        cmap=cmap,
+        exclude=exclude
+    )
+
+    # Only the distinct colors, of which a colormap has at most 256, need to be formatted.
+    codes, positions = np.unique(rgb, return_inverse=True)
+    names = np.array(['#{:06x}'.format(code) for code in codes], dtype=object)
+
+    return names[positions].reshape(rgb.shape)
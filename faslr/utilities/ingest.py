@@ -0,0 +1,76 @@
+"""
+Bulk loading of DataFrames into the database.
+"""
+from __future__ import annotations
+
+from faslr.constants import INGEST_CHUNK_SIZE
+
+from typing import (
+    Callable,
+    Optional,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pandas import DataFrame
+    from sqlalchemy import Table
+    from sqlalchemy.engine.base import Connection
+
+
+def bulk_insert(
+        connection: Connection,
+        table: Table,
+        data: DataFrame,
+        chunk_size: int = INGEST_CHUNK_SIZE,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """
+    Inserts the rows of a DataFrame into a table with one executemany call per chunk of rows, bypassing the ORM.
+    The rows are written within the connection's current transaction, so a failed load can be rolled back as a whole.
+    Since the ORM is bypassed, its events are not fired, e.g., those that empty the index cache.
+
+    Parameters
+    ----------
+    connection: Connection
+        The connection to write to. To write within a session's unit of work, pass session.connection().
+    table: Table
+        The table to insert into, e.g., ProjectViewData.__table__. The DataFrame's column names must match the
+        table's column names.
+    data: DataFrame
+        The rows to insert.
+    chunk_size: int
+        The number of rows sent to the database per executemany call.
+    progress_callback: Optional[Callable[[int, int], None]]
+        Called after each chunk with the number of rows written so far and the total number of rows.
+
+    Returns
+    -------
+    The number of rows inserted.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    columns = list(data.columns)
+
+    statement = "INSERT INTO " + table.name + " (" + ", ".join(columns) + ") VALUES (" + \
+        ", ".join(["?"] * len(columns)) + ")"
+
+    n_rows = len(data)
+    rows_written = 0
+
+    for start in range(0, n_rows, chunk_size):
+
+        chunk = data.iloc[start:start + chunk_size]
+
+        # itertuples yields native Python scalars, which the sqlite3 driver can bind directly.
+        connection.exec_driver_sql(
+            statement,
+            list(chunk.itertuples(index=False, name=None))
+        )
+
+        rows_written += len(chunk)
+
+        if progress_callback:
+            progress_callback(rows_written, n_rows)
+
+    return rows_written
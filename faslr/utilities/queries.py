@@ -1,9 +1,26 @@
+import pandas as pd
+
+from chainladder import Triangle
+
 from faslr.schema import (
-    LocationTable
+    LocationTable,
+    LOBTable,
+    ProjectViewData,
+    ProjectViewTable,
+    StateTable
 )
 
 from sqlalchemy.orm import Session
 
+from typing import Optional
+
+# The index levels of triangles made by load_view_triangle.
+VIEW_TRIANGLE_INDEX = [
+    'View',
+    'State',
+    'LOB'
+]
+
 
 def delete_country(
         country_id: int,
@@ -13,3 +30,71 @@ def delete_country(
     country = session.query(LocationTable).filter(LocationTable.location_id == country_id).one()
     session.delete(country)
     session.commit()
+
+
+def load_view_triangle(
+        session: Session,
+        view_ids: Optional[list] = None
+) -> Triangle:
+    """
+    Loads the data of several project views, or of every view if view_ids is None, with a single query and builds
+    one Triangle from it, with the columns 'Paid Loss' and 'Reported Loss'. The triangle is indexed by the view id
+    and the state and LOB of the view's project, so one chainladder fit covers every view, and get_column can slice
+    a single view or LOB out of it. Views of projects that are not LOBs have a blank state and LOB.
+
+    Parameters
+    ----------
+    session: Session
+        An open session against the project database.
+    view_ids: Optional[list]
+        The ids of the views to load.
+
+    Returns
+    -------
+    A Triangle with the index levels 'View', 'State', and 'LOB'.
+    """
+
+    # LOBs share the location of the state they belong to.
+    query = session.query(
+        ProjectViewData.view_id,
+        StateTable.state_name,
+        LOBTable.lob_type,
+        ProjectViewData.accident_year,
+        ProjectViewData.calendar_year,
+        ProjectViewData.paid_loss,
+        ProjectViewData.reported_loss
+    ).join(
+        ProjectViewTable,
+        ProjectViewTable.view_id == ProjectViewData.view_id
+    ).outerjoin(
+        LOBTable,
+        LOBTable.project_id == ProjectViewTable.project_id
+    ).outerjoin(
+        StateTable,
+        StateTable.location_id == LOBTable.location_id
+    )
+
+    if view_ids is not None:
+        query = query.filter(ProjectViewData.view_id.in_(view_ids))
+
+    df = pd.read_sql(query.statement, con=session.connection())
+
+    df.columns = VIEW_TRIANGLE_INDEX + [
+        'Accident Year',
+        'Calendar Year',
+        'Paid Loss',
+        'Reported Loss'
+    ]
+
+    df[['State', 'LOB']] = df[['State', 'LOB']].fillna('')
+
+    triangle = Triangle(
+        data=df,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=['Paid Loss', 'Reported Loss'],
+        index=VIEW_TRIANGLE_INDEX,
+        cumulative=True
+    )
+
+    return triangle
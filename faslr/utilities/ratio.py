@@ -0,0 +1,138 @@
+"""
+Calculates several averages of a ratio matrix at once, such as the loss ratio averages of an FSelectionModel.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy.typing import ArrayLike
+
+
+class RatioAverageEngine:
+    """
+    Calculates averages of the latest rows of a ratio matrix, one per column. Missing ratios are left out of every
+    average, and an average with no ratios to average is missing.
+
+    The averages are:
+
+    Straight: the mean of the ratios.
+    Medial: the mean of the ratios excluding the highest and the lowest, which needs at least three ratios.
+    Volume: the mean of the ratios weighted by their volumes, i.e., sum(w * r) / sum(w). Without volumes, this is the
+    straight average.
+
+    Parameters
+    ----------
+    ratios: ArrayLike
+        The two-dimensional ratio matrix, with the latest row last.
+    weights: Optional[ArrayLike]
+        The volumes of the ratios, shaped like ratios, used for volume-weighted averages.
+    """
+    def __init__(
+            self,
+            ratios: ArrayLike,
+            weights: ArrayLike = None
+    ):
+
+        self.ratios = np.asarray(ratios, dtype=float)
+
+        if weights is None:
+            self.weights = np.ones(self.ratios.shape)
+        else:
+            self.weights = np.asarray(weights, dtype=float).reshape(self.ratios.shape)
+
+        # Ratios that cannot be used in the averages get a weight of 0.
+        self.valid = ~np.isnan(self.ratios) & ~np.isnan(self.weights)
+
+        self.n_rows, self.n_columns = self.ratios.shape
+
+    def averages(
+            self,
+            averages: list,
+            out: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Calculates several averages in one pass over each averaging window.
+
+        Parameters
+        ----------
+        averages: list
+            (average, n_years) pairs, where average is one of 'Straight', 'Medial', or 'Volume', and n_years is the
+            number of latest rows to average. Other types of averages, or fewer than one year, give missing averages.
+        out: Optional[np.ndarray]
+            An array to write the averages into, e.g., a block of a larger array, instead of allocating a new one.
+
+        Returns
+        -------
+        An array with one row of averages per entry of averages.
+        """
+
+        if out is None:
+            result = np.empty((len(averages), self.n_columns))
+        else:
+            result = out
+
+        result[:] = np.nan
+
+        # Averages over the same window share its sums and extremes.
+        windows = {}
+
+        for i, (average, n_years) in enumerate(averages):
+
+            if (n_years < 1) or (self.n_rows == 0) or (average not in ['Straight', 'Medial', 'Volume']):
+                continue
+
+            if n_years not in windows:
+                windows[n_years] = self.window(n_years=n_years)
+
+            window = windows[n_years]
+
+            if average == 'Straight':
+                numerator, denominator = window['sum'], window['count']
+            elif average == 'Volume':
+                numerator, denominator = window['weighted_sum'], window['weight']
+            else:
+                numerator = window['medial_sum']
+                denominator = np.where(window['count'] >= 3, window['count'] - 2, 0)
+
+            result[i] = np.divide(
+                numerator,
+                denominator,
+                out=np.full(self.n_columns, np.nan),
+                where=denominator != 0
+            )
+
+        return result
+
+    def window(
+            self,
+            n_years: int
+    ) -> dict:
+        """
+        Returns the counts, sums, and sums excluding the highest and lowest ratio of each column over the latest
+        n_years rows.
+        """
+
+        valid = self.valid[-n_years:]
+        ratios = np.where(valid, self.ratios[-n_years:], 0.0)
+        weights = np.where(valid, self.weights[-n_years:], 0.0)
+
+        count = valid.sum(axis=0)
+        ratio_sum = ratios.sum(axis=0)
+
+        # Only the extremes of each column are needed to exclude the high and low ratios, not a full sort.
+        low = np.where(valid, self.ratios[-n_years:], np.inf).min(axis=0)
+        high = np.where(valid, self.ratios[-n_years:], -np.inf).max(axis=0)
+
+        low[count == 0] = 0.0
+        high[count == 0] = 0.0
+
+        return {
+            'count': count,
+            'sum': ratio_sum,
+            'medial_sum': ratio_sum - low - high,
+            'weighted_sum': (ratios * weights).sum(axis=0),
+            'weight': weights.sum(axis=0)
+        }
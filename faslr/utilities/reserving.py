@@ -0,0 +1,177 @@
+"""
+Calculates the reserve estimates of the expected loss, Bornhuetter-Ferguson, and Benktander methods from arrays,
+independently of the table models that display them.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from faslr.utilities.benktander import benktander_ultimates
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy.typing import ArrayLike
+    from pandas import DataFrame
+
+
+class ReserveEngine:
+    """
+    Calculates the reserve estimates of the expected loss, Bornhuetter-Ferguson, and Benktander methods, on both a
+    reported and a paid basis, in one pass over NumPy arrays. No Qt objects are involved, so the engine can be used by
+    the method widgets as well as by batch scripts.
+
+    The inputs can have any shape as long as they broadcast against each other. For example, passing arrays with one
+    row of origin periods per segment evaluates every segment of a portfolio at once.
+
+    Parameters
+    ----------
+    premium: ArrayLike
+        The on-level earned premium of each origin period.
+    loss_ratio: ArrayLike
+        The selected expected loss ratio of each origin period.
+    reported_losses: ArrayLike
+        The latest reported losses of each origin period.
+    paid_losses: ArrayLike
+        The latest paid losses of each origin period.
+    reported_cdf: Optional[ArrayLike]
+        The reported cumulative development factors to ultimate. CDFs below 1 are treated as 1. Defaults to 1, i.e.,
+        fully developed.
+    paid_cdf: Optional[ArrayLike]
+        The paid cumulative development factors to ultimate, treated like reported_cdf.
+    """
+    def __init__(
+            self,
+            premium: ArrayLike,
+            loss_ratio: ArrayLike,
+            reported_losses: ArrayLike,
+            paid_losses: ArrayLike,
+            reported_cdf: ArrayLike = None,
+            paid_cdf: ArrayLike = None
+    ):
+
+        if reported_cdf is None:
+            reported_cdf = 1.0
+
+        if paid_cdf is None:
+            paid_cdf = 1.0
+
+        (
+            self.premium,
+            self.loss_ratio,
+            self.reported_losses,
+            self.paid_losses,
+            reported_cdf,
+            paid_cdf
+        ) = np.broadcast_arrays(
+            *[
+                np.asarray(values, dtype=float) for values in [
+                    premium,
+                    loss_ratio,
+                    reported_losses,
+                    paid_losses,
+                    reported_cdf,
+                    paid_cdf
+                ]
+            ]
+        )
+
+        self.reported_cdf = np.maximum(1, reported_cdf)
+        self.paid_cdf = np.maximum(1, paid_cdf)
+
+    @classmethod
+    def from_frame(
+            cls,
+            data: DataFrame
+    ) -> ReserveEngine:
+        """
+        Creates an engine from the columns of a DataFrame, named as in the method widgets, i.e., 'On-Level Earned
+        Premium', 'Selected Loss Ratio', 'Reported Losses', 'Paid Losses', and, optionally, 'Reported CDF' and
+        'Paid CDF'.
+        """
+
+        return cls(
+            premium=data['On-Level Earned Premium'],
+            loss_ratio=data['Selected Loss Ratio'],
+            reported_losses=data['Reported Losses'],
+            paid_losses=data['Paid Losses'],
+            reported_cdf=data.get('Reported CDF'),
+            paid_cdf=data.get('Paid CDF')
+        )
+
+    def estimates(
+            self,
+            iterations: int | ArrayLike = 1
+    ) -> dict:
+        """
+        Calculates the estimates of all three methods.
+
+        Parameters
+        ----------
+        iterations: int | ArrayLike
+            The number of Benktander iterations applied to the Bornhuetter-Ferguson ultimates, where 0 gives the
+            Bornhuetter-Ferguson ultimates themselves. An array of iteration counts gives the Benktander estimates for
+            each of them, along a leading axis.
+
+        Returns
+        -------
+        A dictionary of arrays keyed by the column names used in the method widgets. The expected loss method's
+        estimates are under 'Ultimate Loss', 'IBNR', and 'Unpaid Claims', the Bornhuetter-Ferguson method's are
+        prefixed with BF, and the Benktander method's with GB.
+        """
+
+        expected_claims = self.loss_ratio * self.premium
+
+        unreported = 1 - 1 / self.reported_cdf
+        unpaid = 1 - 1 / self.paid_cdf
+
+        expected_unreported = unreported * expected_claims
+        expected_unpaid = unpaid * expected_claims
+
+        ultimate_bf_reported = expected_unreported + self.reported_losses
+        ultimate_bf_paid = expected_unpaid + self.paid_losses
+
+        # The Bornhuetter-Ferguson method is the first iteration of the Benktander method from the expected claims.
+        benktander_iterations = np.asarray(iterations) + 1
+
+        ultimate_gb_reported = benktander_ultimates(
+            losses=self.reported_losses,
+            unreported=unreported,
+            apriori=expected_claims,
+            iterations=benktander_iterations
+        )
+
+        ultimate_gb_paid = benktander_ultimates(
+            losses=self.paid_losses,
+            unreported=unpaid,
+            apriori=expected_claims,
+            iterations=benktander_iterations
+        )
+
+        return {
+            'Selected Loss Ratio': self.loss_ratio,
+            'On-Level Earned Premium': self.premium,
+            'Expected Claims': expected_claims,
+            'Reported CDF': self.reported_cdf,
+            'Paid CDF': self.paid_cdf,
+            '% Unreported': unreported,
+            '% Unpaid': unpaid,
+            'Expected Unreported': expected_unreported,
+            'Expected Unpaid': expected_unpaid,
+            'Reported Losses': self.reported_losses,
+            'Paid Losses': self.paid_losses,
+            'Case Outstanding': self.reported_losses - self.paid_losses,
+            'Ultimate Loss': expected_claims,
+            'IBNR': expected_claims - self.reported_losses,
+            'Unpaid Claims': expected_claims - self.paid_losses,
+            'Ultimate BF Reported': ultimate_bf_reported,
+            'Ultimate BF Paid': ultimate_bf_paid,
+            'BF Reported IBNR': ultimate_bf_reported - self.reported_losses,
+            'BF Paid IBNR': ultimate_bf_paid - self.reported_losses,
+            'BF Reported Unpaid Claims': ultimate_bf_reported - self.paid_losses,
+            'BF Paid Unpaid Claims': ultimate_bf_paid - self.paid_losses,
+            'Ultimate GB Reported': ultimate_gb_reported,
+            'Ultimate GB Paid': ultimate_gb_paid,
+            'GB Reported IBNR': ultimate_gb_reported - self.reported_losses,
+            'GB Paid IBNR': ultimate_gb_paid - self.reported_losses
+        }